@@ -0,0 +1,193 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Iterable, Iterator, Tuple as TypingTuple
+
+from pyhartig.algebra.Tuple import MappingTuple, AlgebraicValue, intern_constants
+
+
+@lru_cache(maxsize=256)
+def _compile_row_builder(attributes: TypingTuple[str, ...]) -> Callable[..., List[MappingTuple]]:
+    """
+    Generate the function converting columns with the given attributes into mapping tuples.
+    Each tuple is built from a dictionary display of the attributes (the dictionary is allocated
+    once with its final size, instead of growing while the (attribute, value) pairs are inserted),
+    copied into an empty MappingTuple at C level (no Python-level MappingTuple.__init__ call per tuple).
+    :param attributes: Attribute names, in the order of the columns
+    :return: Function taking the columns as arguments and returning the list of MappingTuple
+    """
+    variables = [f"v{i}" for i in range(len(attributes))]
+    display = ", ".join(f"{attribute!r}: {variable}" for attribute, variable in zip(attributes, variables))
+    source = (
+        "def build_rows(*columns, mapping_tuple=MappingTuple, new=dict.__new__, update=dict.update, zip=zip):\n"
+        "    rows = []\n"
+        "    append = rows.append\n"
+        f"    for {', '.join(variables)}, in zip(*columns):\n"
+        "        row = new(mapping_tuple)\n"
+        f"        update(row, {{{display}}})\n"
+        "        append(row)\n"
+        "    return rows"
+    )
+    namespace = {"MappingTuple": MappingTuple}
+    exec(intern_constants(compile(source, f"<pyhartig row builder {list(attributes)!r}>", "exec")), namespace)
+    return namespace["build_rows"]
+
+
+class ColumnBatch:
+    """
+    Column-oriented (SoA) representation of a run of mapping tuples.
+
+    All tuples of a batch share the same attribute set, so the batch stores one list of values
+    per attribute instead of one dictionary per tuple. Columns are shared between batches
+    (e.g. an Extend only adds a column), they must therefore never be mutated in place.
+    """
+
+    # A batch is created per operator and per run of tuples: no per-instance __dict__
+    __slots__ = ("columns", "nrows")
+
+    def __init__(self, columns: Dict[str, List[AlgebraicValue]], nrows: int = None):
+        """
+        Initialize the ColumnBatch.
+        :param columns: Mapping from attribute name to the list of values of that attribute
+        :param nrows: Number of tuples in the batch (inferred from the columns if omitted)
+        """
+        if nrows is None:
+            nrows = len(next(iter(columns.values()))) if columns else 0
+
+        self.columns = columns
+        self.nrows = nrows
+
+    def __len__(self) -> int:
+        """
+        Number of tuples in the batch
+        :return: Number of tuples
+        """
+        return self.nrows
+
+    def __contains__(self, attribute: str) -> bool:
+        """
+        Check whether the batch defines an attribute
+        :param attribute: Attribute name
+        :return: True if the attribute has a column in the batch
+        """
+        return attribute in self.columns
+
+    def __getitem__(self, attribute: str) -> List[AlgebraicValue]:
+        """
+        Get the column of an attribute
+        :param attribute: Attribute name
+        :return: List of values of the attribute
+        """
+        return self.columns[attribute]
+
+    def __repr__(self):
+        """
+        String representation of the ColumnBatch (for debugging)
+        :return: String representation of the batch
+        """
+        return f"ColumnBatch(nrows={self.nrows}, attributes={list(self.columns.keys())})"
+
+    def with_column(self, attribute: str, values: List[AlgebraicValue]) -> 'ColumnBatch':
+        """
+        Return a new batch with an additional (or replaced) column, sharing the other columns.
+        :param attribute: Attribute name
+        :param values: Values of the attribute, one per tuple
+        :return: New ColumnBatch
+        """
+        columns = dict(self.columns)
+        columns[attribute] = values
+        return ColumnBatch(columns, self.nrows)
+
+    def iter_tuples(self) -> Iterator[MappingTuple]:
+        """
+        Iterate over the batch as row-oriented mapping tuples.
+        :return: Iterator of MappingTuple
+        """
+        keys = list(self.columns.keys())
+
+        if not keys:
+            for _ in range(self.nrows):
+                yield MappingTuple()
+            return
+
+        for values in zip(*self.columns.values()):
+            yield MappingTuple(zip(keys, values))
+
+    def to_tuples(self) -> List[MappingTuple]:
+        """
+        Convert the batch back to row-oriented mapping tuples.
+        :return: List of MappingTuple
+        """
+        if not self.columns:
+            return [MappingTuple() for _ in range(self.nrows)]
+
+        keys = tuple(self.columns)
+        if all(type(key) is str for key in keys):
+            # Generated once per attribute set: each tuple is built from a dictionary display
+            return _compile_row_builder(keys)(*self.columns.values())
+
+        # Comprehension rather than list(iter_tuples()): no generator resumed per tuple
+        mapping_tuple = MappingTuple
+        return [mapping_tuple(zip(keys, values)) for values in zip(*self.columns.values())]
+
+    @classmethod
+    def concat(cls, batches: List['ColumnBatch']) -> 'ColumnBatch':
+        """
+        Concatenate batches sharing the same attributes into a single batch.
+        :param batches: Non-empty list of ColumnBatch with identical attributes
+        :return: New ColumnBatch (the first batch itself if there is only one)
+        """
+        if len(batches) == 1:
+            return batches[0]
+
+        columns = {attribute: [] for attribute in batches[0].columns}
+        for batch in batches:
+            for attribute, column in columns.items():
+                column.extend(batch.columns[attribute])
+
+        return cls(columns, sum(batch.nrows for batch in batches))
+
+    @staticmethod
+    def to_tuple_list(batches: Iterable['ColumnBatch']) -> List[MappingTuple]:
+        """
+        Convert a sequence of batches back to one list of mapping tuples, in order.
+        The list built for the first batch is the result itself (a source produces a single batch):
+        the tuples of the next batches are appended to it, never copied into a new list.
+        :param batches: Iterable of ColumnBatch
+        :return: List of MappingTuple
+        """
+        result: List[MappingTuple] = []
+        for batch in batches:
+            if result:
+                result += batch.to_tuples()
+            else:
+                result = batch.to_tuples()
+        return result
+
+    @classmethod
+    def from_tuples(cls, tuples: Iterable[MappingTuple]) -> Iterator['ColumnBatch']:
+        """
+        Build column batches from row-oriented tuples.
+        Consecutive tuples sharing the same attributes are grouped into one batch, so that the
+        order of the tuples is preserved even for heterogeneous relations (e.g. after a Union).
+        :param tuples: Iterable of MappingTuple
+        :return: Iterator of ColumnBatch
+        """
+        keys: TypingTuple[str, ...] = None
+        columns: List[List[AlgebraicValue]] = []
+        nrows = 0
+
+        for row in tuples:
+            row_keys = tuple(row.keys())
+
+            if row_keys != keys:
+                if keys is not None:
+                    yield cls(dict(zip(keys, columns)), nrows)
+                keys = row_keys
+                columns = [[] for _ in keys]
+                nrows = 0
+
+            for column, value in zip(columns, row.values()):
+                column.append(value)
+            nrows += 1
+
+        if keys is not None:
+            yield cls(dict(zip(keys, columns)), nrows)
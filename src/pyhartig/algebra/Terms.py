@@ -1,7 +1,15 @@
+import sys
 from dataclasses import dataclass
 from typing import Union
 
-@dataclass(frozen=True)
+# Interned datatype IRI of plain string literals, so that datatype checks are identity checks
+XSD_STRING = sys.intern("http://www.w3.org/2001/XMLSchema#string")
+
+# Terms are created once per tuple: store their fields in slots rather than in a per-instance __dict__
+# (dataclass slots are available from Python 3.10)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class IRI:
     """
     Represents an Internationalized Resource Identifier (IRI).
@@ -9,6 +17,25 @@ class IRI:
     """
     value: str
 
+    def __eq__(self, other):
+        """
+        Equality check: memoized IRIs are shared, so the identity check usually decides
+        :param other: Object to compare with
+        :return: True if other is an IRI with the same value
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self):
+        """
+        Hash of the IRI (the hash of its value, cached by the string)
+        :return: Hash value
+        """
+        return hash(self.value)
+
     def __repr__(self):
         """
         String representation of the IRI
@@ -16,25 +43,46 @@ class IRI:
         """
         return f"<{self.value}>"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Literal:
     """
     Represents an RDF Literal
     Examples: "Hello World", "42"^^http://www.w3.org/2001/XMLSchema#integer
     """
     lexical_form: str
-    datatype_iri: str = "http://www.w3.org/2001/XMLSchema#string"
+    datatype_iri: str = XSD_STRING
+
+    def __post_init__(self):
+        """
+        Intern the datatype IRI, so that all Literals of a datatype share the same string
+        :return: None
+        """
+        datatype_iri = self.datatype_iri
+        if datatype_iri is not XSD_STRING and type(datatype_iri) is str:
+            object.__setattr__(self, "datatype_iri", sys.intern(datatype_iri))
+
+    def __eq__(self, other):
+        """
+        Equality check: memoized Literals are shared, so the identity check usually decides
+        :param other: Object to compare with
+        :return: True if other is a Literal with the same lexical form and datatype
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.lexical_form == other.lexical_form and self.datatype_iri == other.datatype_iri
 
     def __repr__(self):
         """
         String representation of the Literal
         :return: String representation of the Literal
         """
-        if self.datatype_iri == "http://www.w3.org/2001/XMLSchema#string":
+        if self.datatype_iri is XSD_STRING:
             return f'"{self.lexical_form}"'
         return f'"{self.lexical_form}"^^{self.datatype_iri}'
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BlankNode:
     """
     Represents an RDF Blank Node
@@ -42,6 +90,25 @@ class BlankNode:
     """
     identifier: str
 
+    def __eq__(self, other):
+        """
+        Equality check, without building the tuples of fields
+        :param other: Object to compare with
+        :return: True if other is a Blank Node with the same identifier
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.identifier == other.identifier
+
+    def __hash__(self):
+        """
+        Hash of the Blank Node (the hash of its identifier, cached by the string)
+        :return: Hash value
+        """
+        return hash(self.identifier)
+
     def __repr__(self):
         """
         String representation of the Blank Node
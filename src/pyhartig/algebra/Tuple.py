@@ -1,11 +1,27 @@
-from typing import Dict, Union
+import sys
+from collections.abc import Mapping
+from types import CodeType
+from typing import Any, Dict, Optional, Union, Iterator
 
 
 class _Epsilon:
     """
     Means ‘Processing error’ or ‘Undefined value’
+
+    Singleton: every instantiation returns EPSILON, so that ‘value is EPSILON’ is a valid check
     """
 
+    _instance = None
+
+    def __new__(cls):
+        """
+        Return the unique instance of _Epsilon
+        :return: EPSILON
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __repr__(self):
         """
         String representation of the Epsilon object
@@ -29,25 +45,70 @@ EPSILON = _Epsilon()  # Singleton instance of Epsilon
 AlgebraicValue = Union[str, int, float, bool, None, _Epsilon]
 
 
+def intern_constants(code: CodeType) -> CodeType:
+    """
+    Intern the string constants of generated code (and of its nested code objects).
+    CPython only interns the constants looking like identifiers: attribute names such as
+    'user.login' would otherwise be distinct objects in every generated function, and every
+    dictionary lookup of such a key would compare the strings instead of their identity.
+    :param code: Compiled code
+    :return: Code whose string constants are interned (e.g. shared with interned attribute names)
+    """
+    return code.replace(co_consts=tuple(map(_intern_constant, code.co_consts)))
+
+
+def _intern_constant(constant: Any) -> Any:
+    """
+    Intern a constant of generated code
+    :param constant: String, code object, tuple of constants (e.g. the keys of a dictionary display) or other constant
+    :return: Interned string, code with interned constants, tuple of interned constants, or the constant itself
+    """
+    if type(constant) is str:
+        return sys.intern(constant)
+    if type(constant) is CodeType:
+        return intern_constants(constant)
+    if type(constant) is tuple:
+        return tuple(map(_intern_constant, constant))
+    return constant
+
+
+def _check_compatible(t1: Mapping, t2: Mapping) -> None:
+    """
+    Checks that two tuples agree on their common attributes.
+    :param t1: First tuple
+    :param t2: Second tuple
+    :return: None
+    :raises ValueError: If an attribute has different values in the two tuples
+    """
+    # Disjoint tuples (e.g. joined tuples) need no comparison; otherwise only the common attributes are compared
+    if t1.keys().isdisjoint(t2):
+        return
+    for key in t1.keys() & t2.keys():
+        if t1[key] != t2[key]:
+            raise ValueError(
+                f"Tuples are not compatible for merging: conflict on attribute '{key}' : {t1[key]} != {t2[key]}")
+
+
 class MappingTuple(dict):
     """
     Represents a data row (t) in a Mapping Relation.
     Partial function t: A -> T U {ε}
 
     Inherits from ‘dict’ to maintain compatibility with existing code, but adds semantics.
+    Built from a mapping or an iterable of (attribute, value) pairs (e.g. MappingTuple(zip(keys, values)))
+    and/or keyword attributes; the given data is copied once, never modified.
     """
 
-    def __init__(self, data: Dict[str, AlgebraicValue] = None, **kwargs):
+    # No per-instance __dict__: attributes are the dictionary entries
+    __slots__ = ()
+
+    def __init__(self, data: Optional[Dict[str, AlgebraicValue]] = None, **kwargs):
         """
         Initialize the MappingTuple with optional data.
-        :param data: Dictionary of attribute-value pairs
+        :param data: Dictionary (or iterable of pairs) of attribute-value pairs, copied (never modified)
         :param kwargs: Additional attribute-value pairs
         """
-        if data is None:
-            data = {}
-
-        data.update(kwargs)
-        super().__init__(data)
+        dict.__init__(self, () if data is None else data, **kwargs)
 
     def __setitem__(self, key: str, value: AlgebraicValue):
         """
@@ -75,13 +136,139 @@ class MappingTuple(dict):
         :param other: The other MappingTuple to merge with
         :return: A new MappingTuple resulting from the merge
         """
-        # Check compatibility
-        for key in self:
-            if key in other and self[key] != other[key]:
-                raise ValueError(
-                    f"Tuples are not compatible for merging: conflict on attribute '{key}' : {self[key]} != {other[key]}")
+        _check_compatible(self, other)
+
+        # Merge tuples: the display is built pre-sized, in one pass over both tuples
+        return MappingTuple({**self, **other})
+
+
+class ChainedMappingTuple(Mapping):
+    """
+    Copy-on-write view of a MappingTuple extended with additional attributes.
+    t U {a1 -> v1, ..., an -> vn}, where t is shared with the parent relation (never copied nor modified).
+
+    Used to stream tuples between operators; Operator.execute() flattens it back into a MappingTuple.
+    """
+
+    __slots__ = ("parent", "extras")
+
+    def __init__(self, parent: Mapping, extras: Dict[str, AlgebraicValue] = None):
+        """
+        Initialize the overlay.
+        :param parent: Underlying tuple (read-only)
+        :param extras: Attributes added on top of the parent tuple
+        """
+        self.parent = parent
+        self.extras = {} if extras is None else extras
+
+    @classmethod
+    def overlay(cls, row: Mapping, attribute: str, value: AlgebraicValue) -> 'ChainedMappingTuple':
+        """
+        Extend a tuple with one attribute without copying it.
+        Overlays are never stacked: extending an overlay copies its (small) extras only.
+        :param row: Tuple to extend
+        :param attribute: Name of the new attribute
+        :param value: Value of the new attribute
+        :return: ChainedMappingTuple representing row U {attribute -> value}
+        """
+        if type(row) is cls:
+            extras = dict(row.extras)
+            extras[attribute] = value
+            return cls(row.parent, extras)
+        return cls(row, {attribute: value})
+
+    def __getitem__(self, key: str) -> AlgebraicValue:
+        """
+        Look the attribute up in the extras first, then in the parent tuple.
+        :param key: Attribute name
+        :return: Attribute value
+        """
+        extras = self.extras
+        if key in extras:
+            return extras[key]
+        return self.parent[key]
 
-        # Merge tuples
-        new_data = self.copy()
-        new_data.update(other)
-        return MappingTuple(new_data)
+    def __setitem__(self, key: str, value: AlgebraicValue):
+        """
+        Write the attribute into the extras (the parent tuple is left untouched).
+        :param key: Attribute name
+        :param value: Attribute value
+        :return: None
+        """
+        if not isinstance(key, str):
+            raise TypeError(f"The attribute (key) of a MappingTuple must be a string, received: {type(key)}")
+        self.extras[key] = value
+
+    def __contains__(self, key) -> bool:
+        """
+        Check whether the attribute is defined in the extras or in the parent tuple.
+        :param key: Attribute name
+        :return: True if the attribute is defined
+        """
+        return key in self.extras or key in self.parent
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the attributes in the order of an equivalent MappingTuple:
+        parent attributes first, then the new ones.
+        :return: Iterator of attribute names
+        """
+        yield from self.parent
+        parent = self.parent
+        for key in self.extras:
+            if key not in parent:
+                yield key
+
+    def __len__(self) -> int:
+        """
+        Number of attributes of the tuple.
+        :return: Number of attributes
+        """
+        parent = self.parent
+        return len(parent) + sum(1 for key in self.extras if key not in parent)
+
+    def get(self, key: str, default=None):
+        """
+        Mirror of dict.get.
+        :param key: Attribute name
+        :param default: Value returned if the attribute is not defined
+        :return: Attribute value or default
+        """
+        extras = self.extras
+        if key in extras:
+            return extras[key]
+        return self.parent.get(key, default)
+
+    def __repr__(self):
+        """
+        String representation, identical to the one of the equivalent MappingTuple
+        :return: String representation of the tuple
+        """
+        items_str = ", ".join(f"{k}={repr(v)}" for k, v in self.items())
+        return f"Tuple({items_str})"
+
+    def to_mapping_tuple(self, reuse_parent: bool = False) -> MappingTuple:
+        """
+        Flatten the overlay into a standalone MappingTuple.
+        :param reuse_parent: Write the extras into the parent tuple and return it instead of a copy
+                             (only valid when the parent tuple is referenced by nothing else)
+        :return: New MappingTuple, or the updated parent tuple
+        """
+        parent = self.parent
+        if reuse_parent and type(parent) is MappingTuple:
+            parent.update(self.extras)
+            return parent
+        # Single pre-sized display of both parts (cheaper than copying the parent then inserting the extras)
+        return MappingTuple({**parent, **self.extras})
+
+    def merge(self, other: Mapping) -> MappingTuple:
+        """
+        Operation t U t
+        :param other: The other tuple to merge with
+        :return: A new MappingTuple resulting from the merge
+        """
+        # The flattened overlay is the result: single copy, no second copy by MappingTuple.merge()
+        merged = self.to_mapping_tuple()
+        _check_compatible(merged, other)
+        merged.update(other)
+        return merged
@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, List, Callable, FrozenSet, Optional
 from pyhartig.expressions.Expression import Expression
 from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 
 
 class Constant(Expression):
@@ -9,6 +10,8 @@ class Constant(Expression):
     If the expression is a fixed value (e.g., rdf:type or “http://example.org/”), it always returns that value, regardless of the tuple.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         """
         Initialize the Constant with a specific value (RDF Term or fixed attribute).
@@ -24,6 +27,46 @@ class Constant(Expression):
         """
         return self.value
 
+    def attrs(self) -> FrozenSet[str]:
+        """
+        A constant references no attribute.
+        :return: Empty set
+        """
+        return frozenset()
+
+    def is_constant(self) -> bool:
+        """
+        A constant has the same value for every tuple.
+        :return: True
+        """
+        return True
+
+    def evaluate_batch(self, batch: ColumnBatch) -> List[Any]:
+        """
+        Evaluate the constant expression against a column batch, which repeats its value for every tuple.
+        :param batch: Column batch to evaluate against
+        :return: List containing the constant value once per tuple
+        """
+        # Subclass overriding evaluate() (exact type check): evaluated tuple by tuple through it
+        if type(self).evaluate is not Constant.evaluate:
+            evaluate = self.evaluate
+            return [evaluate(row) for row in batch.iter_tuples()]
+
+        return [self.value] * len(batch)
+
+    def compile(self, schema: Optional[FrozenSet[str]] = None) -> Callable[[MappingTuple], Any]:
+        """
+        Compile the constant expression into a closure returning its value.
+        :param schema: Attributes defined in every evaluated tuple (unused)
+        :return: Callable ignoring the tuple and returning the constant value
+        """
+        # Subclass overriding evaluate() (exact type check): the closure must call it
+        if type(self).evaluate is not Constant.evaluate:
+            return self.evaluate
+
+        value = self.value
+        return lambda tuple_data: value
+
     def __repr__(self):
         """
         String representation of the Constant expression.
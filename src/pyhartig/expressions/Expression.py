@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Callable, FrozenSet, Optional, AbstractSet
 from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 
 class Expression(ABC):
     """
     Represents an algebraic expression phi
     """
 
+    # Expression trees are built once per mapping: no per-instance __dict__ in the built-in nodes
+    __slots__ = ()
+
     @abstractmethod
     def evaluate(self, mapping: MappingTuple) -> Any:
         """
@@ -14,4 +18,51 @@ class Expression(ABC):
         :param mapping: Mapping tuple to evaluate against
         :return: Result of the evaluation
         """
-        pass
\ No newline at end of file
+        pass
+
+    def attrs(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes referenced by the expression. (attrs(phi))
+        Default implementation returns None (unknown: the expression may read any attribute).
+        :return: Set of attribute names, or None if unknown
+        """
+        return None
+
+    def may_read(self, attributes: AbstractSet[str]) -> bool:
+        """
+        Whether the expression may read one of the given attributes (always, if its attributes are unknown).
+        :param attributes: Attribute names
+        :return: True unless the expression is known to read none of the attributes
+        """
+        referenced = self.attrs()
+        return referenced is None or not referenced.isdisjoint(attributes)
+
+    def is_constant(self) -> bool:
+        """
+        Whether the expression evaluates to the same value for every tuple, so that it can be
+        evaluated once instead of once per tuple (constant folding).
+        Default implementation returns False (unknown).
+        :return: True if the value of the expression does not depend on the tuple
+        """
+        return False
+
+    def evaluate_batch(self, batch: ColumnBatch) -> List[Any]:
+        """
+        Evaluate the expression against every tuple of a column batch.
+        Default implementation falls back to the tuple-at-a-time evaluation, with the expression
+        compiled once per batch (every attribute of the batch is defined in each of its tuples).
+        :param batch: Column batch to evaluate against
+        :return: List of results, one per tuple of the batch
+        """
+        evaluate = self.compile(frozenset(batch.columns))
+        return [evaluate(row) for row in batch.iter_tuples()]
+
+    def compile(self, schema: Optional[FrozenSet[str]] = None) -> Callable[[MappingTuple], Any]:
+        """
+        Compile the expression into a closure equivalent to evaluate(), to be built once per
+        operator and then called once per tuple.
+        Default implementation returns the bound evaluate method.
+        :param schema: Attributes defined in every tuple the closure will be called on (None: unknown)
+        :return: Callable taking a mapping tuple and returning the result of the evaluation
+        """
+        return self.evaluate
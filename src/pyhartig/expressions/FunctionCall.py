@@ -1,40 +1,238 @@
-from typing import Any, List, Callable
+from typing import Any, Dict, List, Callable, Optional, Sequence, FrozenSet, Tuple
 from pyhartig.expressions.Expression import Expression
+from pyhartig.expressions.Constant import Constant
+from pyhartig.expressions.Reference import Reference
 from pyhartig.algebra.Tuple import MappingTuple, EPSILON
+from pyhartig.algebra.ColumnBatch import ColumnBatch
+from pyhartig.functions.builtins import BATCH_KERNELS
+
+def _apply(function: Callable, evaluated_args: Sequence[Any]) -> Any:
+    """
+    Applies an extension function to already evaluated arguments.
+    :param function: The function to apply.
+    :param evaluated_args: The evaluated arguments.
+    :return: The result of the function, or EPSILON if any argument is EPSILON or an error occurs.
+    """
+    # If any argument evaluates to EPSILON, return EPSILON for the whole function call
+    # (EPSILON is a singleton: identity check, no __eq__ dispatch)
+    for arg in evaluated_args:
+        if arg is EPSILON:
+            return EPSILON
+
+    # Apply the function to the evaluated arguments
+    try:
+        return function(*evaluated_args)
+    except Exception as e:
+        # In case of any error during function application, return EPSILON
+        return EPSILON
+
+
+# Maximum number of results memoized per call of a pure function
+RESULT_CACHE_SIZE = 4096
+
+# Result of a lookup in a memoization cache without an entry for the arguments
+_MISSING = object()
+
+
+def _apply_cached(cache: Dict[Tuple, Any], function: Callable, evaluated_args: Sequence[Any]) -> Any:
+    """
+    Applies a pure extension function, memoizing its result per distinct arguments.
+    :param cache: Results of the function call, by arguments
+    :param function: The pure function to apply.
+    :param evaluated_args: The evaluated arguments.
+    :return: The result of the function, or EPSILON if any argument is EPSILON or an error occurs.
+    """
+    # Argument types are part of the key: 1, 1.0 and True are equal but may not convert equally
+    key = (*evaluated_args, *map(type, evaluated_args))
+    try:
+        # A miss returns the sentinel instead of raising KeyError (most calls miss on unique values)
+        result = cache.get(key, _MISSING)
+    except TypeError:
+        # Unhashable argument (e.g. a JSON array): not memoized
+        return _apply(function, evaluated_args)
+    if result is not _MISSING:
+        return result
+
+    result = _apply(function, evaluated_args)
+    if len(cache) < RESULT_CACHE_SIZE:
+        cache[key] = result
+    return result
+
+
+# Number of evaluate() calls after which a call tree is compiled (generating the code costs a few
+# hundred interpreted evaluations)
+COMPILE_THRESHOLD = 256
+
+
+def _is_plain_tree(expression: Expression) -> bool:
+    """
+    Check whether an expression tree is made of Constant, Reference and FunctionCall nodes only
+    (exact types: subclasses may override evaluate()).
+    :param expression: Expression to check
+    :return: True if compile() is equivalent to evaluate() for every node of the tree
+    """
+    expression_type = type(expression)
+    if expression_type is Constant or expression_type is Reference:
+        return True
+    return expression_type is FunctionCall and all(_is_plain_tree(arg) for arg in expression.arguments)
+
 
 class FunctionCall(Expression):
     """
     Represents the application of an extension function f to subexpressions. (f(phi1, ..., phin))
     """
 
-    def __init__(self, function: Callable, arguments: List[Expression]):
+    __slots__ = ("_function", "_arguments", "_cache", "_compiled", "_evaluations")
+
+    def __init__(self, function: Callable, arguments: Sequence[Expression]):
         """
         Initializes a FunctionCall expression.
         :param function: Python callable representing the function to be applied (e.g., built-in or user-defined).
-        :param arguments: List of sub-expressions (Expression) that will provide the arguments
+        :param arguments: Sequence of sub-expressions (Expression) that will provide the arguments
+        """
+        # Read-only (see the properties below): the memoization cache and the generated function depend on them
+        self._function = function
+        self._arguments: Tuple[Expression, ...] = tuple(arguments)
+        # Results of pure functions (marked with @pure), by arguments
+        self._cache: Optional[Dict[Tuple, Any]] = {} if getattr(function, "_pure", False) else None
+        # Generated function used by evaluate() once called COMPILE_THRESHOLD times
+        self._compiled: Optional[Callable[[MappingTuple], Any]] = None
+        self._evaluations = 0
+
+    @property
+    def function(self) -> Callable:
+        """
+        The function applied by the call.
+        :return: Python callable
+        """
+        return self._function
+
+    @property
+    def arguments(self) -> Tuple[Expression, ...]:
+        """
+        The sub-expressions providing the arguments (immutable: build a new FunctionCall to change them).
+        :return: Tuple of sub-expressions
         """
-        self.function = function
-        self.arguments = arguments
+        return self._arguments
 
     def evaluate(self, tuple_data: MappingTuple) -> Any:
         """
         Evaluates the function call against the provided tuple data.
+        The expression tree is walked node by node for the first calls; after COMPILE_THRESHOLD calls,
+        trees of Constant, Reference and FunctionCall nodes are compiled (see compile()) and the
+        generated function is called instead.
         :param tuple_data: The tuple data to evaluate against.
         :return: The result of applying the function to the evaluated arguments, or EPSILON if any argument is EPSILON or an error occurs.
         """
-        # Evaluate all arguments
-        evaluated_args = [arg.evaluate(tuple_data) for arg in self.arguments]
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled(tuple_data)
 
-        # If any argument evaluates to EPSILON, return EPSILON for the whole function call
-        if any(arg == EPSILON for arg in evaluated_args):
-            return EPSILON
+        self._evaluations += 1
+        if self._evaluations == COMPILE_THRESHOLD and self.attrs() and _is_plain_tree(self):
+            compiled = self._compiled = self.compile()
+            return compiled(tuple_data)
 
-        # Apply the function to the evaluated arguments
-        try:
-            return self.function(*evaluated_args)
-        except Exception as e:
-            # In case of any error during function application, return EPSILON
-            return EPSILON
+        # Evaluate all arguments (the value of a Constant is read directly, without a method call)
+        constant = Constant
+        evaluated_args = [
+            arg.value if type(arg) is constant else arg.evaluate(tuple_data) for arg in self._arguments
+        ]
+
+        if self._cache is not None:
+            return _apply_cached(self._cache, self._function, evaluated_args)
+        return _apply(self._function, evaluated_args)
+
+    def attrs(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes referenced by any of the arguments.
+        :return: Union of the attributes of the arguments, or None if unknown for one of them
+        """
+        referenced = [arg.attrs() for arg in self.arguments]
+        if any(attributes is None for attributes in referenced):
+            return None
+        return frozenset().union(*referenced)
+
+    def is_constant(self) -> bool:
+        """
+        A call of a pure function (marked with @pure) on constant arguments has the same value for
+        every tuple; other functions (e.g. blank node generators) are called once per tuple.
+        :return: True if the function is pure and every argument is constant
+        """
+        return self._cache is not None and all(arg.is_constant() for arg in self.arguments)
+
+    def evaluate_batch(self, batch: ColumnBatch) -> List[Any]:
+        """
+        Evaluates the function call against a column batch.
+        Functions with a column kernel are applied once per batch, on the argument columns; other
+        calls are evaluated by a generated loop over the columns of the referenced attributes.
+        :param batch: The column batch to evaluate against.
+        :return: List of results, one per tuple of the batch.
+        """
+        # Subclass overriding evaluate() (exact type check): evaluated tuple by tuple through it
+        if type(self).evaluate is not FunctionCall.evaluate:
+            evaluate = self.evaluate
+            return [evaluate(row) for row in batch.iter_tuples()]
+
+        # Constant folding: the result is the same for every tuple
+        if self.is_constant():
+            return [self.evaluate(MappingTuple())] * len(batch)
+        if self.attrs() == frozenset():
+            # No column to iterate over (e.g. a blank node generator): one call per tuple
+            evaluate = self.evaluate
+            empty = MappingTuple()
+            return [evaluate(empty) for _ in range(len(batch))]
+
+        # Built-in functions with a column kernel are applied once per batch
+        kernel = BATCH_KERNELS.get(self.function)
+
+        if kernel is None:
+            # Other calls: the whole expression tree is compiled into a single loop over the columns
+            # (imported here: the code generator depends on every expression class)
+            from pyhartig.expressions._codegen import compile_column_expression
+            compiled = compile_column_expression(self)
+            if compiled is not None:
+                evaluate_columns, attributes = compiled
+                columns = batch.columns
+                return evaluate_columns(*(
+                    columns[attribute] if attribute in columns else [EPSILON] * len(batch)
+                    for attribute in attributes
+                ))
+
+        # Evaluate all arguments as whole columns
+        argument_columns = [arg.evaluate_batch(batch) for arg in self.arguments]
+
+        if kernel is not None:
+            try:
+                return kernel(*argument_columns)
+            except TypeError:
+                # Unexpected arity: fall back to the tuple-at-a-time application (EPSILON per tuple)
+                pass
+
+        function = self.function
+        return [_apply(function, evaluated_args) for evaluated_args in zip(*argument_columns)]
+
+    def compile(self, schema: Optional[FrozenSet[str]] = None) -> Callable[[MappingTuple], Any]:
+        """
+        Compiles the function call into a generated Python function.
+        The whole expression tree is lowered to straight-line code (one local variable per node),
+        so evaluating a tuple no longer walks the expression tree nor calls a closure per node.
+        Constant calls (see is_constant()) are folded into a constant (evaluated once).
+        :param schema: Attributes defined in every evaluated tuple (None: unknown)
+        :return: Callable equivalent to evaluate().
+        """
+        # Subclass overriding evaluate() (exact type check): the closure must call it
+        if type(self).evaluate is not FunctionCall.evaluate:
+            return self.evaluate
+
+        # Constant folding: pure function on constant arguments, the value is loop invariant
+        if self.is_constant():
+            value = self.evaluate(MappingTuple())
+            return lambda tuple_data: value
+
+        # Imported here: the code generator depends on every expression class
+        from pyhartig.expressions._codegen import compile_expression
+        return compile_expression(self, schema)
 
     def __repr__(self):
         """
@@ -43,4 +241,4 @@ class FunctionCall(Expression):
         """
         args_repr = ", ".join(repr(a) for a in self.arguments)
         func_name = getattr(self.function, "__name__", str(self.function))
-        return f"{func_name}({args_repr})"
\ No newline at end of file
+        return f"{func_name}({args_repr})"
@@ -1,18 +1,26 @@
-from typing import Any
+import sys
+from operator import itemgetter
+from typing import Any, List, Callable, FrozenSet, Optional
 from pyhartig.expressions.Expression import Expression
 from pyhartig.algebra.Tuple import MappingTuple, EPSILON
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 
 class Reference(Expression):
     """
     Represents a reference to an attribute of the tuple
     """
 
+    __slots__ = ("attribute_name",)
+
     def __init__(self, attribute_name: str):
         """
         Initializes a Reference expression.
         :param attribute_name: The name of the attribute to reference.
         """
-        self.attribute_name = attribute_name
+        # Interned: the same object as the keys of the tuples (built by generated code with interned
+        # constants), so that the dictionary lookups compare identities instead of strings; any other
+        # name is kept unchanged and simply never matches an attribute
+        self.attribute_name = sys.intern(attribute_name) if type(attribute_name) is str else attribute_name
 
     def evaluate(self, tuple_data: MappingTuple) -> Any:
         """
@@ -20,12 +28,49 @@ class Reference(Expression):
         :param tuple_data: The tuple data to evaluate against.
         :return: The value of the referenced attribute, or EPSILON if not found.
         """
-        # Check if the attribute exists in the tuple data : if yes, return its value
-        if self.attribute_name in tuple_data:
-            return tuple_data[self.attribute_name]
+        # Value of the attribute if it exists in the tuple data, otherwise EPSILON (single lookup)
+        return tuple_data.get(self.attribute_name, EPSILON)
+
+    def attrs(self) -> FrozenSet[str]:
+        """
+        A reference depends on the referenced attribute only.
+        :return: Set containing the referenced attribute name
+        """
+        return frozenset((self.attribute_name,))
+
+    def evaluate_batch(self, batch: ColumnBatch) -> List[Any]:
+        """
+        Evaluates the reference against a column batch.
+        :param batch: The column batch to evaluate against.
+        :return: The column of the referenced attribute (shared, not copied), or EPSILON for every tuple if not found.
+        """
+        # Subclass overriding evaluate() (exact type check): evaluated tuple by tuple through it
+        if type(self).evaluate is not Reference.evaluate:
+            evaluate = self.evaluate
+            return [evaluate(row) for row in batch.iter_tuples()]
+
+        if self.attribute_name in batch:
+            return batch[self.attribute_name]
+
+        return [EPSILON] * len(batch)
+
+    def compile(self, schema: Optional[FrozenSet[str]] = None) -> Callable[[MappingTuple], Any]:
+        """
+        Compiles the reference into a closure looking up the attribute.
+        :param schema: Attributes defined in every evaluated tuple (None: unknown)
+        :return: Callable returning the value of the referenced attribute, or EPSILON if not found.
+        """
+        # Subclass overriding evaluate() (exact type check): the closure must call it
+        if type(self).evaluate is not Reference.evaluate:
+            return self.evaluate
+
+        attribute_name = self.attribute_name
+
+        # Attribute known to be defined: plain subscription, without the EPSILON default
+        if schema is not None and attribute_name in schema:
+            return itemgetter(attribute_name)
 
-        # If the attribute does not exist, return EPSILON
-        return EPSILON
+        return lambda tuple_data: tuple_data.get(attribute_name, EPSILON)
 
     def __repr__(self):
         """
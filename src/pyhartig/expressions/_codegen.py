@@ -0,0 +1,499 @@
+"""
+Code generation for expression trees.
+
+An expression tree is lowered to the source code of a single Python function, in which every
+node of the tree is one local variable assignment. The generated function is equivalent to
+Expression.evaluate(), without any method call or closure call per node: only the extension
+functions themselves are called.
+
+Generated functions are memoized per expression structure: structurally identical expressions
+(same functions, same constant values, same attributes) share a single compiled function.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple as TypingTuple
+
+from pyhartig.algebra.Tuple import MappingTuple, EPSILON, intern_constants
+from pyhartig.expressions.Expression import Expression
+from pyhartig.expressions.Constant import Constant
+from pyhartig.expressions.Reference import Reference
+from pyhartig.expressions.FunctionCall import FunctionCall, RESULT_CACHE_SIZE, _MISSING
+from pyhartig.algebra.Terms import IRI, Literal, BlankNode, XSD_STRING
+from pyhartig.functions.builtins import to_iri, to_literal, concat, _to_iri_cached, _to_literal_cached
+
+
+# Maximum number of generated functions memoized by compile_expression()
+COMPILE_CACHE_SIZE = 4096
+
+# Generated functions, by (structural key of the expression, schema attributes it references)
+_compile_cache: "OrderedDict[Hashable, Callable[[MappingTuple], Any]]" = OrderedDict()
+
+
+# Types whose equal values are interchangeable: keyed by (type, value)
+_ATOMIC_TYPES = frozenset((str, int, bool, bytes, type(None), type(EPSILON)))
+
+
+def _value_key(value: Any) -> Optional[Hashable]:
+    """
+    Key identifying a constant value: equal keys denote interchangeable values.
+    Built recursively with the exact type of every element, since values of different types may
+    compare equal (1, 1.0 and True; 0.0 and -0.0), also inside containers.
+    :param value: Constant value
+    :return: Nested tuple, or None if the value cannot be keyed exactly (e.g. unhashable, or of another type)
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value_type, value
+    if value_type is float:
+        # 0.0 == -0.0, but they are rendered differently
+        return value_type, repr(value)
+
+    if value_type is tuple or value_type is frozenset:
+        element_keys = []
+        for element in value:
+            key = _value_key(element)
+            if key is None:
+                return None
+            element_keys.append(key)
+        return value_type, tuple(element_keys) if value_type is tuple else frozenset(element_keys)
+
+    # RDF terms: keyed by their fields (which need not be strings)
+    if value_type is IRI:
+        fields = (value.value,)
+    elif value_type is Literal:
+        fields = (value.lexical_form, value.datatype_iri)
+    elif value_type is BlankNode:
+        fields = (value.identifier,)
+    else:
+        # Other types may define any equality: not memoized
+        return None
+    field_keys = tuple(_value_key(field) for field in fields)
+    return None if None in field_keys else (value_type, field_keys)
+
+
+def _structural_key(expression: Expression) -> Optional[Hashable]:
+    """
+    Key identifying the structure of an expression tree.
+    Two expressions with the same key evaluate identically on every tuple, so they can share
+    their generated function.
+    :param expression: Expression to identify
+    :return: Nested tuple, or None if the expression holds an unhashable constant or an unknown expression type
+    """
+    # Exact type checks: subclasses may override evaluate(), they are opaque like unknown expression types
+    expression_type = type(expression)
+    if expression_type is Constant:
+        key = _value_key(expression.value)
+        return None if key is None else ("const", key)
+
+    if expression_type is Reference:
+        return "ref", expression.attribute_name
+
+    if expression_type is FunctionCall:
+        argument_keys = []
+        for arg in expression.arguments:
+            key = _structural_key(arg)
+            if key is None:
+                return None
+            argument_keys.append(key)
+        try:
+            hash(expression.function)
+        except TypeError:
+            return None
+        # The function object itself (not its id) keeps it alive as long as the entry
+        return "call", expression.function, tuple(argument_keys)
+
+    # Opaque expression types (and subclasses) may hold state the key cannot see
+    return None
+
+
+def clear_compile_cache() -> None:
+    """
+    Forget the memoized generated functions.
+    :return: None
+    """
+    _compile_cache.clear()
+
+
+# Builtins called by the generated straight-line code
+_LOOP_BUILTINS = ("type", "str", "int", "len")
+
+
+class _CodeGenerator:
+    """
+    Lowers an expression tree to a list of source lines.
+    Constants, functions and opaque sub-expressions are passed to the generated code through its
+    global namespace.
+    """
+
+    def __init__(self, schema: Optional[FrozenSet[str]] = None, row_variables: Optional[Dict[str, str]] = None,
+                 overlay_attributes: Optional[FrozenSet[str]] = None):
+        """
+        Initialize an empty generator.
+        :param schema: Attributes defined in every evaluated tuple (None: unknown)
+        :param row_variables: If given, attributes are read from loop variables instead of a tuple;
+                              filled with the variable name of each referenced attribute
+        :param overlay_attributes: If given, the evaluated tuples are ChainedMappingTuple overlays whose
+                                   extras define these attributes; attributes are read from the extras
+                                   and parent dictionaries directly
+        """
+        self.schema = schema if schema is not None else frozenset()
+        self.row_variables = row_variables
+        self.overlay_attributes = overlay_attributes
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "EPSILON": EPSILON, "_MISSING": _MISSING,
+            # Memoized term constructors of the inlined built-in functions
+            "_iri": _to_iri_cached, "_literal": _to_literal_cached, "Literal": Literal, "XSD_STRING": XSD_STRING,
+        }
+        self._counter = 0
+        # Global names bound to constant values (known at generation time)
+        self._constants: Dict[str, Any] = {}
+        # Common subexpressions: node key -> name already holding its value
+        self._values: Dict[Hashable, str] = {}
+
+    def _new_name(self, prefix: str) -> str:
+        """
+        Return a fresh identifier.
+        :param prefix: Prefix of the identifier
+        :return: Identifier not used yet in the generated code
+        """
+        name = f"{prefix}{self._counter}"
+        self._counter += 1
+        return name
+
+    def _bind(self, prefix: str, value: Any) -> str:
+        """
+        Bind a Python object to a global name of the generated code.
+        :param prefix: Prefix of the global name
+        :param value: Object to bind
+        :return: Global name
+        """
+        name = self._new_name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def _bind_constant(self, value: Any) -> str:
+        """
+        Bind a constant value to a global name of the generated code.
+        :param value: Constant value
+        :return: Global name
+        """
+        name = self._bind("c", value)
+        self._constants[name] = value
+        return name
+
+    def _constant_key(self, name: str) -> Hashable:
+        """
+        Key identifying the value of a constant, for common subexpression detection.
+        :param name: Global name bound to the constant
+        :return: Key of the value if it is hashable, otherwise the global name itself
+        """
+        key = _value_key(self._constants[name])
+        return name if key is None else key
+
+    def _inline_builtin(self, function: Callable, args: List[str]) -> List[TypingTuple[str, str]]:
+        """
+        Inlined versions of a built-in function, for arguments of native types.
+        to_iri, to_literal and concat applied to strings or native integers (or Literals, for their
+        lexical form) build their term directly through the memoized constructors, without calling the function.
+        :param function: Function of the call
+        :param args: Names holding the arguments
+        :return: (condition, expression) pairs, tried in order before the generic call (possibly empty)
+        """
+        constants = self._constants
+        checked_args = list(dict.fromkeys(arg for arg in args if arg not in constants))
+        if not checked_args:
+            return []
+
+        if function is concat:
+            # Constant parts must be strings too, the other arguments are checked at run time
+            if not all(type(constants[arg]) is str for arg in args if arg in constants):
+                return []
+            condition = " and ".join(f"type({arg}) is str" for arg in checked_args)
+            # Native integers format as their lexical form too (e.g. numeric identifiers, ages)
+            mixed = " and ".join(f"(type({arg}) is str or type({arg}) is int)" for arg in checked_args)
+            # f-string template: one string built from all the parts (no intermediate concatenations)
+            template = "".join(f"{{{arg}}}" for arg in args)
+            built = f"_literal(f{template!r}, XSD_STRING)"
+            return [(condition, built), (mixed, built)]
+
+        # to_iri / to_literal: the value varies, the base / datatype is a constant
+        value = args[0]
+        if value in constants:
+            return []
+
+        if function is to_iri and len(args) <= 2:
+            base = args[1] if len(args) == 2 else "None"
+            if base != "None" and not (base in constants and (constants[base] is None or type(constants[base]) is str)):
+                return []
+            return [(f"type({value}) is str", f"_iri({value}, {base})"),
+                    (f"type({value}) is Literal", f"_iri({value}.lexical_form, {base})"),
+                    (f"type({value}) is int", f"_iri(f'{{{value}}}', {base})")]
+
+        if function is to_literal and len(args) == 2:
+            datatype = args[1]
+            if not (datatype in constants and type(constants[datatype]) is str):
+                return []
+            return [(f"type({value}) is str", f"_literal({value}, {datatype})"),
+                    (f"type({value}) is Literal", f"_literal({value}.lexical_form, {datatype})"),
+                    (f"type({value}) is int", f"_literal(f'{{{value}}}', {datatype})")]
+
+        return []
+
+    def emit(self, expression: Expression, indent: str = "    ") -> str:
+        """
+        Emit the code evaluating an expression.
+        :param expression: Expression to lower
+        :param indent: Indentation of the emitted lines
+        :return: Name of the local variable (or global constant) holding the result
+        """
+        # Exact type checks: subclasses may override evaluate(), they are opaque sub-expressions
+        expression_type = type(expression)
+        if expression_type is Constant:
+            return self._bind_constant(expression.value)
+
+        if expression_type is Reference:
+            # Each attribute is looked up once, however many times it is referenced
+            key = ("ref", expression.attribute_name)
+            if key in self._values:
+                return self._values[key]
+            if self.row_variables is not None:
+                # Column evaluation: the value is the loop variable iterating over the attribute column
+                var = self._new_name("r")
+                self.row_variables[expression.attribute_name] = var
+                self._values[key] = var
+                return var
+            var = self._new_name("v")
+            name = expression.attribute_name
+            if self.overlay_attributes is not None:
+                # Overlay evaluation: same lookup as ChainedMappingTuple, without a method call
+                if name in self.overlay_attributes:
+                    self.lines.append(f"{indent}{var} = extras[{name!r}]")
+                elif name in self.schema:
+                    self.lines.append(f"{indent}{var} = extras[{name!r}] if {name!r} in extras else parent[{name!r}]")
+                else:
+                    self.lines.append(
+                        f"{indent}{var} = extras[{name!r}] if {name!r} in extras else parent.get({name!r}, EPSILON)"
+                    )
+            elif name in self.schema:
+                # Attribute known to be defined: plain subscription, without the EPSILON default
+                self.lines.append(f"{indent}{var} = tuple_data[{name!r}]")
+            else:
+                self.lines.append(f"{indent}{var} = tuple_data.get({name!r}, EPSILON)")
+            self._values[key] = var
+            return var
+
+        if expression_type is FunctionCall:
+            # Constant folding: evaluated once, at generation time
+            if expression.is_constant():
+                return self._bind_constant(expression.evaluate(MappingTuple()))
+
+            args = [self.emit(arg, indent) for arg in expression.arguments]
+
+            # A constant EPSILON argument makes the whole call EPSILON
+            if any(arg in self._constants and self._constants[arg] is EPSILON for arg in args):
+                return self._bind_constant(EPSILON)
+
+            # Identical calls of a pure function (same function, same argument values) are evaluated once
+            key = None
+            if expression._cache is not None:
+                key = ("call", id(expression.function),
+                       tuple(self._constant_key(arg) if arg in self._constants else arg for arg in args))
+                if key in self._values:
+                    return self._values[key]
+
+            function = self._bind("f", expression.function)
+            var = self._new_name("v")
+            if key is not None:
+                self._values[key] = var
+
+            # Built-in functions applied to native values: direct construction of the term, inlined
+            inlined = self._inline_builtin(expression.function, args)
+            for i, (condition, value) in enumerate(inlined):
+                self.lines.append(f"{indent}{'elif' if i else 'if'} {condition}:")
+                self.lines.append(f"{indent}    try:")
+                self.lines.append(f"{indent}        {var} = {value}")
+                self.lines.append(f"{indent}    except Exception:")
+                self.lines.append(f"{indent}        {var} = EPSILON")
+
+            # EPSILON propagation (constant arguments are known not to be EPSILON),
+            # then application with errors mapped to EPSILON
+            # (an argument shared by several positions is checked once)
+            checked_args = list(dict.fromkeys(arg for arg in args if arg not in self._constants))
+            if checked_args:
+                condition = " or ".join(f"{arg} is EPSILON" for arg in checked_args)
+                self.lines.append(f"{indent}{'elif' if inlined else 'if'} {condition}:")
+                self.lines.append(f"{indent}    {var} = EPSILON")
+            if checked_args or inlined:
+                self.lines.append(f"{indent}else:")
+                body_indent = indent + "    "
+            else:
+                body_indent = indent
+
+            # Pure function: results memoized per distinct arguments, in the cache of the node
+            memoized = expression._cache is not None and bool(checked_args)
+            if memoized:
+                cache = self._bind("m", expression._cache)
+                key = self._new_name("k")
+                # Constant arguments are the same for every call of the node: not part of the key
+                # (keys are then shorter than the ones of FunctionCall.evaluate(), so they never collide)
+                types = ", ".join(f"type({arg})" for arg in checked_args)
+                self.lines.append(f"{body_indent}{key} = ({', '.join(checked_args)}, {types})")
+                self.lines.append(f"{body_indent}try:")
+                self.lines.append(f"{body_indent}    {var} = {cache}.get({key}, _MISSING)")
+                self.lines.append(f"{body_indent}except TypeError:")
+                # Unhashable argument (e.g. a JSON array): not memoized
+                self.lines.append(f"{body_indent}    {var} = _MISSING")
+                self.lines.append(f"{body_indent}    {key} = None")
+                self.lines.append(f"{body_indent}if {var} is _MISSING:")
+                miss_indent = body_indent + "    "
+            else:
+                miss_indent = body_indent
+
+            self.lines.append(f"{miss_indent}try:")
+            self.lines.append(f"{miss_indent}    {var} = {function}({', '.join(args)})")
+            self.lines.append(f"{miss_indent}except Exception:")
+            self.lines.append(f"{miss_indent}    {var} = EPSILON")
+
+            if memoized:
+                self.lines.append(f"{miss_indent}if {key} is not None and len({cache}) < {RESULT_CACHE_SIZE}:")
+                self.lines.append(f"{miss_indent}    {cache}[{key}] = {var}")
+            return var
+
+        # Other expression types (and subclasses of the built-in ones): call their own compiled closure
+        closure = self._bind("g", expression.compile(self.schema))
+        var = self._new_name("v")
+        self.lines.append(f"{indent}{var} = {closure}(tuple_data)")
+        return var
+
+
+def generate_source(expression: Expression, schema: Optional[FrozenSet[str]] = None,
+                    overlay_attributes: Optional[FrozenSet[str]] = None) -> str:
+    """
+    Generate the source code of the function evaluating an expression.
+    :param expression: Expression to lower
+    :param schema: Attributes defined in every evaluated tuple (None: unknown)
+    :param overlay_attributes: Attributes defined in the extras of every evaluated overlay (None: plain tuples)
+    :return: Python source code defining 'evaluate(tuple_data)'
+    """
+    return _generate(expression, schema, overlay_attributes)[0]
+
+
+def _generate(expression: Expression, schema: Optional[FrozenSet[str]] = None,
+              overlay_attributes: Optional[FrozenSet[str]] = None):
+    """
+    Lower an expression to source code and its global namespace.
+    :param expression: Expression to lower
+    :param schema: Attributes defined in every evaluated tuple (None: unknown)
+    :param overlay_attributes: Attributes defined in the extras of every evaluated overlay (None: plain tuples)
+    :return: Tuple (source code, namespace)
+    """
+    generator = _CodeGenerator(schema, overlay_attributes=overlay_attributes)
+    result = generator.emit(expression)
+    lines = ["def evaluate(tuple_data):"]
+    if overlay_attributes is not None:
+        lines += ["    extras = tuple_data.extras", "    parent = tuple_data.parent"]
+    lines += generator.lines + [f"    return {result}"]
+    return "\n".join(lines), generator.namespace
+
+
+def _generate_columns(expression: Expression):
+    """
+    Lower an expression to the source code of a column-at-a-time function and its global namespace.
+    The generated function takes one column per referenced attribute and loops over them at once,
+    with the same straight-line code as _generate() as loop body.
+    :param expression: Expression to lower (without opaque sub-expressions)
+    :return: Tuple (source code, namespace, attributes in the order of the function parameters)
+    """
+    row_variables: Dict[str, str] = {}
+    generator = _CodeGenerator(row_variables=row_variables)
+    result = generator.emit(expression, indent="        ")
+
+    attributes = list(row_variables)
+    parameters = [f"column{i}" for i in range(len(attributes))]
+    variables = [row_variables[attribute] for attribute in attributes]
+    if len(parameters) == 1:
+        loop = f"    for {variables[0]} in {parameters[0]}:"
+    else:
+        loop = f"    for {', '.join(variables)} in zip({', '.join(parameters)}):"
+
+    # The loop body runs once per row: its globals (and the builtins it calls) are bound to
+    # keyword-only parameters, read as fast locals instead of global / builtin lookups
+    bound = [f"{name}={name}" for name in [*generator.namespace, *_LOOP_BUILTINS]]
+    lines = [
+        f"def evaluate_columns({', '.join(parameters)}, *, {', '.join(bound)}):",
+        "    result = []",
+        "    append = result.append",
+        loop,
+    ] + generator.lines + [
+        f"        append({result})",
+        "    return result",
+    ]
+    return "\n".join(lines), generator.namespace, attributes
+
+
+def compile_column_expression(expression: Expression) -> Optional[TypingTuple[Callable[..., List[Any]], List[str]]]:
+    """
+    Compile an expression tree into a generated column-at-a-time function.
+    Calling the function with the columns of the returned attributes (in that order) gives the list
+    of results, one per tuple. Memoized like compile_expression().
+    :param expression: Expression referencing at least one attribute
+    :return: Tuple (function, attributes of its parameters), or None if the expression cannot be
+             memoized (unhashable constant, opaque sub-expression): it is then evaluated node by node
+    """
+    cache_key = _structural_key(expression)
+    if cache_key is None:
+        return None
+    cache_key = ("columns", cache_key)
+
+    compiled = _compile_cache.get(cache_key)
+    if compiled is not None:
+        _compile_cache.move_to_end(cache_key)
+        return compiled
+
+    source, namespace, attributes = _generate_columns(expression)
+    code = intern_constants(compile(source, f"<pyhartig column expression {expression!r}>", "exec"))
+    exec(code, namespace)
+    compiled = namespace["evaluate_columns"], attributes
+
+    _compile_cache[cache_key] = compiled
+    if len(_compile_cache) > COMPILE_CACHE_SIZE:
+        _compile_cache.popitem(last=False)
+    return compiled
+
+
+def compile_expression(expression: Expression, schema: Optional[FrozenSet[str]] = None,
+                       overlay_attributes: Optional[FrozenSet[str]] = None) -> Callable[[MappingTuple], Any]:
+    """
+    Compile an expression tree into a generated Python function.
+    Structurally identical expressions compiled against the same attributes share the generated
+    function (LRU, COMPILE_CACHE_SIZE entries), so the code is generated and compiled only once.
+    :param expression: Expression to compile
+    :param schema: Attributes defined in every evaluated tuple (None: unknown)
+    :param overlay_attributes: If given, the function only accepts ChainedMappingTuple overlays whose
+                               extras define these attributes (e.g. the attributes added by a fused
+                               Extend chain), and reads their dictionaries directly
+    :return: Callable equivalent to expression.evaluate()
+    """
+    cache_key = _structural_key(expression)
+    if cache_key is not None:
+        # Only the schema (and overlay) attributes referenced by the expression change the generated code
+        cache_key = (
+            cache_key,
+            expression.attrs() & schema if schema is not None else frozenset(),
+            expression.attrs() & overlay_attributes if overlay_attributes is not None else None
+        )
+        evaluate = _compile_cache.get(cache_key)
+        if evaluate is not None:
+            _compile_cache.move_to_end(cache_key)
+            return evaluate
+
+    source, namespace = _generate(expression, schema, overlay_attributes)
+    code = intern_constants(compile(source, f"<pyhartig expression {expression!r}>", "exec"))
+    exec(code, namespace)
+    evaluate = namespace["evaluate"]
+
+    if cache_key is not None:
+        _compile_cache[cache_key] = evaluate
+        if len(_compile_cache) > COMPILE_CACHE_SIZE:
+            _compile_cache.popitem(last=False)
+    return evaluate
@@ -1,8 +1,57 @@
-from typing import Union
+from functools import lru_cache
+from itertools import repeat
+from typing import Union, Optional, List, Callable, Dict
+import logging
+import os
+import re
+import sys
 import urllib.parse
 
 from pyhartig.algebra.Tuple import EPSILON, _Epsilon, AlgebraicValue
-from pyhartig.algebra.Terms import IRI, Literal
+from pyhartig.algebra.Terms import IRI, Literal, XSD_STRING
+
+logger = logging.getLogger(__name__)
+
+# Default number of distinct lexical forms memoized by to_iri / to_literal / concat
+DEFAULT_TERM_CACHE_SIZE = 65536
+
+
+def _term_cache_size() -> int:
+    """
+    Read the size of the term caches from the PYHARTIG_TERM_CACHE_SIZE environment variable.
+    :return: The configured size (0 disables the memoization), or DEFAULT_TERM_CACHE_SIZE if unset or invalid
+    """
+    configured = os.environ.get("PYHARTIG_TERM_CACHE_SIZE", "").strip()
+    if not configured:
+        return DEFAULT_TERM_CACHE_SIZE
+    try:
+        size = int(configured)
+    except ValueError:
+        size = -1
+    if size < 0:
+        logger.warning("Invalid PYHARTIG_TERM_CACHE_SIZE %r (expected a non-negative integer), using %d",
+                       configured, DEFAULT_TERM_CACHE_SIZE)
+        return DEFAULT_TERM_CACHE_SIZE
+    return size
+
+
+# Maximum number of distinct lexical forms memoized by to_iri / to_literal / concat
+# (PYHARTIG_TERM_CACHE_SIZE=0 disables the memoization)
+TERM_CACHE_SIZE = _term_cache_size()
+
+# Relative reference made of a single path segment (no '/', '?', '#', ':' or ';' parameters)
+_SIMPLE_RELATIVE = re.compile(r"[A-Za-z0-9_\-.~%!$&'()*+,=@]+")
+
+def pure(function: Callable) -> Callable:
+    """
+    Mark an extension function as pure: its result only depends on its arguments, without side
+    effects. FunctionCall memoizes the results of pure functions per distinct arguments.
+    :param function: Function to mark
+    :return: The function itself
+    """
+    function._pure = True
+    return function
+
 
 def _to_string(value: AlgebraicValue) -> Union[str, None]:
     """
@@ -10,7 +59,18 @@ def _to_string(value: AlgebraicValue) -> Union[str, None]:
     :param value: Value to convert
     :return: String representation or None if conversion is not possible
     """
-    # Check for primitive types
+    # Fast paths on the exact type (no MRO walk), native strings first
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is Literal:
+        return value.lexical_form
+    if value_type is IRI:
+        return value.value
+    if value_type is int or value_type is float or value_type is bool:
+        return str(value)
+
+    # Subclasses: check for primitive types
     if isinstance(value, str):
         return value
     if isinstance(value, (int, float, bool)):
@@ -24,6 +84,7 @@ def _to_string(value: AlgebraicValue) -> Union[str, None]:
     return None
 
 
+@pure
 def to_iri(value: AlgebraicValue, base: str = None) -> Union[IRI, _Epsilon]:
     """
     Convert a AlgebraicValue to an IRI, resolving against a base if provided.
@@ -32,7 +93,7 @@ def to_iri(value: AlgebraicValue, base: str = None) -> Union[IRI, _Epsilon]:
     :return: IRI or EPSILON if conversion is not possible
     """
     # Handle EPSILON and None cases
-    if value is None or value == EPSILON:
+    if value is None or value is EPSILON:
         return EPSILON
 
     lex = _to_string(value)
@@ -41,20 +102,127 @@ def to_iri(value: AlgebraicValue, base: str = None) -> Union[IRI, _Epsilon]:
     if lex is None:
         return EPSILON
 
+    # Memoize only hashable (string) bases
+    if base is None or type(base) is str:
+        return _to_iri_cached(lex, base)
+    return _build_iri(lex, base)
+
+
+def _build_iri(lex: str, base: Optional[str]) -> Union[IRI, _Epsilon]:
+    """
+    Build the IRI of a lexical form (pure function, see _to_iri_cached()).
+    :param lex: Lexical form of the value
+    :param base: Optional base IRI for resolution
+    :return: IRI or EPSILON if the lexical form is not a valid IRI
+    """
     # Check if lexical form is already an IRI (simplified check)
     if ":" in lex:
         # Presume it's a valid IRI
-        return IRI(lex)
+        return IRI(sys.intern(str(lex)))
 
     # Resolve against base if provided
     if base:
+        # Fast path: appending a single segment to a directory-like base needs no parsing
+        if (_SIMPLE_RELATIVE.fullmatch(lex) and lex != "." and lex != ".."
+                and _is_directory_base(base)):
+            return IRI(sys.intern(base + lex))
+
         resolved = urllib.parse.urljoin(base, lex)
-        return IRI(resolved)
+        # Only strings can be interned (urljoin returns a non-string base as is for an empty lex)
+        return IRI(sys.intern(resolved) if type(resolved) is str else resolved)
 
     # If no base is provided and lexical form is not a valid IRI, return EPSILON
     return EPSILON
 
 
+# _build_iri() memoized on (lex, base), for string bases (or None)
+_to_iri_cached = lru_cache(maxsize=TERM_CACHE_SIZE)(_build_iri)
+
+
+@lru_cache(maxsize=256)
+def _is_directory_base(base: str) -> bool:
+    """
+    Check whether resolving a single path segment against a base amounts to appending it.
+    :param base: Base IRI
+    :return: True if urljoin(base, segment) == base + segment
+    """
+    return (
+        type(base) is str
+        and base.endswith("/")
+        and "?" not in base
+        and "#" not in base
+        and urllib.parse.urljoin(base, "segment") == base + "segment"
+    )
+
+
+def to_iri_batch(values: List[AlgebraicValue], bases: List[Optional[str]] = None) -> List[Union[IRI, _Epsilon]]:
+    """
+    Column version of to_iri: convert a whole column of values to IRIs.
+    When the base is the same for the whole column and directory-like, and the column holds native
+    strings only (or native integers only), each distinct value is converted once (single-segment
+    values are appended to the base directly) and its occurrences share the same IRI; otherwise
+    every value goes through to_iri.
+    :param values: Column of values to convert
+    :param bases: Column of base IRIs (optional)
+    :return: Column of IRIs (EPSILON where conversion is not possible)
+    """
+    if bases is None:
+        bases = [None] * len(values)
+
+    base = bases[0] if bases else None
+    uniform_base = (
+        # Same base string for the whole column (e.g. a Constant), counted at C level
+        type(base) is str and bases.count(base) == len(bases) and _is_directory_base(base)
+    )
+
+    if uniform_base:
+        try:
+            # Distinct values of the column (in C, no Python loop)
+            distinct = dict.fromkeys(values)
+        except TypeError:
+            # Unhashable value (e.g. a JSON array)
+            distinct = None
+
+        # Native integers only (e.g. numeric identifiers; the types of all the values are checked,
+        # as 1, 1.0 and True are the same key): their decimal forms are always single segments, so
+        # the memoized IRIs of the column are looked up by C-level maps, without a Python loop
+        if distinct is not None and set(map(type, values)) == {int}:
+            iris = map(_to_iri_cached, map(str, distinct), repeat(base))
+            return list(map(dict(zip(distinct, iris)).__getitem__, values))
+
+        # Native strings only: equal values of other types (1, 1.0, True) may not convert equally
+        if distinct is not None and set(map(type, distinct)) == {str}:
+            # The lexical form of a string is the string itself: the memoized IRIs are looked up by
+            # C-level maps, and are the same objects in every execution and every branch
+            try:
+                iris = dict(zip(distinct, map(_to_iri_cached, distinct, repeat(base))))
+            except Exception:
+                # A value not convertible (e.g. malformed for urljoin) yields EPSILON, the others their IRI
+                iris = distinct
+                for value in distinct:
+                    try:
+                        iris[value] = _to_iri_cached(value, base)
+                    except Exception:
+                        iris[value] = EPSILON
+            # One IRI per distinct value, shared by all its occurrences
+            return list(map(iris.__getitem__, values))
+
+    results = []
+    append = results.append
+
+    for value, value_base in zip(values, bases):
+        if value_base is EPSILON:
+            append(EPSILON)
+        else:
+            try:
+                append(to_iri(value, value_base))
+            except Exception:
+                append(EPSILON)
+
+    return results
+
+
+@pure
 def to_literal(value: AlgebraicValue, datatype: str) -> Union[Literal, _Epsilon]:
     """
     Convert an AlgebraicValue to a Literal with the specified datatype.
@@ -63,34 +231,155 @@ def to_literal(value: AlgebraicValue, datatype: str) -> Union[Literal, _Epsilon]
     :return: Literal or EPSILON if conversion is not possible
     """
     # Handle EPSILON and None cases
-    if value is None or value == EPSILON:
+    if value is None or value is EPSILON:
         return EPSILON
 
-    lex = str(value)
+    # Compute the lexical form once, dispatching on the exact type first
+    value_type = type(value)
+    if value_type is str:
+        lex = value
     # Extract lexical form from RDF Terms
-    if isinstance(value, Literal):
+    elif value_type is Literal or isinstance(value, Literal):
         lex = value.lexical_form
-    # Handle BlankNode case (not convertible to Literal)
-    elif isinstance(value, IRI):
+    elif value_type is IRI or isinstance(value, IRI):
         lex = value.value
-    elif isinstance(value, (int, float, bool)):
+    else:
         lex = str(value)
 
+    # Memoize only hashable (string) datatypes
+    if type(datatype) is str:
+        return _to_literal_cached(lex, datatype)
+    return Literal(lex, datatype)
+
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _to_literal_cached(lex: str, datatype: str) -> Literal:
+    """
+    Build the Literal of a lexical form (pure function, memoized on (lex, datatype)).
+    :param lex: Lexical form of the value
+    :param datatype: Datatype IRI for the Literal
+    :return: Literal
+    """
     return Literal(lex, datatype)
 
 
+@pure
 def concat(*args: AlgebraicValue) -> Union[Literal, _Epsilon]:
     """
     Concatenate multiple AlgebraicValues into a single string Literal.
     :param args: Values to concatenate
     :return: Literal with concatenated string or EPSILON if conversion is not possible
     """
+    # Fast path for the common binary case on native strings
+    if len(args) == 2 and type(args[0]) is str and type(args[1]) is str:
+        return _to_literal_cached(args[0] + args[1], XSD_STRING)
+
+    # Native strings are appended as they are (no conversion call); CPython extends the result in
+    # place, which is faster than "".join() on the few arguments of a concat
     result_str = ""
     for val in args:
-        s = _to_string(val)
-        if s is None:
-            # If any argument is invalid/Epsilon, propagate error
-            return EPSILON
-        result_str += s
+        if type(val) is not str:
+            if val is EPSILON:
+                return EPSILON
+            val = _to_string(val)
+            if val is None:
+                # If any argument is invalid/Epsilon, propagate error
+                return EPSILON
+        result_str += val
+
+    return _to_literal_cached(result_str, XSD_STRING)
+
+
+def to_literal_batch(values: List[AlgebraicValue], datatypes: List[str]) -> List[Union[Literal, _Epsilon]]:
+    """
+    Column version of to_literal: convert a whole column of values to Literals.
+    When the datatype is the same string for the whole column, the lexical forms of strings and
+    Literals are looked up in the Literal cache directly; any other value goes through to_literal.
+    :param values: Column of values to convert
+    :param datatypes: Column of datatype IRIs
+    :return: Column of Literals (EPSILON where conversion is not possible)
+    """
+    datatype = datatypes[0] if datatypes else None
+    # Same datatype string for the whole column (e.g. a Constant), counted at C level
+    uniform_datatype = type(datatype) is str and datatypes.count(datatype) == len(datatypes)
+
+    results = []
+    append = results.append
+    to_literal_cached = _to_literal_cached
+
+    for value, value_datatype in zip(values, datatypes):
+        if uniform_datatype and type(value) is str:
+            append(to_literal_cached(value, datatype))
+        elif uniform_datatype and type(value) is Literal:
+            append(to_literal_cached(value.lexical_form, datatype))
+        elif value is EPSILON or value_datatype is EPSILON:
+            append(EPSILON)
+        else:
+            try:
+                append(to_literal(value, value_datatype))
+            except Exception:
+                append(EPSILON)
+
+    return results
+
+
+def concat_batch(*columns: List[AlgebraicValue]) -> List[Union[Literal, _Epsilon]]:
+    """
+    Column version of concat: concatenate the values of several columns, row by row.
+    Values are converted to their lexical forms column by column, then all the rows are joined by
+    a single map over the zipped columns (row by row only if a value has no lexical form).
+    :param columns: Columns of values to concatenate (at least one)
+    :return: Column of string Literals (EPSILON where conversion is not possible)
+    """
+    if not columns:
+        # No column to take the number of rows from
+        raise TypeError("concat_batch() requires at least one column")
+
+    # Lexical forms, column by column (None for EPSILON and values without a lexical form);
+    # columns of native strings (checked in C) are used as they are
+    lexical_columns = [
+        column if set(map(type, column)) == {str}
+        else [value if type(value) is str else _to_string(value) for value in column]
+        for column in columns
+    ]
+
+    try:
+        # Whole column at once: rows joined and Literals looked up by C-level map loops
+        return list(map(_to_literal_cached, map("".join, zip(*lexical_columns)), repeat(XSD_STRING)))
+    except TypeError:
+        # A value has no lexical form (str.join only accepts strings): row by row below
+        pass
+
+    results = []
+    append = results.append
+    to_literal_cached = _to_literal_cached
+    join = "".join
+
+    for lexical_forms in zip(*lexical_columns):
+        try:
+            lex = join(lexical_forms)
+        except TypeError:
+            # A value has no lexical form (str.join only accepts strings)
+            append(EPSILON)
+        else:
+            append(to_literal_cached(lex, XSD_STRING))
+
+    return results
+
+
+def clear_term_caches() -> None:
+    """
+    Empty the memoized IRIs and Literals of to_iri / to_literal / concat.
+    :return: None
+    """
+    _to_iri_cached.cache_clear()
+    _to_literal_cached.cache_clear()
 
-    return Literal(result_str, "http://www.w3.org/2001/XMLSchema#string")
\ No newline at end of file
+# Column versions of the built-in functions, used by FunctionCall.evaluate_batch.
+# A kernel takes one list per argument and returns one result per tuple, with the same
+# semantics as applying the function tuple by tuple (EPSILON propagation included).
+BATCH_KERNELS: Dict[Callable, Callable[..., List]] = {
+    to_iri: to_iri_batch,
+    to_literal: to_literal_batch,
+    concat: concat_batch,
+}
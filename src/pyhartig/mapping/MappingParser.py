@@ -1,3 +1,6 @@
+import json
+import logging
+
 import rdflib
 from rdflib import Graph, URIRef, Literal, BNode, Namespace, Node
 from typing import List, Dict, Set, Any
@@ -12,13 +15,15 @@ from pyhartig.expressions.Constant import Constant
 from pyhartig.expressions.Reference import Reference
 from pyhartig.expressions.FunctionCall import FunctionCall
 from pyhartig.functions.builtins import to_iri, to_literal, concat
-from pyhartig.algebra.Terms import IRI as AlgebraIRI, Literal as AlgebraLiteral
+from pyhartig.algebra.Terms import IRI as AlgebraIRI, Literal as AlgebraLiteral, XSD_STRING
 
 RR = Namespace("http://www.w3.org/ns/r2rml#")
 RML = Namespace("http://semweb.mmlab.be/ns/rml#")
 QL = Namespace("http://semweb.mmlab.be/ns/ql#")
 RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 
+logger = logging.getLogger(__name__)
+
 
 class MappingParser:
     """
@@ -47,6 +52,9 @@ class MappingParser:
         # Initialize an empty list to hold the operators for each Triples Map
         S: List[Operator] = []
 
+        # JSON data of the logical sources, loaded once per file
+        loaded_sources: Dict[str, Any] = {}
+
         # We find all resources typed as rr:TriplesMap or having a logicalSource
         triples_maps = set(self.graph.subjects(RDF.type, RR.TriplesMap))
         triples_maps.update(self.graph.subjects(RML.logicalSource, None))
@@ -62,13 +70,7 @@ class MappingParser:
             source_file = self.graph.value(ls_node, RML.source)
             iterator = self.graph.value(ls_node, RML.iterator)
 
-            import json
-            try:
-                with open(str(source_file), 'r') as f:
-                    raw_data = json.load(f)
-            except FileNotFoundError:
-                print(f"[WARNING] Source file not found: {source_file}")
-                raw_data = {}
+            raw_data = self._load_json_source(str(source_file), loaded_sources)
 
             q = str(iterator) if iterator else "$"
 
@@ -268,6 +270,29 @@ class MappingParser:
                 """
         self.graph.update(q7)
 
+    @staticmethod
+    def _load_json_source(source_file: str, loaded_sources: Dict[str, Any]) -> Any:
+        """
+        Loads the JSON data of a logical source, once per file.
+        Triples Maps reading the same file share the parsed data: a single copy is kept in memory
+        (each source still runs its own queries on every execution).
+        :param source_file: Path to the JSON file.
+        :param loaded_sources: Data already loaded during this parse, by file path.
+        :return: The parsed JSON data (an empty object if the file is not found).
+        """
+        if source_file in loaded_sources:
+            return loaded_sources[source_file]
+
+        try:
+            with open(source_file, 'r') as f:
+                raw_data = json.load(f)
+        except FileNotFoundError:
+            logger.warning("Source file not found: %s", source_file)
+            raw_data = {}
+
+        loaded_sources[source_file] = raw_data
+        return raw_data
+
     def _extract_queries(self, tm: Node) -> Dict[str, str]:
         """
         Extracts all query parameters from the Triples Map's subject map.
@@ -331,7 +356,7 @@ class MappingParser:
             if term_type == RR.IRI:
                 return FunctionCall(to_iri, [ref_expr])
             else:
-                return FunctionCall(to_literal, [ref_expr, Constant("http://www.w3.org/2001/XMLSchema#string")])
+                return FunctionCall(to_literal, [ref_expr, Constant(XSD_STRING)])
 
         # Line 5: Template
         tmpl = self.graph.value(term_map, RR.template)
@@ -360,7 +385,7 @@ class MappingParser:
 
             if term_type == RR.IRI:
                 return FunctionCall(to_iri, [concat_expr])
-            return FunctionCall(to_literal, [concat_expr, Constant("http://www.w3.org/2001/XMLSchema#string")])
+            return FunctionCall(to_literal, [concat_expr, Constant(XSD_STRING)])
 
         return Constant(AlgebraIRI("http://error"))
 
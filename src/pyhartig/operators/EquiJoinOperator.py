@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Tuple as TypingTuple
+from itertools import chain
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple as TypingTuple
 
 from pyhartig.algebra.Tuple import MappingTuple
 from pyhartig.operators.Operator import Operator
@@ -48,51 +49,57 @@ class EquiJoinOperator(Operator):
         # J = { (a₁, a₂) | a₁ ∈ A, a₂ ∈ B } - the join condition pairs
         self.join_conditions: List[TypingTuple[str, str]] = list(zip(A, B))
 
-    def execute(self) -> List[MappingTuple]:
+    def execute_iter(self) -> Iterator[MappingTuple]:
         """
-        Executes the Equi-Join logic.
+        Executes the Equi-Join logic lazily.
 
         I = { t₁ ∪ t₂ | t₁ ∈ I₁, t₂ ∈ I₂, ∀(a₁, a₂) ∈ J : t₁(a₁) = t₂(a₂) }
 
         For each pair of tuples (t₁, t₂) from the two relations, if all join
         conditions are satisfied, the tuples are merged into a single result tuple.
+        Only I₂ is materialized: the tuples of I₁ are pulled one at a time.
 
-        :return: A list of MappingTuples resulting from the equi-join.
+        :return: An iterator of MappingTuples resulting from the equi-join.
         :raises ValueError: If the attribute sets of the two relations are not disjoint.
         """
-        # Execute child operators to get I₁ and I₂
-        left_tuples = self.left_operator.execute()
-        right_tuples = self.right_operator.execute()
+        # Same evaluation order as the materialized join: the left child operator starts first
+        # (its first tuple is pulled before I₂), so that its errors are raised before the right ones
+        left_tuples = iter(self.left_operator._pull_iter())
+        first = next(left_tuples, None)
 
-        # Handle empty relations
-        if not left_tuples or not right_tuples:
-            return []
-
-        # Verify disjoint attribute sets: A₁ ∩ A₂ = ∅
-        # Use first tuple from each side to determine attribute sets
-        if left_tuples and right_tuples:
-            left_attrs = set(left_tuples[0].keys())
-            right_attrs = set(right_tuples[0].keys())
-            common_attrs = left_attrs & right_attrs
+        # Execute the right child operator to get I₂ (scanned once per tuple of I₁)
+        right_tuples = self.right_operator._pull_list()
 
-            if common_attrs:
-                raise ValueError(
-                    f"EquiJoinOperator: Attribute sets must be disjoint (A₁ ∩ A₂ = ∅). "
-                    f"Common attributes found: {common_attrs}"
-                )
+        # Handle empty relations
+        if first is None:
+            return
+        if not right_tuples:
+            # I₁ is still evaluated entirely, so that its errors are not hidden
+            for _ in left_tuples:
+                pass
+            return
 
-        result_tuples = []
+        right_attrs = None
 
         # Nested loop join: for each t₁ ∈ I₁, for each t₂ ∈ I₂
-        for t1 in left_tuples:
+        for t1 in chain((first,), left_tuples):
+            # Verify disjoint attribute sets: A₁ ∩ A₂ = ∅
+            # Use first tuple from each side to determine attribute sets
+            if right_attrs is None:
+                right_attrs = set(right_tuples[0].keys())
+                common_attrs = set(t1.keys()) & right_attrs
+
+                if common_attrs:
+                    raise ValueError(
+                        f"EquiJoinOperator: Attribute sets must be disjoint (A₁ ∩ A₂ = ∅). "
+                        f"Common attributes found: {common_attrs}"
+                    )
+
             for t2 in right_tuples:
                 # Check join condition: ∀(a₁, a₂) ∈ J : t₁(a₁) = t₂(a₂)
                 if self._satisfies_join_condition(t1, t2):
                     # Merge tuples: t₁ ∪ t₂
-                    merged_tuple = t1.merge(t2)
-                    result_tuples.append(merged_tuple)
-
-        return result_tuples
+                    yield t1.merge(t2)
 
     def _satisfies_join_condition(self, t1: MappingTuple, t2: MappingTuple) -> bool:
         """
@@ -115,6 +122,24 @@ class EquiJoinOperator(Operator):
 
         return True
 
+    def owns_output(self) -> bool:
+        """
+        Every joined tuple t₁ ∪ t₂ is a new tuple (merge() copies both sides).
+        :return: True, unless a subclass overrides execute_iter()
+        """
+        return type(self).execute_iter is EquiJoinOperator.execute_iter
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes of both joined relations (A = A₁ ∪ A₂).
+        :return: Set of attribute names, or None if the schema of either side is unknown
+        """
+        left_schema = self.left_operator.schema()
+        right_schema = self.right_operator.schema()
+        if left_schema is None or right_schema is None:
+            return None
+        return left_schema | right_schema
+
     def explain(self, indent: int = 0, prefix: str = "") -> str:
         """
         Generate a human-readable explanation of the EquiJoin operator.
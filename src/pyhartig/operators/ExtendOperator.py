@@ -1,7 +1,12 @@
-from typing import List, Dict, Any
+import sys
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List, Optional, Tuple as TypingTuple
 from pyhartig.operators.Operator import Operator
-from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.operators.SourceOperator import SourceOperator
+from pyhartig.algebra.Tuple import MappingTuple, ChainedMappingTuple, EPSILON
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 from pyhartig.expressions.Expression import Expression
+from pyhartig.expressions.Reference import Reference
+from pyhartig.expressions._codegen import compile_expression
 
 
 class ExtendOperator(Operator):
@@ -19,34 +24,324 @@ class ExtendOperator(Operator):
         :return: None
         """
         super().__init__()
-        self.parent_operator = parent_operator
-        self.new_attribute = new_attribute
-        self.expression = expression
+        # Read-only (see the properties below): the compiled closures and the fused chain are derived from them
+        self._parent_operator = parent_operator
+        # Interned, like the attribute names of References and of the generated code
+        self._new_attribute = sys.intern(new_attribute)
+        self._expression = expression
+        # Constant expression (e.g. a Constant): same value for every tuple, computed once per execution
+        self._is_constant = expression.is_constant()
+        # Plain reference (a := b): the value is looked up directly in each input tuple, without a call
+        self._alias = expression.attribute_name if type(expression) is Reference else None
+        # Chain of directly nested Extend operators ending with this one, absorbed at construction
+        # (exact type check: subclasses may override execute_iter()); executed in a single pass
+        parent_chain = parent_operator._chain if type(parent_operator) is ExtendOperator else ()
+        self._chain: TypingTuple['ExtendOperator', ...] = parent_chain + (self,)
+        # In the fused chain, phi reading attributes added earlier in the chain is evaluated on the overlay
+        # of the chain: compiled to read the extras and parent dictionaries of the overlay directly
+        self._added = frozenset(extend.new_attribute for extend in parent_chain)
+        # Compiled closures, by schema of the parent operator (see _closures()); compiled once here
+        self._compiled: Dict[Optional[FrozenSet[str]], TypingTuple[Callable[[MappingTuple], Any], Any]] = {}
+        self._closures()
+
+    def _closures(self) -> TypingTuple[Callable[[MappingTuple], Any], Optional[Callable[[MappingTuple], Any]]]:
+        """
+        Closures of the expression, compiled against the current schema of the parent operator.
+        The schema is resolved when an execution starts (the parent relation may have changed since
+        the construction, e.g. a child appended to a Union); compilations are memoized per schema.
+        :return: Tuple (phi evaluated on the input tuples, phi evaluated on the overlay of the chain or None
+                 if it reads no attribute added earlier in the chain)
+        """
+        schema = self._parent_operator.schema()
+        closures = self._compiled.get(schema)
+        if closures is None:
+            expression = self._expression
+            added = self._added
+            # Closure compiled against the attributes known to be defined, evaluated once per tuple
+            closures = self._compiled[schema] = (
+                expression.compile(schema),
+                compile_expression(expression, schema, added) if expression.may_read(added) else None
+            )
+        return closures
+
+    @property
+    def parent_operator(self) -> Operator:
+        """
+        The operator that provides the input relation (r).
+        :return: Parent operator
+        """
+        return self._parent_operator
+
+    @property
+    def new_attribute(self) -> str:
+        """
+        The name of the new attribute (a).
+        :return: Attribute name
+        """
+        return self._new_attribute
+
+    @property
+    def expression(self) -> Expression:
+        """
+        The expression evaluated for each tuple (phi).
+        Read-only: it is compiled at construction; build a new ExtendOperator to change it.
+        :return: Expression
+        """
+        return self._expression
+
+    def _fused_assignments(self) -> TypingTuple[Operator, List[TypingTuple[str, Callable[[MappingTuple], Any]]]]:
+        """
+        Collect the compiled assignments of the chain of Extend operators ending with this one.
+        :return: Tuple (first operator of the chain that is not an Extend, ordered (a_i, compiled phi_i) pairs)
+        """
+        source, assignments = self._fused_chain()
+        return source, [(new_attribute, phi) for new_attribute, phi, _ in assignments]
+
+    def _fused_chain(self) -> TypingTuple[Operator, List[TypingTuple[str, Callable[[MappingTuple], Any], bool]]]:
+        """
+        Collect the chain of Extend operators ending with this one.
+        :return: Tuple (first operator of the chain that is not an Extend,
+                 ordered (a_i, compiled phi_i, phi_i only reads attributes of that operator) triples)
+        """
+        assignments = []
+        added = set()
+        for extend in self._chain:
+            reads_input = not extend.expression.may_read(added)
+            phi, chain_phi = extend._closures()
+            assignments.append((extend.new_attribute, phi if reads_input else chain_phi, reads_input))
+            added.add(extend.new_attribute)
+        return self._chain[0].parent_operator, assignments
 
     def execute(self) -> List[MappingTuple]:
         """
-        Executes the Extend logic.
+        Execute the Extend operator and return a list of MappingTuple results.
+        A chain of Extend operators over a source is evaluated column by column (the source
+        produces column batches natively), then converted back to tuples once.
+        :return: List of MappingTuple
+        """
+        source, _ = self._fused_assignments()
+        if isinstance(source, SourceOperator) and self._overriding(("execute_batched", "execute_iter")) == "execute_batched":
+            return ColumnBatch.to_tuple_list(self.execute_batched())
+        return super().execute()
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Executes the Extend logic lazily.
         r' = { t U {a -> eval(phi, t)} | t in r }
-        :return: A list of extended MappingTuples.
+        A chain of Extend operators is executed in a single pass over the input relation, writing into
+        the input tuples when they are referenced by nothing else (see Operator.owns_output()).
+        :return: An iterator of extended MappingTuples.
+        """
+        if self._chain[0].parent_operator._pull_owns_output():
+            return self._execute_in_place()
+        if type(self.parent_operator) is ExtendOperator:
+            return self._execute_fused()
+        if self._is_constant:
+            return self._execute_constant()
+        if self._alias is not None:
+            return self._execute_alias()
+        return self._execute_single()
+
+    def _execute_in_place(self) -> Iterator[MappingTuple]:
+        """
+        Executes the chain of Extend operators over an input relation whose tuples are referenced by
+        nothing else (see Operator.owns_output()), writing the new attributes into the input tuples.
+        :return: An iterator of the extended input MappingTuples.
         """
+        # Every expression is evaluated on the tuple being extended: the closures compiled against the
+        # schema of their own parent (not the ones reading the overlay of the chain)
+        constants, assignments = self._hoist_constants(
+            [(extend.new_attribute, extend._closures()[0], True) for extend in self._chain],
+            [extend.expression for extend in self._chain]
+        )
+        return self._extend_in_place(self._chain[0].parent_operator, constants, assignments)
 
-        # Get input tuples from parent
-        parent_rows = self.parent_operator.execute()
+    @staticmethod
+    def _extend_in_place(parent: Operator, constants: Dict[str, Any],
+                         assignments: List[TypingTuple[str, Callable[[MappingTuple], Any], bool]]) -> Iterator[MappingTuple]:
+        """
+        Write the new attributes into each tuple of the parent operator (or the extras of an input
+        overlay) instead of a new overlay: valid only when the parent operator owns its output.
+        :param parent: Operator producing the input tuples
+        :param constants: Values of the constant assignments (see _hoist_constants())
+        :param assignments: Ordered (a_i, compiled phi_i, reads_input) triples, phi_i evaluated on the extended tuple
+        :return: An iterator of the extended input MappingTuples.
+        """
+        if not assignments and type(parent).execute_iter is SourceOperator.execute_iter \
+                and parent._overriding(("execute_iter", "execute")) == "execute_iter":
+            # Constant expressions only: the tuples are built by the source with their values
+            return parent.execute_iter_extended(constants)
+        return ExtendOperator._extend_rows_in_place(parent, constants, assignments)
+
+    @staticmethod
+    def _extend_rows_in_place(parent: Operator, constants: Dict[str, Any],
+                              assignments: List[TypingTuple[str, Callable[[MappingTuple], Any], bool]]) -> Iterator[MappingTuple]:
+        """
+        Write the new attributes into each tuple of the parent operator, one tuple at a time.
+        :param parent: Operator producing the input tuples
+        :param constants: Values of the constant assignments
+        :param assignments: Ordered (a_i, compiled phi_i, reads_input) triples
+        :return: An iterator of the extended input MappingTuples.
+        """
+        chained = ChainedMappingTuple
+        # dict-level write: no per-tuple attribute name check (MappingTuple.__setitem__)
+        setitem = dict.__setitem__
 
-        new_rows = []
-        for row in parent_rows:
-            # Create a new tuple (copy) to avoid side effects on the parent data
-            new_row = MappingTuple(row)
+        for row in parent._pull_iter():
+            target = row.extras if type(row) is chained else row
+            if constants:
+                target.update(constants)
+            for new_attribute, phi, _ in assignments:
+                setitem(target, new_attribute, phi(row))
+            yield row
 
+    def _execute_single(self) -> Iterator[MappingTuple]:
+        """
+        Executes a single Extend operator.
+        :return: An iterator of extended MappingTuples.
+        """
+        # Pull input tuples from parent one at a time
+        # Hot loop: bind attributes to locals once
+        new_attribute = self.new_attribute
+        phi = self._closures()[0]
+        overlay = ChainedMappingTuple.overlay
+        for row in self.parent_operator._pull_iter():
             # Calculate the new value using the Expression system
-            computed_value = self.expression.evaluate(row)
+            computed_value = phi(row)
 
-            # Assign the new value to the new attribute
-            new_row[self.new_attribute] = computed_value
+            # Copy-on-write overlay: the parent tuple is shared, not copied
+            yield overlay(row, new_attribute, computed_value)
 
-            new_rows.append(new_row)
+    def _execute_constant(self) -> Iterator[MappingTuple]:
+        """
+        Executes a single Extend operator whose expression references no attribute.
+        :return: An iterator of extended MappingTuples.
+        """
+        # Evaluated once, outside of the loop: no expression call per tuple
+        new_attribute = self.new_attribute
+        value = self._closures()[0](MappingTuple())
+        chained = ChainedMappingTuple
+        for row in self.parent_operator._pull_iter():
+            # Same as ChainedMappingTuple.overlay(), inlined
+            if type(row) is chained:
+                extras = dict(row.extras)
+                extras[new_attribute] = value
+                yield chained(row.parent, extras)
+            else:
+                yield chained(row, {new_attribute: value})
 
-        return new_rows
+    def _execute_alias(self) -> Iterator[MappingTuple]:
+        """
+        Executes a single Extend operator whose expression is a plain reference to another attribute.
+        :return: An iterator of extended MappingTuples.
+        """
+        new_attribute = self.new_attribute
+        referenced = self._alias
+        parent_schema = self.parent_operator.schema()
+        # Same lookup as the compiled reference: EPSILON only if the attribute may be missing
+        defined = parent_schema is not None and referenced in parent_schema
+        chained = ChainedMappingTuple
+        for row in self.parent_operator._pull_iter():
+            value = row[referenced] if defined else row.get(referenced, EPSILON)
+            # Same as ChainedMappingTuple.overlay(), inlined
+            if type(row) is chained:
+                extras = dict(row.extras)
+                extras[new_attribute] = value
+                yield chained(row.parent, extras)
+            else:
+                yield chained(row, {new_attribute: value})
+
+    @staticmethod
+    def _hoist_constants(assignments: List[TypingTuple[str, Callable[[MappingTuple], Any], bool]],
+                         expressions: List[Expression]) -> TypingTuple[Dict[str, Any], list]:
+        """
+        Split the assignments of a fused sequence into the constant ones (see Expression.is_constant()),
+        evaluated once before the loop, and the others.
+        A constant assignment is hoisted only if no earlier assignment writes or reads its attribute;
+        otherwise it stays in place, but its value is still computed once (the closure only returns it).
+        :param assignments: Ordered (a_i, compiled phi_i, reads_input) triples
+        :param expressions: Expressions phi_i, in the same order
+        :return: Tuple (values of the hoisted attributes, remaining triples)
+        """
+        constants = {}
+        remaining = []
+        seen = set()
+        # Set once an earlier expression may read any attribute (unknown attributes)
+        reads_unknown = False
+        for (new_attribute, phi, reads_input), expression in zip(assignments, expressions):
+            if not expression.is_constant():
+                remaining.append((new_attribute, phi, reads_input))
+            elif new_attribute not in seen and not reads_unknown:
+                constants[new_attribute] = phi(MappingTuple())
+            else:
+                value = phi(MappingTuple())
+                remaining.append((new_attribute, lambda row, value=value: value, True))
+            seen.add(new_attribute)
+            referenced = expression.attrs()
+            if referenced is None:
+                reads_unknown = True
+            else:
+                seen.update(referenced)
+        return constants, remaining
+
+    def _execute_fused(self) -> Iterator[MappingTuple]:
+        """
+        Executes a chain of Extend operators in one pass (same as MultiExtendOperator).
+        :return: An iterator of extended MappingTuples.
+        """
+        source, assignments = self._fused_chain()
+        constants, assignments = self._hoist_constants(assignments, [extend.expression for extend in self._chain])
+        chained = ChainedMappingTuple
+
+        for row in source._pull_iter():
+            # Single overlay per tuple, shared by all the assignments of the chain
+            # (starting with the constant values)
+            if type(row) is chained:
+                extras = {**row.extras, **constants}
+                new_row = chained(row.parent, extras)
+            else:
+                extras = constants.copy()
+                new_row = chained(row, extras)
+
+            # Later expressions see the attributes added by the earlier ones; expressions reading
+            # none of them are evaluated on the input tuple itself (cheaper lookups than the overlay)
+            for new_attribute, phi, reads_input in assignments:
+                extras[new_attribute] = phi(row if reads_input else new_row)
+
+            yield new_row
+
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Executes the Extend logic on column batches.
+        The expression is evaluated once per batch (column at a time) instead of once per tuple.
+        A chain of Extend operators adds all its columns to a single batch per input batch.
+        :return: Iterator of extended ColumnBatch.
+        """
+        chain = self._chain
+        for batch in chain[0].parent_operator._pull_batched():
+            # The new batch shares the input columns; later expressions see the columns added before them
+            columns = dict(batch.columns)
+            extended = ColumnBatch(columns, len(batch))
+            for extend in chain:
+                columns[extend.new_attribute] = extend.expression.evaluate_batch(extended)
+            yield extended
+
+    def owns_output(self) -> bool:
+        """
+        The overlays are new objects; their parent tuples come from the parent operator.
+        :return: True if the parent operator owns its output (and execute_iter() is not overridden)
+        """
+        return type(self).execute_iter is ExtendOperator.execute_iter and self.parent_operator._pull_owns_output()
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes of the parent relation, plus the new attribute.
+        :return: Set of attribute names, or None if the schema of the parent is unknown
+        """
+        parent_schema = self.parent_operator.schema()
+        if parent_schema is None:
+            return None
+        return parent_schema | {self.new_attribute}
 
     def explain(self, indent: int = 0, prefix: str = "") -> str:
         """
@@ -0,0 +1,246 @@
+import copy
+import sys
+from typing import List, Dict, Any, FrozenSet, Iterator, Optional, Tuple as TypingTuple
+from pyhartig.operators.Operator import Operator
+from pyhartig.operators.ExtendOperator import ExtendOperator
+from pyhartig.operators.SourceOperator import SourceOperator
+from pyhartig.algebra.Tuple import MappingTuple, ChainedMappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
+from pyhartig.expressions.Expression import Expression
+from pyhartig.expressions._codegen import compile_expression
+
+
+class MultiExtendOperator(Operator):
+    """
+    Implements a fused sequence of Extend operators.
+    Extend(...Extend(r, a1, phi1)..., an, phin) evaluated in a single pass over the input relation.
+    """
+
+    def __init__(self, parent_operator: Operator, assignments: List[TypingTuple[str, Expression]]):
+        """
+        Initializes the MultiExtend operator.
+        :param parent_operator: The operator that provides the input relation (r)
+        :param assignments: Ordered list of (a_i, phi_i) pairs; phi_i may reference a_1, ..., a_(i-1)
+        :return: None
+        """
+        super().__init__()
+        self.parent_operator = parent_operator
+        # Attribute names interned, like the attribute names of References and of the generated code
+        # Read-only (see the property below): the compiled assignments are derived from them
+        self._assignments: TypingTuple[TypingTuple[str, Expression], ...] = tuple(
+            (sys.intern(new_attribute), expression) for new_attribute, expression in assignments
+        )
+        # Compiled assignments, by schema of the parent operator (see _compiled_assignments()); compiled once here
+        self._compiled: Dict[Optional[FrozenSet[str]], List[TypingTuple[str, Any, bool]]] = {}
+        self._compiled_assignments()
+
+    @property
+    def assignments(self) -> TypingTuple[TypingTuple[str, Expression], ...]:
+        """
+        The ordered (a_i, phi_i) pairs of the sequence (immutable: use extend() to append one).
+        :return: Tuple of (attribute name, expression) pairs
+        """
+        return self._assignments
+
+    def _compiled_assignments(self) -> List[TypingTuple[str, Any, bool]]:
+        """
+        Closures of the assignments, compiled against the current schema of the parent operator.
+        The schema is resolved when an execution starts (the parent relation may have changed since
+        the construction); compilations are memoized per schema.
+        :return: Ordered (a_i, compiled phi_i, phi_i reads no attribute added by a_1, ..., a_(i-1)) triples
+        """
+        parent_schema = self.parent_operator.schema()
+        compiled = self._compiled.get(parent_schema)
+        if compiled is None:
+            # Evaluated once per tuple; phi_i sees the parent attributes and a_1, ..., a_(i-1)
+            compiled = []
+            schema = parent_schema
+            for new_attribute, expression in self.assignments:
+                compiled.append(self._compile_assignment(new_attribute, expression, schema, compiled))
+                if schema is not None:
+                    schema = schema | {new_attribute}
+            self._compiled[parent_schema] = compiled
+        return compiled
+
+    @staticmethod
+    def _compile_assignment(new_attribute: str, expression: Expression, schema,
+                            previous: List[TypingTuple[str, Any, bool]]) -> TypingTuple[str, Any, bool]:
+        """
+        Compile one assignment of the sequence.
+        :param new_attribute: Attribute a_i
+        :param expression: Expression phi_i
+        :param schema: Attributes defined in every tuple phi_i is evaluated on (None: unknown)
+        :param previous: Compiled assignments a_1, ..., a_(i-1)
+        :return: Triple (a_i, compiled phi_i, phi_i reads no attribute added by a_1, ..., a_(i-1))
+        """
+        added = frozenset(attribute for attribute, _, _ in previous)
+        if expression.may_read(added):
+            # Evaluated on the overlay of the sequence: reads its extras and parent dictionaries directly
+            return new_attribute, compile_expression(expression, schema, added), False
+        return new_attribute, expression.compile(schema), True
+
+    def extend(self, var_name: str, expression: Expression) -> 'MultiExtendOperator':
+        """
+        Fluent interface helper: append an assignment to the fused sequence.
+        The operator itself is left unchanged (it may be shared by other trees); the new operator
+        shares its parent and reuses its compiled expressions.
+        :param var_name: Name of the variable to extend
+        :param expression: Expression to compute the new value
+        :return: New MultiExtendOperator evaluating all the assignments in a single pass
+        """
+        # Interned, like the attribute names of __init__
+        var_name = sys.intern(var_name)
+        fused = copy.copy(self)
+        fused._assignments = self._assignments + ((var_name, expression),)
+        # The compiled assignments of every known parent schema are extended with the new one
+        fused._compiled = {}
+        for parent_schema, compiled in self._compiled.items():
+            schema = None if parent_schema is None else parent_schema | {attribute for attribute, _ in self.assignments}
+            fused._compiled[parent_schema] = compiled + [self._compile_assignment(var_name, expression, schema, compiled)]
+        return fused
+
+    def execute(self) -> List[MappingTuple]:
+        """
+        Execute the fused Extend logic and return a list of MappingTuple results.
+        Over a source, the assignments are evaluated column by column (the source produces column
+        batches natively), then converted back to tuples once.
+        :return: List of MappingTuple
+        """
+        if isinstance(self.parent_operator, SourceOperator) \
+                and self._overriding(("execute_batched", "execute_iter")) == "execute_batched":
+            return ColumnBatch.to_tuple_list(self.execute_batched())
+        return super().execute()
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Executes the fused Extend logic lazily.
+        r' = { t U {a1 -> eval(phi1, t)} U ... U {an -> eval(phin, t_(n-1))} | t in r }
+        Input tuples are never copied: the new attributes are written into the input tuples when the
+        parent operator owns its output, into a copy-on-write overlay otherwise.
+        :return: An iterator of extended MappingTuples.
+        """
+        expressions = [expression for _, expression in self.assignments]
+        if self.parent_operator._pull_owns_output():
+            # Input tuples referenced by nothing else: the new attributes are written into them
+            constants, compiled_assignments = self._hoist_constants(self._in_place_assignments(), expressions)
+            return self._extend_in_place(self.parent_operator, constants, compiled_assignments)
+        return self._execute_overlays(expressions)
+
+    def _in_place_assignments(self) -> List[TypingTuple[str, Any, bool]]:
+        """
+        Compiled assignments evaluated on the extended tuple itself (instead of the overlay of the sequence).
+        :return: Ordered (a_i, compiled phi_i, True) triples
+        """
+        assignments = []
+        schema = self.parent_operator.schema()
+        for (new_attribute, phi, reads_input), (_, expression) in zip(self._compiled_assignments(), self.assignments):
+            # Closures reading the overlay are compiled again (memoized) against the tuple schema
+            assignments.append((new_attribute, phi if reads_input else expression.compile(schema), True))
+            if schema is not None:
+                schema = schema | {new_attribute}
+        return assignments
+
+    def _execute_overlays(self, expressions: List[Expression]) -> Iterator[MappingTuple]:
+        """
+        Executes the fused Extend logic with one copy-on-write overlay per input tuple.
+        :param expressions: Expressions phi_i, in the order of the assignments
+        :return: An iterator of extended MappingTuples.
+        """
+        # Hot loop: bind attributes to locals once; constant expressions are evaluated once
+        constants, compiled_assignments = self._hoist_constants(self._compiled_assignments(), expressions)
+        chained = ChainedMappingTuple
+
+        for row in self.parent_operator._pull_iter():
+            # Single overlay per tuple, shared by all the assignments (starting with the constant values)
+            if type(row) is chained:
+                extras = {**row.extras, **constants}
+                new_row = chained(row.parent, extras)
+            else:
+                extras = constants.copy()
+                new_row = chained(row, extras)
+
+            # Later expressions see the attributes added by the earlier ones; expressions reading
+            # none of them are evaluated on the input tuple itself (cheaper lookups than the overlay)
+            for new_attribute, phi, reads_input in compiled_assignments:
+                extras[new_attribute] = phi(row if reads_input else new_row)
+
+            yield new_row
+
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Executes the fused Extend logic on column batches.
+        All the new columns are added to a single batch per input batch.
+        :return: Iterator of extended ColumnBatch.
+        """
+        for batch in self.parent_operator._pull_batched():
+            # The new batch shares the input columns; later expressions see the columns added before them
+            columns = dict(batch.columns)
+            extended = ColumnBatch(columns, len(batch))
+            for new_attribute, expression in self.assignments:
+                columns[new_attribute] = expression.evaluate_batch(extended)
+            yield extended
+
+    def owns_output(self) -> bool:
+        """
+        The overlays are new objects; their parent tuples come from the parent operator.
+        :return: True if the parent operator owns its output (and execute_iter() is not overridden)
+        """
+        return type(self).execute_iter is MultiExtendOperator.execute_iter and self.parent_operator._pull_owns_output()
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes of the parent relation, plus the new attributes.
+        :return: Set of attribute names, or None if the schema of the parent is unknown
+        """
+        parent_schema = self.parent_operator.schema()
+        if parent_schema is None:
+            return None
+        return parent_schema | {new_attribute for new_attribute, _ in self.assignments}
+
+    def explain(self, indent: int = 0, prefix: str = "") -> str:
+        """
+        Generate a human-readable explanation of the MultiExtend operator.
+        :param indent: Current indentation level
+        :param prefix: Prefix for tree structure (e.g., "├─", "└─")
+        :return: String representation of the operator tree
+        """
+        indent_str = "  " * indent
+        lines = [f"{indent_str}{prefix}MultiExtend("]
+
+        for new_attribute, expression in self.assignments:
+            lines.append(f"{indent_str}  {new_attribute}: {self._explain_expression(expression, indent + 2)}")
+
+        lines.append(f"{indent_str}  parent:")
+
+        # Recursive call to parent
+        parent_explanation = self.parent_operator.explain(indent + 2, "└─ ")
+        lines.append(parent_explanation)
+
+        lines.append(f"{indent_str})")
+
+        return "\n".join(lines)
+
+    def explain_json(self) -> Dict[str, Any]:
+        """
+        Generate a JSON-serializable explanation of the MultiExtend operator.
+        :return: Dictionary representing the operator tree structure
+        """
+        return {
+            "type": "MultiExtend",
+            "parameters": {
+                "assignments": [
+                    {
+                        "new_attribute": new_attribute,
+                        "expression": self._expression_to_json(expression)
+                    }
+                    for new_attribute, expression in self.assignments
+                ]
+            },
+            "parent": self.parent_operator.explain_json()
+        }
+
+    # Constant hoisting and expression rendering are shared with the Extend operator
+    _hoist_constants = staticmethod(ExtendOperator._hoist_constants)
+    _extend_in_place = staticmethod(ExtendOperator._extend_in_place)
+    _explain_expression = ExtendOperator._explain_expression
+    _expression_to_json = ExtendOperator._expression_to_json
@@ -1,23 +1,195 @@
 from abc import ABC, abstractmethod
-from typing import List, Any, TYPE_CHECKING, Dict
-from pyhartig.algebra.Tuple import MappingTuple
+from contextvars import ContextVar
+from functools import wraps
+from typing import List, Any, TYPE_CHECKING, Callable, Dict, FrozenSet, Iterator, Optional, Tuple as TypingTuple
+from pyhartig.algebra.Tuple import MappingTuple, ChainedMappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 
 if TYPE_CHECKING:
     from pyhartig.operators.ExtendOperator import ExtendOperator
 
+# Methods through which an operator is executed, by the user (root of a plan) or by a consuming operator
+_EXECUTION_METHODS = ("execute", "execute_iter", "execute_batched")
+
+# Whether an execution method is called by a consuming operator (see Operator._pull_iter())
+_pulling: ContextVar[bool] = ContextVar("pulling", default=False)
+
+# Token of the current execution of a plan, replaced by every call of an execution method at the root of a plan
+_execution: ContextVar[Optional[object]] = ContextVar("execution", default=None)
+
+
+def _current_execution() -> Optional[object]:
+    """
+    Token of the current execution of a plan: the same object for all the operators pulled by one call
+    of an execution method at the root of the plan (e.g. so that a shared subtree is evaluated once).
+    :return: Execution token (None before any execution)
+    """
+    return _execution.get()
+
+
+def _entry_point(method: Callable) -> Callable:
+    """
+    Wrap an execution method so that, called outside of the pulls of a consuming operator (at the root
+    of a plan), it starts a new execution (see _current_execution()).
+    :param method: Execution method defined by an operator class
+    :return: Wrapped method
+    """
+    @wraps(method)
+    def entry_point(self, *args, **kwargs):
+        if not _pulling.get():
+            _execution.set(object())
+        return method(self, *args, **kwargs)
+
+    entry_point._entry_point = True
+    return entry_point
+
 
 class Operator(ABC):
     """
     Abstract base class for all operators in the system.
+    Subclasses override execute() and/or execute_iter() (each one defaults to the other).
     """
 
-    @abstractmethod
+    def __new__(cls, *args, **kwargs):
+        """
+        Check that the operator class implements execute() or execute_iter() before instantiating it.
+        :raises TypeError: If neither execute() nor execute_iter() is overridden (they default to each other)
+        """
+        if cls.execute is Operator.execute and cls.execute_iter is Operator.execute_iter:
+            raise TypeError(f"Can't instantiate operator class {cls.__name__} "
+                            f"without an implementation of execute() or execute_iter()")
+        return super().__new__(cls)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Make the execution methods defined by an operator class start a new execution of the plan when
+        they are called at its root (see _current_execution()).
+        """
+        super().__init_subclass__(**kwargs)
+        for name in _EXECUTION_METHODS:
+            method = vars(cls).get(name)
+            if method is not None and not getattr(method, "_entry_point", False):
+                setattr(cls, name, _entry_point(method))
+
     def execute(self) -> List[MappingTuple]:
         """
         Execute the operator and return a list of MappingTuple results.
+        Materializes the tuples produced by execute_iter(), flattening copy-on-write overlays
+        (in place when the operator owns its output, see owns_output()).
         :return: List of MappingTuple
         """
-        pass
+        chained = ChainedMappingTuple
+        if self.owns_output():
+            # Overlay parents are referenced by nothing else: the extras are written into them (no copy)
+            return [row.to_mapping_tuple(True) if type(row) is chained else row for row in self.execute_iter()]
+        return [row.to_mapping_tuple() if type(row) is chained else row for row in self.execute_iter()]
+
+    def __iter__(self) -> Iterator[MappingTuple]:
+        """
+        Iterate over the results of execute() one tuple at a time, without materializing the relation
+        (e.g. to write the tuples out as they are produced): overlays are flattened one by one.
+        :return: Iterator of MappingTuple
+        """
+        chained = ChainedMappingTuple
+        reuse_parent = self.owns_output()
+        for row in self.execute_iter():
+            yield row.to_mapping_tuple(reuse_parent) if type(row) is chained else row
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Execute the operator lazily, producing one MappingTuple at a time.
+        Tuples may be ChainedMappingTuple overlays sharing data with the input tuples; they must not be modified.
+        Default implementation iterates over execute(); subclasses override at least one of the two.
+        :return: Iterator of MappingTuple
+        """
+        return iter(self.execute())
+
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Execute the operator and return its results as column batches.
+        Default implementation groups the results of execute_iter() into batches.
+        :return: Iterator of ColumnBatch
+        """
+        return ColumnBatch.from_tuples(self.execute_iter())
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes of every tuple produced by the operator, known at construction time.
+        Default implementation returns None (unknown, or not the same for every tuple).
+        :return: Set of attribute names, or None
+        """
+        return None
+
+    def _overriding(self, methods: TypingTuple[str, ...]) -> str:
+        """
+        Find which of the given execution methods is overridden last (closest to the class of the operator),
+        e.g. execute() in a subclass of an operator whose execute_iter() and execute_batched() do not call it.
+        :param methods: Method names, by order of preference when a class defines several of them
+        :return: Name of the method
+        """
+        for klass in type(self).__mro__:
+            for name in methods:
+                if name in vars(klass):
+                    return name
+        return methods[0]
+
+    def _pull_iter(self) -> Iterator[MappingTuple]:
+        """
+        Produce the tuples of the operator for a consuming operator: execute_iter(), unless a subclass
+        overrides execute() alone (its tuples are then the ones returned by execute()).
+        :return: Iterator of MappingTuple
+        """
+        pulling = _pulling.set(True)
+        try:
+            if self._overriding(("execute_iter", "execute")) == "execute":
+                return iter(self.execute())
+            return self.execute_iter()
+        finally:
+            _pulling.reset(pulling)
+
+    def _pull_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Produce the results of the operator as column batches for a consuming operator: execute_batched(),
+        unless a subclass overrides execute() or execute_iter() after it (see _pull_iter()).
+        :return: Iterator of ColumnBatch
+        """
+        if self._overriding(("execute_batched", "execute_iter", "execute")) != "execute_batched":
+            return ColumnBatch.from_tuples(self._pull_iter())
+        pulling = _pulling.set(True)
+        try:
+            return self.execute_batched()
+        finally:
+            _pulling.reset(pulling)
+
+    def _pull_list(self) -> List[MappingTuple]:
+        """
+        Produce the list of tuples of the operator for a consuming operator: execute(), unless a subclass
+        overrides execute_iter() alone (the tuples it produces are then materialized).
+        :return: List of MappingTuple
+        """
+        pulling = _pulling.set(True)
+        try:
+            if self._overriding(("execute", "execute_iter")) == "execute_iter":
+                return Operator.execute(self)
+            return self.execute()
+        finally:
+            _pulling.reset(pulling)
+
+    def _pull_owns_output(self) -> bool:
+        """
+        Whether the tuples produced by _pull_iter() can be modified in place by the consuming operator.
+        :return: False if the tuples come from an overridden execute(), owns_output() otherwise
+        """
+        return self._overriding(("execute_iter", "execute")) == "execute_iter" and self.owns_output()
+
+    def owns_output(self) -> bool:
+        """
+        Whether every tuple produced by execute_iter(), and the parent tuple of every overlay, is a new
+        object referenced by nothing else once produced (e.g. not replayed to several consumers).
+        Default implementation returns False (unknown).
+        :return: True if the produced tuples can be modified in place by their consumer
+        """
+        return False
 
     @abstractmethod
     def explain(self, indent: int = 0, prefix: str = "") -> str:
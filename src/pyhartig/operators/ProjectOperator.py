@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Set
+from typing import Dict, Any, FrozenSet, Set, Iterator
 
 from pyhartig.algebra.Tuple import MappingTuple
 from pyhartig.operators.Operator import Operator
@@ -29,9 +29,9 @@ class ProjectOperator(Operator):
         self.operator = operator
         self.attributes = set(attributes)
 
-    def execute(self) -> List[MappingTuple]:
+    def execute_iter(self) -> Iterator[MappingTuple]:
         """
-        Executes the Project logic.
+        Executes the Project logic lazily.
 
         I' = { t[P] | t ∈ I }
 
@@ -41,17 +41,22 @@ class ProjectOperator(Operator):
         Strict mode: Raises an exception if any attribute in P is not present in a tuple.
         This ensures conformance with classical relational algebra where P ⊆ A.
 
-        :return: A list of MappingTuples with only the specified attributes P.
+        :return: An iterator of MappingTuples with only the specified attributes P.
         :raises KeyError: If an attribute in P is not found in a tuple (strict mode).
         """
-        # Get input tuples from parent operator
-        parent_rows = self.operator.execute()
+        # Hot loop: bind attributes to locals once
+        attributes = self.attributes
+        mapping_tuple = MappingTuple
 
-        projected_rows = []
-        for row in parent_rows:
+        # P ⊆ A known at construction time: no per-tuple validation needed
+        child_schema = self.operator.schema()
+        checked = child_schema is None or not child_schema >= attributes
+
+        # Pull input tuples from parent operator one at a time
+        for row in self.operator._pull_iter():
             # Strict validation: ensure all attributes in P exist in the tuple
-            missing_attrs = self.attributes - set(row.keys())
-            if missing_attrs:
+            if checked and not row.keys() >= attributes:
+                missing_attrs = attributes - set(row.keys())
                 raise KeyError(
                     f"ProjectOperator: Attribute(s) {missing_attrs} not found in tuple. "
                     f"Available attributes: {set(row.keys())}. "
@@ -62,12 +67,23 @@ class ProjectOperator(Operator):
             # dom(t[P]) = P and for each a ∈ P: t[P](a) = t(a)
             projected_data = {
                 attr: row[attr]
-                for attr in self.attributes
+                for attr in attributes
             }
-            projected_row = MappingTuple(projected_data)
-            projected_rows.append(projected_row)
+            yield mapping_tuple(projected_data)
+
+    def owns_output(self) -> bool:
+        """
+        Every projected tuple t[P] is a new tuple.
+        :return: True, unless a subclass overrides execute_iter()
+        """
+        return type(self).execute_iter is ProjectOperator.execute_iter
 
-        return projected_rows
+    def schema(self) -> FrozenSet[str]:
+        """
+        Every projected tuple defines exactly the projected attributes.
+        :return: Set of the projected attribute names (P)
+        """
+        return frozenset(self.attributes)
 
     def explain(self, indent: int = 0, prefix: str = "") -> str:
         """
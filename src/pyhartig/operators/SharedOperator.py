@@ -0,0 +1,125 @@
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional
+
+from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
+from pyhartig.operators.Operator import Operator, _current_execution
+
+
+class SharedOperator(Operator):
+    """
+    Common subexpression of a plan: a subtree read by several operators, executed once for all of them.
+
+    The algebra is referentially transparent (eval(E) only depends on E and the data), so every
+    consumer of the subtree can read the same result. The first consumer materializes it, the others
+    replay it; once all the consumers have started, the result is released. The result belongs to a
+    single execution of the plan (see _current_execution() in pyhartig.operators.Operator): the next
+    execution evaluates the subtree again, even if the previous one stopped before all the consumers
+    started. The consumers receive the same tuple objects, which must not be modified (as for the
+    overlays of execute_iter()).
+    """
+
+    def __init__(self, parent_operator: Operator, consumers: int):
+        """
+        Initializes the Shared operator.
+        :param parent_operator: The shared subtree
+        :param consumers: Number of operators reading it in one execution of the plan
+        :return: None
+        """
+        super().__init__()
+        self.parent_operator = parent_operator
+        self.consumers = consumers
+        self._pending = consumers
+        self._execution: Optional[object] = None
+        self._rows: Optional[List[MappingTuple]] = None
+        self._batches: Optional[List[ColumnBatch]] = None
+
+    def _start(self) -> None:
+        """
+        Forget the results and the consumer count of another execution of the plan.
+        :return: None
+        """
+        execution = _current_execution()
+        if execution is not self._execution:
+            self._execution = execution
+            self._rows = None
+            self._batches = None
+            self._pending = self.consumers
+
+    def _release(self) -> None:
+        """
+        Count one more consumer; after the last one, forget the materialized results.
+        :return: None
+        """
+        self._pending -= 1
+        if self._pending <= 0:
+            self._rows = None
+            self._batches = None
+            self._pending = self.consumers
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Produce the tuples of the shared subtree, evaluated once per execution of the plan.
+        :return: Iterator of MappingTuple
+        """
+        self._start()
+        rows = self._rows
+        if rows is None:
+            rows = self._rows = list(self.parent_operator._pull_iter())
+        self._release()
+        return iter(rows)
+
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Produce the column batches of the shared subtree, evaluated once per execution of the plan.
+        Consumers add columns to new batches, the shared columns are never modified.
+        :return: Iterator of ColumnBatch
+        """
+        self._start()
+        batches = self._batches
+        if batches is None:
+            batches = self._batches = list(self.parent_operator._pull_batched())
+        self._release()
+        return iter(batches)
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes of the shared subtree.
+        :return: Set of attribute names, or None if unknown
+        """
+        return self.parent_operator.schema()
+
+    def explain(self, indent: int = 0, prefix: str = "") -> str:
+        """
+        Generate a human-readable explanation of the Shared operator.
+        :param indent: Current indentation level
+        :param prefix: Prefix for tree structure (e.g., "├─", "└─")
+        :return: String representation of the operator tree
+        """
+        indent_str = "  " * indent
+
+        lines = [
+            f"{indent_str}{prefix}Shared(",
+            f"{indent_str}  consumers: {self.consumers}",
+            f"{indent_str}  parent:"
+        ]
+
+        # Recursive call to parent operator
+        parent_explanation = self.parent_operator.explain(indent + 2, "└─ ")
+        lines.append(parent_explanation)
+
+        lines.append(f"{indent_str})")
+
+        return "\n".join(lines)
+
+    def explain_json(self) -> Dict[str, Any]:
+        """
+        Generate a JSON-serializable explanation of the Shared operator.
+        :return: Dictionary representing the operator tree structure
+        """
+        return {
+            "type": "Shared",
+            "parameters": {
+                "consumers": self.consumers
+            },
+            "parent": self.parent_operator.explain_json()
+        }
@@ -1,11 +1,46 @@
 from abc import abstractmethod
-from typing import Any, Dict, List
-from itertools import product
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Iterator, Optional, Tuple as TypingTuple
+from itertools import chain, product
 
-from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.algebra.Tuple import MappingTuple, intern_constants
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 from pyhartig.operators.Operator import Operator
 
 
+@lru_cache(maxsize=256)
+def _compile_row_generator(attributes: TypingTuple[str, ...],
+                           constant_attributes: TypingTuple[str, ...] = ()) -> Callable[..., Iterator[MappingTuple]]:
+    """
+    Generate the generator producing the tuples of a source with the given attributes.
+    The cartesian product of each context is unpacked into one local per attribute, and each tuple
+    is built from a dictionary display (allocated once with its final size), copied into an empty
+    MappingTuple at C level (no Python-level MappingTuple.__init__ call per tuple).
+    :param attributes: Non-empty attribute names, in the order of the value lists
+    :param constant_attributes: Attributes added to every tuple with the same value, after (or in
+                                place of) the attributes of the source
+    :return: Generator function taking the function producing the value lists of every context
+             (called on the first iteration, like the body of a generator), then the value of
+             each constant attribute
+    """
+    variables = [f"v{i}" for i in range(len(attributes))]
+    constants = [f"c{i}" for i in range(len(constant_attributes))]
+    display = ", ".join(f"{attribute!r}: {variable}" for attribute, variable in
+                        zip(attributes + constant_attributes, variables + constants))
+    source = (
+        f"def iter_rows(iter_value_lists, {''.join(f'{c}, ' for c in constants)}"
+        "*, mapping_tuple=MappingTuple, new=dict.__new__, update=dict.update, product=product):\n"
+        "    for values_lists in iter_value_lists():\n"
+        f"        for {', '.join(variables)}, in product(*values_lists):\n"
+        "            row = new(mapping_tuple)\n"
+        f"            update(row, {{{display}}})\n"
+        "            yield row"
+    )
+    namespace = {"MappingTuple": MappingTuple, "product": product}
+    exec(intern_constants(compile(source, f"<pyhartig source rows {list(attributes)!r}>", "exec")), namespace)
+    return namespace["iter_rows"]
+
+
 class SourceOperator(Operator):
     """
     Abstract class defining the algebraic logic of the Source operator
@@ -43,6 +78,31 @@ class SourceOperator(Operator):
         """
         pass
 
+    def owns_output(self) -> bool:
+        """
+        Every execution evaluates the queries again and builds new tuples (nothing is memoized).
+        :return: True, unless a subclass overrides execute_iter()
+        """
+        return type(self).execute_iter is SourceOperator.execute_iter
+
+    def _native_execution(self) -> bool:
+        """
+        Whether the tuples are the ones built by SourceOperator.execute_iter() from the mapped attributes.
+        :return: False if a subclass overrides execute_iter() or execute()
+        """
+        return type(self).execute_iter is SourceOperator.execute_iter \
+            and self._overriding(("execute_iter", "execute")) == "execute_iter"
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Every tuple of a Source operator defines all the mapped attributes
+        (context objects without a value for one of them produce no tuple).
+        :return: Set of the mapped attribute names (None if execute_iter() or execute() is overridden)
+        """
+        if not self._native_execution():
+            return None
+        return frozenset(self.attribute_mappings)
+
     def explain(self, indent: int = 0, prefix: str = "") -> str:
         """
         Generate a human-readable explanation of the Source operator
@@ -70,34 +130,125 @@ class SourceOperator(Operator):
             }
         }
 
-    def execute(self) -> List[MappingTuple]:
+    def _iter_value_lists(self) -> Iterator[List[List[Any]]]:
         """
-        Execute the Source operator logic
-        :return: List of rows resulting from the Source operator
+        Produce, for each context object, the list of extracted values of every attribute
+        (in the order of the attribute mappings)
+        Context objects for which an attribute has no value produce no row (the cartesian product
+        is empty), they are skipped without evaluating the remaining extraction queries.
+        :return: Iterator of value lists, one per context object producing rows
         """
-
-        result = []
-
         # Apply the iterator to get context objects
         contexts = self._apply_iterator(self.source_data, self.iterator_query)
 
+        # Hot loop: bind attributes to locals once
+        apply_extraction = self._apply_extraction
+        extraction_queries = list(self.attribute_mappings.values())
+
         # For each context, apply the extraction queries for each attribute
         for context in contexts:
+            values_lists = []
+            for extraction_query in extraction_queries:
+                values = apply_extraction(context, extraction_query)
+                if not values:
+                    break
+                values_lists.append(values)
+            else:
+                yield values_lists
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Execute the Source operator logic lazily
+        :return: Iterator of rows resulting from the Source operator
+        """
+        keys = tuple(self.attribute_mappings.keys())
+        if keys and all(type(key) is str for key in keys):
+            # Generated once per attribute set: product and tuple construction fused in one loop
+            return _compile_row_generator(keys)(self._iter_value_lists)
+        return self._iter_rows(keys)
 
-            extracted_values = {}
-
-            # Extract values for each attribute
-            for attr_name, extraction_query in self.attribute_mappings.items():
-                values = self._apply_extraction(context, extraction_query)
-                extracted_values[attr_name] = values
+    def execute_iter_extended(self, constants: Dict[str, Any]) -> Iterator[MappingTuple]:
+        """
+        Execute the Source operator logic lazily, every tuple extended with the same attribute values
+        (the tuples of Extend operators with constant expressions over the source).
+        :param constants: Value of each added attribute (replacing the value of a source attribute)
+        :return: Iterator of extended rows
+        """
+        keys = tuple(self.attribute_mappings.keys())
+        names = tuple(constants)
+        if keys and all(type(key) is str for key in keys + names):
+            # The constants are part of the dictionary display of each tuple
+            return _compile_row_generator(keys, names)(self._iter_value_lists, *constants.values())
+        return self._iter_rows_extended(keys, constants)
+
+    def _iter_rows_extended(self, keys: TypingTuple[str, ...], constants: Dict[str, Any]) -> Iterator[MappingTuple]:
+        """
+        Produce the tuples of the source extended with constant attributes, names given at run time.
+        :param keys: Attribute names, in the order of the value lists
+        :param constants: Value of each added attribute
+        :return: Iterator of MappingTuple
+        """
+        for row in self._iter_rows(keys):
+            row.update(constants)
+            yield row
 
-            keys = list(extracted_values.keys())
-            values_lists = list(extracted_values.values())
+    def _iter_rows(self, keys: TypingTuple[str, ...]) -> Iterator[MappingTuple]:
+        """
+        Produce the tuples of the source, attribute names being given at run time.
+        :param keys: Attribute names, in the order of the value lists
+        :return: Iterator of MappingTuple
+        """
+        mapping_tuple = MappingTuple
 
+        for values_lists in self._iter_value_lists():
             # Generate all combinations of extracted values
             for combination in product(*values_lists):
-                row_dict = dict(zip(keys, combination))
-                row = MappingTuple(row_dict)
-                result.append(row)
+                yield mapping_tuple(zip(keys, combination))
 
-        return result
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Execute the Source operator logic, filling the columns directly (no intermediate tuples)
+        The cartesian product of each context is built column by column: with value lists of sizes
+        (m1, ..., mk), column i repeats each of its values m(i+1)*...*mk times, and the whole
+        sequence m1*...*m(i-1) times, which yields the rows in the order of itertools.product.
+        :return: Iterator of ColumnBatch (a single batch, since all rows share the same attributes)
+        """
+        keys = list(self.attribute_mappings.keys())
+        contexts = list(self._iter_value_lists())
+
+        # Common case, one value per attribute in every context: column i is the concatenation of the
+        # i-th value lists of the contexts (transposed at C level, no per-context loop)
+        per_attribute = list(zip(*contexts))
+        if contexts and all(set(map(len, values)) == {1} for values in per_attribute):
+            columns = [list(chain.from_iterable(values)) for values in per_attribute]
+            yield ColumnBatch(dict(zip(keys, columns)), len(contexts))
+            return
+
+        columns = [[] for _ in keys]
+        nrows = 0
+
+        for values_lists in contexts:
+            context_rows = 1
+            for values in values_lists:
+                context_rows *= len(values)
+
+            if context_rows == 0:
+                continue
+
+            outer = 1
+            for column, values in zip(columns, values_lists):
+                inner = context_rows // (outer * len(values))
+                if inner == 1:
+                    repeated = values
+                else:
+                    repeated = [value for value in values for _ in range(inner)]
+                if outer == 1:
+                    column.extend(repeated)
+                else:
+                    column.extend(repeated * outer)
+                outer *= len(values)
+
+            nrows += context_rows
+
+        if nrows:
+            yield ColumnBatch(dict(zip(keys, columns)), nrows)
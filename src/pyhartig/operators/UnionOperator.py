@@ -1,6 +1,8 @@
-from typing import List, Dict, Any
+from itertools import chain
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional
 
 from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.algebra.ColumnBatch import ColumnBatch
 from pyhartig.operators.Operator import Operator
 
 
@@ -21,15 +23,71 @@ class UnionOperator(Operator):
 
     def execute(self) -> List[MappingTuple]:
         """
-        Executes all child operators and merges their results.
-        Union(r1, r2, ..., rn) = new MpaaingRelation (A_1, I_union)
+        Executes all child operators and concatenates their results.
+        Each child is materialized by its own execute(), so that Extend chains over a source are
+        evaluated column by column (see ExtendOperator.execute()).
+        :return: List of MappingTuple, the tuples of all child operators, in order.
+        """
+        if type(self).execute_iter is not UnionOperator.execute_iter:
+            return super().execute()
+
+        result = []
+        for op in self.operators:
+            result += op._pull_list()
+        return result
+
+    def execute_iter(self) -> Iterator[MappingTuple]:
+        """
+        Executes all child operators lazily and chains their results.
+        Union(r1, r2, ..., rn) = new MappingRelation (A_1, I_union)
         I_union = I_1 U I_2 U ... U I_n
-        :return:
+        :return: An iterator over the tuples of all child operators, in order.
+        """
+        # Child relations are chained, never merged into an intermediate list
+        return chain.from_iterable(op._pull_iter() for op in self.operators)
+
+    def execute_batched(self) -> Iterator[ColumnBatch]:
+        """
+        Executes all child operators on column batches and chains their results.
+        Consecutive batches with the same attributes (e.g. several sources of the same logical
+        source) are concatenated into a single batch.
+        :return: An iterator over the batches of all child operators, in order.
         """
-        merged_results = []
+        pending = []
+        # Attributes of the pending batches, computed once per group rather than once per comparison
+        pending_attributes = None
+
         for op in self.operators:
-            merged_results.extend(op.execute())
-        return merged_results
+            for batch in op._pull_batched():
+                attributes = tuple(batch.columns)
+                if attributes != pending_attributes:
+                    if pending:
+                        yield ColumnBatch.concat(pending)
+                        pending = []
+                    pending_attributes = attributes
+                pending.append(batch)
+
+        if pending:
+            yield ColumnBatch.concat(pending)
+
+    def owns_output(self) -> bool:
+        """
+        The tuples of the child relations are passed through.
+        :return: True if every child operator owns its output (and execute_iter() is not overridden)
+        """
+        return type(self).execute_iter is UnionOperator.execute_iter and all(
+            op._pull_owns_output() for op in self.operators
+        )
+
+    def schema(self) -> Optional[FrozenSet[str]]:
+        """
+        Attributes shared by the tuples of all the child relations.
+        :return: Set of attribute names, or None if the children do not all have the same known schema
+        """
+        schemas = {op.schema() for op in self.operators}
+        if len(schemas) != 1:
+            return None
+        return schemas.pop()
 
     def explain(self, indent: int = 0, prefix: str = "") -> str:
         """
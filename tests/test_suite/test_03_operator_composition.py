@@ -6,6 +6,7 @@ operators, specifically focusing on Source and Extend operator fusion.
 Tests demonstrate how operators combine to form complex data pipelines.
 """
 
+import sys
 import pytest
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
 from pyhartig.operators.ExtendOperator import ExtendOperator
@@ -21,7 +22,7 @@ class TestOperatorComposition:
     """Test suite for operator composition and fusion."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
@@ -29,12 +30,17 @@ class TestOperatorComposition:
             callable: Function for structured debug output
         """
 
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
 
         return log
 
@@ -64,6 +70,16 @@ class TestOperatorComposition:
             ]
         }
 
+    @staticmethod
+    def _assert_all_have(result, attribute, value_type=None):
+        """
+        Check in a single pass that every tuple defines an attribute (of the given type, if any).
+        """
+        for row in result:
+            assert attribute in row, f"{attribute!r} missing from {row}"
+            if value_type is not None:
+                assert isinstance(row[attribute], value_type), f"{attribute!r} is not a {value_type.__name__} in {row}"
+
     def test_source_extend_basic_fusion(self, team_data, debug_logger):
         """
         Test basic fusion of Source and Extend operators.
@@ -102,12 +118,11 @@ class TestOperatorComposition:
         result = extend_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
 
         assert len(result) == 2
-        assert all("rdf_type" in tuple for tuple in result)
-        assert all(isinstance(tuple["rdf_type"], IRI) for tuple in result)
+        self._assert_all_have(result, "rdf_type", IRI)
         assert result[0]["person_name"] == "Alice"
         assert result[1]["person_name"] == "Bob"
 
@@ -179,7 +194,7 @@ class TestOperatorComposition:
         result = extend_name.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Sample tuple:\n{result[0] if result else 'No results'}")
 
         assert len(result) == 2
@@ -245,12 +260,12 @@ class TestOperatorComposition:
         result = extend_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
 
         # Alice has 2 roles, Bob has 1 role → 3 tuples
         assert len(result) == 3
-        assert all("role_label" in tuple for tuple in result)
+        self._assert_all_have(result, "role_label", Literal)
 
         alice_tuples = [t for t in result if t["name"] == "Alice"]
         assert len(alice_tuples) == 2
@@ -328,7 +343,7 @@ class TestOperatorComposition:
         result = extend_label.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuple: {result[0] if result else 'No results'}")
 
         assert len(result) == 1
@@ -422,7 +437,7 @@ class TestOperatorComposition:
         result2 = branch2.execute()
 
         debug_logger("Execution Results",
-                     f"Branch 1 tuples: {len(result1)}\n"
+                     lambda: f"Branch 1 tuples: {len(result1)}\n"
                      f"  Sample: {result1[0] if result1 else 'None'}\n\n"
                      f"Branch 2 tuples: {len(result2)}\n"
                      f"  Sample: {result2[0] if result2 else 'None'}")
@@ -498,7 +513,7 @@ class TestOperatorComposition:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {t['person_name']} - {t['department']}"
                                               for i, t in enumerate(result)))
 
@@ -571,7 +586,7 @@ class TestOperatorComposition:
         result = extend_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {t['person_name']} - {t['subject']}"
                                               for i, t in enumerate(result)))
 
@@ -673,7 +688,7 @@ class TestOperatorComposition:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Sample tuple: {result[0] if result else 'None'}")
 
         assert len(result) == 2
@@ -731,7 +746,7 @@ class TestOperatorComposition:
         result = union_all.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Names: {[t['person_name'] for t in result]}")
 
         assert len(result) == 4
@@ -744,3 +759,71 @@ class TestOperatorComposition:
         debug_logger("Validation",
                      "✓ Nested unions successful\n"
                      "✓ All 4 tuples from nested structure present")
+
+    def test_lazy_pipeline_execution(self, team_data, debug_logger):
+        """
+        Test lazy execution of a Source -> Extend -> Union pipeline.
+
+        Validates that execute_iter() produces tuples on demand and yields
+        the same tuples, in the same order, as execute().
+        """
+        source = JsonSourceOperator(
+            source_data=team_data,
+            iterator_query="$.team[*]",
+            attribute_mappings={"person_id": "$.id", "person_name": "$.name"}
+        )
+        extend = ExtendOperator(source, "rdf_type", Constant(IRI("http://xmlns.com/foaf/0.1/Person")))
+        union = UnionOperator(operators=[extend, source])
+
+        stream = union.execute_iter()
+        first = next(stream)
+
+        debug_logger("First Streamed Tuple", lambda: str(first))
+
+        assert first["person_name"] == "Alice"
+        assert first["rdf_type"] == IRI("http://xmlns.com/foaf/0.1/Person")
+        assert [first] + list(stream) == union.execute()
+
+        debug_logger("Validation",
+                     "✓ Tuples produced on demand\n"
+                     "✓ Lazy and materialized results are identical")
+
+    def test_overridden_execute_honored(self, team_data, debug_logger):
+        """
+        Test that a subclass overriding execute() alone is pulled through it.
+        Validates that Extend (tuple and batched paths), MultiExtend, Project and
+        Union consume the tuples of execute(), and that an operator class
+        overriding neither execute() nor execute_iter() cannot be instantiated.
+        """
+        from pyhartig.operators.Operator import Operator
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+        from pyhartig.operators.ProjectOperator import ProjectOperator
+
+        class FirstOnlySource(JsonSourceOperator):
+            def execute(self):
+                return super().execute()[:1]
+
+        people = FirstOnlySource(team_data, "$.team[*]", {"id": "$.id", "name": "$.name"})
+        results = {
+            "source": people.execute(),
+            "extend": people.extend("type", Constant("Person")).execute(),
+            "extend_iter": list(people.extend("label", Reference("name")).execute_iter()),
+            "multi_extend": MultiExtendOperator(people, [("label", Reference("name"))]).execute(),
+            "project": ProjectOperator(people, {"id"}).execute(),
+            "union_batched": UnionOperator([people.extend("type", Constant("Person"))]).execute(),
+        }
+
+        debug_logger("Results", lambda: "\n".join(f"{name}: {rows}" for name, rows in results.items()))
+
+        assert not people._pull_owns_output()
+        assert all(len(rows) == 1 for rows in results.values())
+        assert results["extend"][0]["type"] == "Person"
+        assert results["extend_iter"][0]["label"] == results["source"][0]["name"]
+
+        class NoExecution(Operator):
+            pass
+
+        with pytest.raises(TypeError):
+            NoExecution()
+
+        debug_logger("Validation", "✓ Overridden execute() honored by the consuming operators")
@@ -6,6 +6,7 @@ pipelines, demonstrating realistic use cases that combine multiple
 operators and transformations to produce RDF-like output structures.
 """
 
+import sys
 import pytest
 import json
 from pathlib import Path
@@ -23,19 +24,24 @@ class TestCompletePipelines:
     """Test suite for complete end-to-end data transformation pipelines."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -68,7 +74,7 @@ class TestCompletePipelines:
         subject, predicate, and object handling.
         """
         debug_logger("Test: RDF Triple Generation Pipeline", 
-                     f"Objective: Transform JSON to RDF triple structure\n"
+                     lambda: f"Objective: Transform JSON to RDF triple structure\n"
                      f"Input data: {json.dumps(load_test_data, indent=2)}")
         
         # Stage 1: Extract team members
@@ -157,7 +163,7 @@ class TestCompletePipelines:
         result = extend_role.execute()
         
         debug_logger("Pipeline Execution Result", 
-                     f"Total tuples generated: {len(result)}\n"
+                     lambda: f"Total tuples generated: {len(result)}\n"
                      f"First 5 tuples:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result[:5])))
         
@@ -229,7 +235,7 @@ class TestCompletePipelines:
             ]
         }
         
-        debug_logger("Input Data", json.dumps(data, indent=2))
+        debug_logger("Input Data", lambda: json.dumps(data, indent=2))
         
         # Source
         source = JsonSourceOperator(
@@ -306,7 +312,7 @@ class TestCompletePipelines:
         result = pipeline.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of profiles: {len(result)}\n"
+                     lambda: f"Number of profiles: {len(result)}\n"
                      f"Profiles:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
@@ -361,7 +367,7 @@ class TestCompletePipelines:
             }
         }
         
-        debug_logger("Input Data", json.dumps(data, indent=2))
+        debug_logger("Input Data", lambda: json.dumps(data, indent=2))
         
         # Source: iterate over projects within divisions
         source = JsonSourceOperator(
@@ -408,7 +414,7 @@ class TestCompletePipelines:
         result = pipeline.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of projects: {len(result)}\n"
+                     lambda: f"Number of projects: {len(result)}\n"
                      f"Projects:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
@@ -453,7 +459,7 @@ class TestCompletePipelines:
         }
         
         debug_logger("Input Data", 
-                     f"{json.dumps(data, indent=2)}\n"
+                     lambda: f"{json.dumps(data, indent=2)}\n"
                      f"Note: Entry 2 has missing 'value' attribute")
         
         source = JsonSourceOperator(
@@ -488,7 +494,7 @@ class TestCompletePipelines:
         result = pipeline.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
@@ -624,7 +630,7 @@ class TestCompletePipelines:
         result = final_pipeline.execute()
 
         debug_logger("Execution Result",
-                     f"Number of employees: {len(result)}\n"
+                     lambda: f"Number of employees: {len(result)}\n"
                      f"Employees:\n" + "\n".join(
                          f"  {i + 1}. {t['emp_name']} ({t['dept']}) - {t['subject']}"
                          for i, t in enumerate(result)))
@@ -768,7 +774,7 @@ class TestCompletePipelines:
         result = post_process_label.execute()
 
         debug_logger("Execution Result",
-                     f"Number of persons: {len(result)}\n"
+                     lambda: f"Number of persons: {len(result)}\n"
                      f"Persons:\n" + "\n".join(
                          f"  {i + 1}. {t['label'].lexical_form}"
                          for i, t in enumerate(result)))
@@ -904,7 +910,7 @@ class TestCompletePipelines:
         result = union_triples.execute()
 
         debug_logger("Execution Result",
-                     f"Number of triples: {len(result)}\n"
+                     lambda: f"Number of triples: {len(result)}\n"
                      f"Triples:\n" + "\n".join(
                          f"  {i + 1}. <{t['subject']}> <{t['predicate']}> <{t['object']}>"
                          for i, t in enumerate(result)))
@@ -6,9 +6,10 @@ library, validating RDF term construction, type conversions, and string
 manipulation operations.
 """
 
+import sys
 import pytest
-from pyhartig.functions.builtins import to_iri, to_literal, concat
-from pyhartig.algebra.Terms import IRI, Literal
+from pyhartig.functions.builtins import to_iri, to_literal, concat, clear_term_caches, TERM_CACHE_SIZE
+from pyhartig.algebra.Terms import IRI, Literal, XSD_STRING
 from pyhartig.algebra.Tuple import EPSILON
 
 
@@ -16,19 +17,24 @@ class TestBuiltinFunctions:
     """Test suite for built-in transformation functions."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     # =========================================================================
@@ -164,6 +170,27 @@ class TestBuiltinFunctions:
         
         debug_logger("Validation", "✓ Numeric identifier converted to IRI")
 
+    def test_to_iri_with_non_string_base(self, debug_logger):
+        """
+        Test to_iri function with a base that is not a native string.
+
+        Validates that an empty lexical form resolved against an IRI or an
+        integer base returns the base itself (as before the interning of IRIs),
+        and that the datatype of to_literal may be any value.
+        """
+        base = IRI("http://example.org/")
+        results = {"iri_base": to_iri("", base), "int_base": to_iri("", 3),
+                   "iri_datatype": to_literal("a", base), "int_datatype": to_literal("a", 3)}
+
+        debug_logger("Results", lambda: str(results))
+
+        assert results["iri_base"] == IRI(base)
+        assert results["int_base"] == IRI(3)
+        assert results["iri_datatype"].datatype_iri is base
+        assert results["int_datatype"].datatype_iri == 3
+
+        debug_logger("Validation", "✓ Non-string bases and datatypes are not interned")
+
     # =========================================================================
     # Tests for to_literal function
     # =========================================================================
@@ -453,3 +480,252 @@ class TestBuiltinFunctions:
                      "✓ Functions successfully composed\n"
                      f"✓ Final IRI: {iri}")
 
+
+    def test_literal_datatype_interning(self, debug_logger):
+        """
+        Test interning of Literal datatype IRIs.
+
+        Validates that Literals built from equal datatype strings share
+        the same interned string, including the default xsd:string.
+        """
+        debug_logger("Test: Datatype Interning",
+                     "Objective: Datatype IRIs are interned on Literal creation")
+
+        # Build the datatype at runtime so it is a distinct string object
+        dynamic_xsd_string = "".join(["http://www.w3.org/2001/XMLSchema#", "string"])
+        dynamic_xsd_integer = "".join(["http://www.w3.org/2001/XMLSchema#", "integer"])
+
+        literal = to_literal("Alice", dynamic_xsd_string)
+        integer_1 = Literal("1", dynamic_xsd_integer)
+        integer_2 = Literal("2", "http://www.w3.org/2001/XMLSchema#integer")
+
+        debug_logger("Test Case: Interned Datatypes",
+                     f"to_literal('Alice', xsd:string) → {literal!r}\n"
+                     f"Literal('1', xsd:integer) → {integer_1!r}")
+
+        assert literal.datatype_iri is XSD_STRING
+        assert concat("a", "b").datatype_iri is XSD_STRING
+        assert Literal("x").datatype_iri is XSD_STRING
+        assert integer_1.datatype_iri is integer_2.datatype_iri
+        assert repr(literal) == '"Alice"'
+
+        debug_logger("Validation", "✓ Datatype IRIs are interned")
+
+    def test_concat_string_fast_path(self, debug_logger):
+        """
+        Test that the native string fast path of concat matches the general path.
+
+        Validates that str subclasses and mixed arguments still go through
+        the general conversion and yield the same Literal.
+        """
+        debug_logger("Test: concat Fast Path",
+                     "Objective: Binary str concatenation matches the general path")
+
+        class TaggedStr(str):
+            pass
+
+        fast = concat("foo", "bar")
+        subclass = concat(TaggedStr("foo"), "bar")
+        mixed = concat("foo", Literal("bar"))
+        variadic = concat("f", "o", "obar")
+
+        debug_logger("Results",
+                     f"concat('foo', 'bar') → {fast!r}\n"
+                     f"concat(TaggedStr('foo'), 'bar') → {subclass!r}\n"
+                     f"concat('foo', Literal('bar')) → {mixed!r}")
+
+        assert fast == Literal("foobar", XSD_STRING)
+        assert fast == subclass == mixed == variadic
+        assert concat("foo", EPSILON) == EPSILON
+        assert concat("Role", ": ", "admin", "") == Literal("Role: admin", XSD_STRING)
+        assert concat("a", "b", EPSILON) is EPSILON
+        assert concat("a", None, "b") is EPSILON
+
+        debug_logger("Validation", "✓ Fast path is equivalent to the general path")
+
+    @pytest.mark.skipif(TERM_CACHE_SIZE == 0, reason="term memoization disabled (PYHARTIG_TERM_CACHE_SIZE=0)")
+    def test_term_memoization(self, debug_logger):
+        """
+        Test memoization of to_iri, to_literal and concat.
+
+        Validates that repeated lexical forms return the same cached term
+        instance, that different inputs still produce distinct terms, and
+        that unhashable bases are converted without memoization.
+        """
+        debug_logger("Test: Term Memoization",
+                     "Objective: Repeated inputs return the cached RDF term")
+
+        iri_1 = to_iri("42", "http://example.org/user/")
+        iri_2 = to_iri(42, "http://example.org/user/")
+        other_base = to_iri("42", "http://example.org/item/")
+        literal_1 = to_literal("42", "http://www.w3.org/2001/XMLSchema#integer")
+        literal_2 = to_literal(42, "http://www.w3.org/2001/XMLSchema#integer")
+
+        debug_logger("Results",
+                     f"to_iri('42', user/) → {iri_1}\n"
+                     f"to_iri(42, user/) → {iri_2}\n"
+                     f"to_iri('42', item/) → {other_base}\n"
+                     f"to_literal(42, xsd:integer) → {literal_2!r}")
+
+        assert iri_1 is iri_2
+        assert other_base == IRI("http://example.org/item/42")
+        assert literal_1 is literal_2
+        assert to_iri("42") == EPSILON
+        assert concat("Alice", " Smith") is concat("Alice", Literal(" Smith", XSD_STRING), "")
+        assert concat("Alice", " Smith") is to_literal("Alice Smith", XSD_STRING)
+
+        # Unhashable bases (e.g. a JSON object) are not memoized
+        assert to_iri("a:b", ["x"]) == IRI("a:b")
+        assert to_iri("a:b", {"base": "http://example.org/"}) == IRI("a:b")
+
+        clear_term_caches()
+        assert to_iri("42", "http://example.org/user/") is not iri_1
+        assert to_iri("42", "http://example.org/user/") == iri_1
+
+        debug_logger("Validation", "✓ RDF terms are memoized per lexical form")
+
+    def test_term_cache_size_configuration(self, monkeypatch, caplog, debug_logger):
+        """
+        Test parsing of the PYHARTIG_TERM_CACHE_SIZE environment variable.
+
+        Validates that valid sizes (including 0) are used as is, and that
+        invalid or negative values fall back to the default with a warning.
+        """
+        from pyhartig.functions.builtins import _term_cache_size, DEFAULT_TERM_CACHE_SIZE
+
+        sizes = {}
+        for configured in ["0", "128", "", "abc", "-3"]:
+            monkeypatch.setenv("PYHARTIG_TERM_CACHE_SIZE", configured)
+            caplog.clear()
+            sizes[configured] = (_term_cache_size(), len(caplog.records))
+
+        monkeypatch.delenv("PYHARTIG_TERM_CACHE_SIZE")
+
+        debug_logger("Configured Sizes", lambda: str(sizes))
+
+        assert sizes == {
+            "0": (0, 0), "128": (128, 0), "": (DEFAULT_TERM_CACHE_SIZE, 0),
+            "abc": (DEFAULT_TERM_CACHE_SIZE, 1), "-3": (DEFAULT_TERM_CACHE_SIZE, 1)
+        }
+        assert _term_cache_size() == DEFAULT_TERM_CACHE_SIZE
+
+        debug_logger("Validation", "✓ Invalid cache sizes fall back to the default")
+
+    def test_iri_resolution_fast_path(self, debug_logger):
+        """
+        Test that the simple-segment IRI resolution matches urljoin.
+
+        Validates relative references that take the fast path as well as
+        those that still need full RFC 3986 resolution.
+        """
+        import urllib.parse
+
+        debug_logger("Test: IRI Resolution Fast Path",
+                     "Objective: Fast path and urljoin agree")
+
+        cases = [
+            ("http://example.org/person/", "42"),
+            ("http://example.org/person/", "alice.smith"),
+            ("http://example.org/person/", ".."),
+            ("http://example.org/person/", "a/b"),
+            ("http://example.org/person/", "p;x"),
+            ("http://example.org/a/../person/", "42"),
+            ("http://example.org/person", "42"),
+            ("http://example.org/?q=/", "42"),
+        ]
+
+        for base, lex in cases:
+            result = to_iri(lex, base)
+            expected = urllib.parse.urljoin(base, lex)
+            debug_logger(f"Case: {base} + {lex}", f"Result: {result}\nExpected: <{expected}>")
+            assert result == IRI(expected)
+
+        debug_logger("Validation", "✓ Fast path resolution is equivalent to urljoin")
+
+    def test_terms_have_no_instance_dict(self, debug_logger):
+        """
+        Test that RDF terms and mapping tuples store no per-instance __dict__.
+
+        Validates that terms remain immutable and hashable.
+        """
+        import sys
+        from pyhartig.algebra.Terms import BlankNode
+        from pyhartig.algebra.Tuple import MappingTuple, ChainedMappingTuple
+        from pyhartig.algebra.ColumnBatch import ColumnBatch
+
+        debug_logger("Test: Slotted Terms",
+                     "Objective: Terms and tuples have no per-instance __dict__")
+
+        iri = to_iri("http://example.org/a")
+        literal = to_literal("42", "http://www.w3.org/2001/XMLSchema#integer")
+
+        if sys.version_info >= (3, 10):
+            assert not hasattr(iri, "__dict__")
+            assert not hasattr(literal, "__dict__")
+            assert not hasattr(BlankNode("b0"), "__dict__")
+        assert not hasattr(MappingTuple({"a": 1}), "__dict__")
+        assert not hasattr(ChainedMappingTuple(MappingTuple({"a": 1}), {"b": 2}), "__dict__")
+        assert not hasattr(ColumnBatch({"a": [1]}), "__dict__")
+
+        with pytest.raises(AttributeError):
+            literal.lexical_form = "43"
+        assert len({iri, IRI("http://example.org/a")}) == 1
+
+        debug_logger("Validation", "✓ Terms are slotted, immutable and hashable")
+
+    def test_term_equality_and_hash(self, debug_logger):
+        """
+        Test the equality and hash of RDF terms.
+
+        Validates that shared and distinct equal terms compare equal with
+        equal hashes, and that terms of different kinds never compare equal.
+        """
+        from pyhartig.algebra.Terms import BlankNode
+
+        iri = to_iri("http://xmlns.com/foaf/0.1/Person")
+        literal = to_literal("42", "http://www.w3.org/2001/XMLSchema#integer")
+
+        debug_logger("Terms", lambda: f"{iri}\n{literal}")
+
+        assert iri == iri == IRI("http://xmlns.com/foaf/0.1/Person")
+        assert hash(iri) == hash(IRI("http://xmlns.com/foaf/0.1/Person"))
+        assert literal == Literal("42", "http://www.w3.org/2001/XMLSchema#integer")
+        assert hash(literal) == hash(Literal("42", "http://www.w3.org/2001/XMLSchema#integer"))
+        assert literal != Literal("42")
+        assert BlankNode("b0") == BlankNode("b0") != BlankNode("b1")
+        assert IRI("x") != Literal("x") and IRI("x") != BlankNode("x") and IRI("x") != "x"
+        assert len({iri, IRI("http://xmlns.com/foaf/0.1/Person"), Literal("http://xmlns.com/foaf/0.1/Person")}) == 2
+
+        debug_logger("Validation", "✓ Terms compared by identity first, then by value")
+
+    def test_lexical_forms_of_subclasses(self, debug_logger):
+        """
+        Test the lexical forms of values whose type derives from a supported type.
+
+        Validates that subclasses of str, int, Literal and IRI convert like
+        their base types, and that unsupported values give EPSILON.
+        """
+        from pyhartig.algebra.Terms import BlankNode
+
+        class Name(str):
+            pass
+
+        class Level(int):
+            pass
+
+        class TaggedLiteral(Literal):
+            pass
+
+        class TaggedIRI(IRI):
+            pass
+
+        values = [Name("Ada"), Level(3), TaggedLiteral("x"), TaggedIRI("http://a/"), 1.5, False]
+        result = concat(*values)
+
+        debug_logger("Concatenation", lambda: f"{values} → {result}")
+
+        assert result == Literal("Ada3xhttp://a/1.5False")
+        assert concat(Literal("x"), IRI("http://a/"), 2) == Literal("xhttp://a/2")
+        assert concat("x", BlankNode("b0")) is EPSILON
+
+        debug_logger("Validation", "✓ Exact types and subclasses converted alike")
@@ -6,6 +6,7 @@ including constants, references, and function calls. Tests validate
 the expression evaluation mechanism and composition patterns.
 """
 
+import sys
 import pytest
 from pyhartig.expressions.Constant import Constant
 from pyhartig.expressions.Reference import Reference
@@ -19,19 +20,24 @@ class TestExpressionSystem:
     """Test suite for the algebraic expression system."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -195,9 +201,35 @@ class TestExpressionSystem:
                      f"Is EPSILON: {result == EPSILON}")
         
         assert result == EPSILON
+
+        # A non-string name is kept unchanged and never matches an attribute
+        assert Reference(1).attribute_name == 1
+        assert Reference(1).evaluate(sample_tuple) == EPSILON
+        assert Reference(None).evaluate(sample_tuple) == EPSILON
         
         debug_logger("Validation", "✓ Missing attribute returns EPSILON")
 
+    def test_reference_on_overlay(self, sample_tuple, debug_logger):
+        """
+        Test Reference expression on copy-on-write overlay tuples.
+
+        Validates that attributes of the overlay and of its parent tuple are
+        found, that missing attributes return EPSILON and that defined None
+        values are returned as they are.
+        """
+        from pyhartig.algebra.Tuple import ChainedMappingTuple
+
+        overlay = ChainedMappingTuple.overlay(MappingTuple({"name": "Alice", "nothing": None}), "type", "Person")
+
+        debug_logger("Test Case: Overlay", lambda: f"Input tuple: {overlay}")
+
+        assert Reference("type").evaluate(overlay) == "Person"
+        assert Reference("name").evaluate(overlay) == "Alice"
+        assert Reference("nothing").evaluate(overlay) is None
+        assert Reference("nonexistent").evaluate(overlay) is EPSILON
+
+        debug_logger("Validation", "✓ Overlay and parent attributes referenced")
+
     def test_reference_multiple_attributes(self, sample_tuple, debug_logger):
         """
         Test multiple Reference expressions on same tuple.
@@ -261,6 +293,28 @@ class TestExpressionSystem:
         
         debug_logger("Validation", "✓ Function evaluated with constants")
 
+    def test_function_call_constant_subclass(self, sample_tuple, debug_logger):
+        """
+        Test FunctionCall evaluation with a Constant subclass as argument.
+
+        Validates that constant values are read directly while subclasses
+        overriding evaluate() are still evaluated.
+        """
+        class UpperConstant(Constant):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return self.value.upper()
+
+        func_expr = FunctionCall(concat, [Constant("Hello "), UpperConstant("world")])
+        result = func_expr.evaluate(sample_tuple)
+
+        debug_logger("Test Case: Constant Subclass", lambda: f"Expression: {func_expr}\nResult: {result}")
+
+        assert result == Literal("Hello WORLD")
+
+        debug_logger("Validation", "✓ Overridden evaluate() of Constant subclasses honoured")
+
     def test_function_call_with_references(self, sample_tuple, debug_logger):
         """
         Test FunctionCall expression with reference arguments.
@@ -505,3 +559,640 @@ class TestExpressionSystem:
         
         debug_logger("Validation", "✓ All expressions have meaningful repr")
 
+
+    def test_compiled_expression(self, sample_tuple, debug_logger):
+        """
+        Test compilation of expressions into closures.
+
+        Validates that compile() returns a callable producing the same
+        results as evaluate(), including EPSILON propagation.
+        """
+        expressions = [
+            Constant(IRI("http://xmlns.com/foaf/0.1/Person")),
+            Reference("name"),
+            Reference("nonexistent"),
+            FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/person/")]),
+            FunctionCall(to_literal, [
+                FunctionCall(concat, [Reference("name"), Constant("_"), Reference("department")]),
+                Constant("http://www.w3.org/2001/XMLSchema#string")
+            ]),
+            FunctionCall(concat, [Reference("name"), Reference("nonexistent")]),
+        ]
+
+        for expr in expressions:
+            compiled = expr.compile()
+
+            debug_logger("Test Case: Compiled Expression",
+                         lambda: f"Expression: {expr}\n"
+                         f"evaluate(): {expr.evaluate(sample_tuple)}\n"
+                         f"compile()(): {compiled(sample_tuple)}")
+
+            assert callable(compiled)
+            assert compiled(sample_tuple) == expr.evaluate(sample_tuple)
+
+        debug_logger("Validation", "✓ Compiled closures match tree evaluation")
+
+    def test_compiled_subclass_overriding_evaluate(self, sample_tuple, debug_logger):
+        """
+        Test compilation of subclasses of the built-in expressions.
+
+        Validates that a subclass overriding evaluate() only is compiled
+        into a closure calling its own evaluate(), not the specialized
+        closure of its base class.
+        """
+        class UpperConstant(Constant):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return self.value.upper()
+
+        class UpperReference(Reference):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return super().evaluate(tuple_data).upper()
+
+        class ConstantCall(FunctionCall):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return "constant"
+
+        expressions = [
+            (UpperConstant("hello"), "HELLO"),
+            (UpperReference("name"), "ALICE"),
+            (ConstantCall(concat, [Reference("name")]), "constant"),
+        ]
+
+        for expr, expected in expressions:
+            compiled = expr.compile(frozenset(sample_tuple))
+
+            debug_logger("Test Case: Compiled Subclass", lambda: f"Expression: {expr}\nResult: {compiled(sample_tuple)}")
+
+            assert compiled(sample_tuple) == expected
+
+        debug_logger("Validation", "✓ Overridden evaluate() of subclasses honoured by compile()")
+
+    def test_generated_code_subclass_nodes(self, sample_tuple, debug_logger):
+        """
+        Test code generation for trees holding subclasses of the built-in expressions.
+
+        Validates that subclass nodes are not lowered as their base class
+        but evaluated through their own evaluate().
+        """
+        from pyhartig.expressions._codegen import clear_compile_cache, generate_source
+
+        class UpperConstant(Constant):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return self.value.upper()
+
+        class UpperReference(Reference):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return super().evaluate(tuple_data).upper()
+
+        class ConstantCall(FunctionCall):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return "constant"
+
+        expr = FunctionCall(concat, [
+            UpperReference("name"), UpperConstant("-"), ConstantCall(concat, [Reference("id")]), Constant("x")
+        ])
+        # Generated from scratch (not a function memoized for another tree)
+        clear_compile_cache()
+        compiled = expr.compile(frozenset(sample_tuple))
+
+        debug_logger("Generated Code", lambda: generate_source(expr))
+
+        assert compiled(sample_tuple) == Literal("ALICE-constantx")
+        assert compiled(sample_tuple) == expr.evaluate(sample_tuple)
+
+        debug_logger("Validation", "✓ Subclass nodes evaluated through their own evaluate()")
+
+    def test_expression_attrs_and_constant_folding(self, sample_tuple, debug_logger):
+        """
+        Test attrs(phi) and constant folding of pure function calls.
+
+        Validates that attrs() collects the referenced attributes and that
+        a compiled call of a pure function on constants is evaluated once.
+        """
+        from pyhartig.functions.builtins import pure
+
+        calls = []
+
+        @pure
+        def counting_concat(*args):
+            calls.append(args)
+            return concat(*args)
+
+        expr = FunctionCall(to_iri, [FunctionCall(concat, [Constant("http://ex.org/"), Reference("id")])])
+        constant_expr = FunctionCall(counting_concat, [Constant("http://ex.org/"), Constant("base")])
+
+        debug_logger("Attributes",
+                     f"attrs({expr}) = {set(expr.attrs())}\n"
+                     f"attrs({constant_expr}) = {set(constant_expr.attrs())}")
+
+        assert expr.attrs() == frozenset({"id"})
+        assert Constant("x").attrs() == frozenset()
+        assert constant_expr.attrs() == frozenset()
+
+        compiled = constant_expr.compile()
+        results = [compiled(sample_tuple) for _ in range(5)]
+
+        assert len(calls) == 1
+        assert all(result == Literal("http://ex.org/base") for result in results)
+        assert constant_expr.is_constant()
+        assert not expr.is_constant()
+
+        debug_logger("Validation",
+                     "✓ attrs() computed statically\n"
+                     "✓ Pure function call on constants evaluated once")
+
+    def test_expression_without_attrs(self, debug_logger):
+        """
+        Test user expressions that only implement evaluate().
+
+        Validates that they can be instantiated, that their attributes are
+        unknown (None), and that operators and the optimizer then assume
+        they may read any attribute.
+        """
+        from pyhartig.expressions.Expression import Expression
+        from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+        from pyhartig.operators.ProjectOperator import ProjectOperator
+        from pyhartig.optimizer import optimize
+
+        class Label(Expression):
+            """Reads the 'label' attribute without declaring it."""
+
+            def evaluate(self, mapping):
+                return mapping.get("label", EPSILON)
+
+        source = JsonSourceOperator({"items": [{"id": 1}, {"id": 2}]}, "$.items[*]", {"id": "$.id"})
+        label = Label()
+        call = FunctionCall(concat, [Reference("id"), label])
+
+        chain = source.extend("label", Constant("x")).extend("tag", label).extend("full", call)
+        multi = MultiExtendOperator(source, [("label", Constant("x")), ("full", call)])
+        optimized = optimize(ProjectOperator(source.extend("label", Constant("y")).extend("tag", label), {"tag"}))
+        results = {"chain": chain.execute(), "multi": multi.execute(), "optimized": optimized.execute()}
+
+        debug_logger("Results", lambda: "\n".join(f"{name}: {rows}" for name, rows in results.items()))
+
+        assert label.attrs() is None and call.attrs() is None
+        assert label.may_read({"anything"}) and not Reference("id").may_read({"label"})
+        assert not label.is_constant()
+        assert [row["tag"] for row in results["chain"]] == ["x", "x"]
+        assert [row["full"] for row in results["chain"]] == [Literal("1x"), Literal("2x")]
+        assert [row["full"] for row in results["multi"]] == [Literal("1x"), Literal("2x")]
+        assert [row["tag"] for row in results["optimized"]] == ["y", "y"]
+
+        debug_logger("Validation", "✓ Unknown attributes handled conservatively")
+
+    def test_impure_function_not_folded(self, debug_logger):
+        """
+        Test that calls of functions not marked as pure are never folded.
+
+        Validates that a blank node generator without arguments is called
+        once per tuple by evaluate_batch(), compile(), the code generator,
+        the Extend operator paths and the optimizer.
+        """
+        import itertools
+        from pyhartig.algebra.ColumnBatch import ColumnBatch
+        from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
+        from pyhartig.operators.UnionOperator import UnionOperator
+        from pyhartig.optimizer import fold_constants, optimize
+
+        counter = itertools.count(1)
+
+        def new_blank_node():
+            return f"_:b{next(counter)}"
+
+        bnode = FunctionCall(new_blank_node, [])
+        nested = FunctionCall(concat, [Constant("id "), bnode])
+        source = JsonSourceOperator({"items": [{"id": 1}, {"id": 2}, {"id": 3}]}, "$.items[*]", {"id": "$.id"})
+
+        batch = bnode.evaluate_batch(ColumnBatch({"id": [1, 2, 3]}))
+        compiled = [bnode.compile()(MappingTuple()) for _ in range(2)]
+        generated = FunctionCall(concat, [Reference("id"), bnode]).compile(frozenset({"id"}))
+        plans = {
+            "batched": source.extend("node", bnode),
+            "fused": source.extend("id2", Reference("id")).extend("node", nested),
+            "iterator": UnionOperator([source]).extend("node", bnode),
+        }
+        results = {name: [row["node"] for row in plan.execute()] for name, plan in plans.items()}
+        optimized = [row["node"] for row in optimize(UnionOperator([source]).extend("node", nested)).execute()]
+
+        debug_logger("Blank Nodes", lambda: f"Batch: {batch}\nCompiled: {compiled}\nPlans: {results}\n"
+                                            f"Optimized: {optimized}")
+
+        assert not bnode.is_constant() and not nested.is_constant()
+        assert fold_constants(nested) is nested
+        assert len(set(batch)) == 3
+        assert len(set(compiled)) == 2
+        assert generated(MappingTuple({"id": "x"})) != generated(MappingTuple({"id": "x"}))
+        for name, values in results.items():
+            assert len(set(values)) == 3, name
+        assert len({value.lexical_form for value in optimized}) == 3
+
+        debug_logger("Validation", "✓ Impure calls evaluated once per tuple in every path")
+
+    def test_generated_expression_code(self, debug_logger):
+        """
+        Test the code generated for compiled function calls.
+
+        Validates that the generated function matches evaluate() for
+        present and missing attributes and for failing functions, and
+        that constant arguments are not checked against EPSILON.
+        """
+        from pyhartig.expressions._codegen import generate_source
+
+        def failing(value):
+            raise ValueError(value)
+
+        expr = FunctionCall(to_iri, [FunctionCall(concat, [Constant("http://ex.org/"), Reference("id")])])
+        failing_expr = FunctionCall(concat, [FunctionCall(failing, [Reference("id")]), Constant("x")])
+        source = generate_source(expr)
+
+        debug_logger("Generated Source", source)
+
+        tuples = [MappingTuple({"id": "1"}), MappingTuple({"name": "Bob"}), MappingTuple({"id": 7})]
+        for e in (expr, failing_expr):
+            compiled = e.compile()
+            assert [compiled(t) for t in tuples] == [e.evaluate(t) for t in tuples]
+
+        assert expr.compile()(tuples[0]) == IRI("http://ex.org/1")
+        assert "def evaluate(tuple_data):" in source
+        assert "c0 is EPSILON" not in source
+
+        debug_logger("Validation",
+                     "✓ Generated code equivalent to evaluate()\n"
+                     "✓ Constant arguments skip the EPSILON check")
+
+    def test_generated_code_common_subexpressions(self, debug_logger):
+        """
+        Test common subexpression elimination in the generated code.
+
+        Validates that an attribute referenced several times is looked up
+        once, and that identical calls of a pure function are evaluated once
+        per tuple, while impure functions are still called at each position.
+        """
+        from pyhartig.expressions._codegen import generate_source
+        from pyhartig.functions.builtins import pure
+
+        calls = []
+
+        @pure
+        def tag(value):
+            calls.append(value)
+            return f"<{value}>"
+
+        def impure_tag(value):
+            calls.append(value)
+            return f"<{value}>"
+
+        def build(function):
+            return FunctionCall(concat, [
+                FunctionCall(function, [Reference("id")]), Constant(" "),
+                FunctionCall(function, [Reference("id")]), Reference("id")
+            ])
+
+        expression = build(tag)
+        source = generate_source(expression)
+
+        debug_logger("Generated Source", source)
+
+        tuples = [MappingTuple({"id": str(i)}) for i in range(3)]
+        compiled = expression.compile()
+
+        assert [compiled(t) for t in tuples] == [Literal(f"<{i}> <{i}>{i}") for i in range(3)]
+        assert calls == ["0", "1", "2"]
+        assert source.count("tuple_data.get('id'") == 1
+
+        calls.clear()
+        impure_compiled = build(impure_tag).compile()
+        assert [impure_compiled(t) for t in tuples] == [compiled(t) for t in tuples]
+        assert calls == ["0", "0", "1", "1", "2", "2"]
+
+        debug_logger("Validation",
+                     "✓ Attributes looked up once\n"
+                     "✓ Identical pure calls evaluated once per tuple")
+
+    def test_epsilon_singleton(self, debug_logger):
+        """
+        Test that EPSILON is a singleton, copies and unpickled values included.
+
+        Validates that identity checks on EPSILON are sound.
+        """
+        import copy
+        import pickle
+        from pyhartig.algebra.Tuple import _Epsilon
+
+        debug_logger("Test: EPSILON Singleton",
+                     "Objective: Every _Epsilon value is the EPSILON instance")
+
+        assert _Epsilon() is EPSILON
+        assert copy.deepcopy(EPSILON) is EPSILON
+        assert pickle.loads(pickle.dumps(EPSILON)) is EPSILON
+        assert FunctionCall(concat, [Reference("missing"), Constant("x")]).evaluate(MappingTuple()) is EPSILON
+
+        debug_logger("Validation", "✓ EPSILON is a singleton")
+
+    def test_expressions_have_no_instance_dict(self, sample_tuple, debug_logger):
+        """
+        Test that expression nodes store no per-instance __dict__.
+
+        Validates that slotted expressions can still be copied and pickled.
+        """
+        import copy
+        import pickle
+
+        debug_logger("Test: Slotted Expressions",
+                     "Objective: Expression nodes have no per-instance __dict__")
+
+        expression = FunctionCall(concat, [Reference("name"), Constant("!")])
+
+        assert not hasattr(expression, "__dict__")
+        assert not hasattr(expression.arguments[0], "__dict__")
+        assert not hasattr(expression.arguments[1], "__dict__")
+
+        for clone in (copy.deepcopy(expression), pickle.loads(pickle.dumps(expression))):
+            assert repr(clone) == repr(expression)
+            assert clone.evaluate(sample_tuple) == expression.evaluate(sample_tuple)
+
+        debug_logger("Validation", "✓ Expressions are slotted, copyable and picklable")
+
+    def test_attribute_names_interned(self, debug_logger):
+        """
+        Test that attribute names are the same objects in tuples and expressions.
+
+        Validates that names which CPython does not intern on its own (e.g.
+        dotted JSON references) are shared by the tuples built by a source,
+        the References and the generated code, so lookups compare identities.
+        """
+        from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
+        from pyhartig.operators.ExtendOperator import ExtendOperator
+        from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+        from pyhartig.expressions._codegen import compile_expression
+
+        # Built at run time: equal to, but not the same object as, any other "user.login"
+        name = "".join(["user", ".", "login"])
+        source = JsonSourceOperator([{"user": {"login": "alice"}}], "$[*]", {name: "$.user.login"})
+        extend = ExtendOperator(source, "".join(["user", ".", "iri"]),
+                                FunctionCall(to_iri, [Reference("".join(["user", ".", "login"])),
+                                                      Constant("http://example.org/")]))
+        row = extend.execute()[0]
+
+        debug_logger("Interned Attribute Names", lambda: f"Tuple: {row}\nKeys: {list(row)}")
+
+        keys = list(row)
+        assert keys[0] is extend.expression.arguments[0].attribute_name
+        assert keys[1] is extend.new_attribute
+        assert row[keys[1]] == IRI("http://example.org/alice")
+
+        evaluate = compile_expression(Reference("".join(["user", ".", "login"])), frozenset({name}))
+        assert "user.login" in evaluate.__code__.co_consts
+        assert any(constant is keys[0] for constant in evaluate.__code__.co_consts)
+
+        fused = MultiExtendOperator(source, []).extend("".join(["user", ".", "iri"]), Constant("x"))
+        assert fused.assignments[0][0] is extend.new_attribute
+
+        debug_logger("Validation", "✓ Tuple keys, References and generated code share the attribute names")
+
+    def test_pure_function_memoization(self, debug_logger):
+        """
+        Test that calls of functions marked with @pure are memoized per distinct arguments.
+
+        Validates that the compiled and interpreted evaluations call a pure
+        function once per distinct (typed) arguments, that equal values of
+        different types are not confused, and that unhashable arguments and
+        impure functions are still evaluated on every call.
+        """
+        from pyhartig.functions.builtins import pure
+
+        calls = []
+
+        @pure
+        def describe(value):
+            calls.append(value)
+            return f"{type(value).__name__}:{value}"
+
+        def impure(value):
+            calls.append(value)
+            return value
+
+        expression = FunctionCall(describe, [Reference("v")])
+        compiled = expression.compile()
+        rows = [MappingTuple({"v": v}) for v in ("a", "a", 1, True, 1.0, 1, ["x"], ["x"])]
+
+        results = [compiled(row) for row in rows]
+
+        debug_logger("Memoized Calls", lambda: f"Results: {results}\nCalls: {calls}")
+
+        assert results == ["str:a", "str:a", "int:1", "bool:True", "float:1.0", "int:1", "list:['x']", "list:['x']"]
+        assert calls == ["a", 1, True, 1.0, ["x"], ["x"]]
+        assert expression.evaluate(MappingTuple({"v": "a"})) == "str:a"
+
+        # Interpreted evaluation: results are memoized even when they are None (a miss is a sentinel)
+        @pure
+        def nothing(value):
+            calls.append(value)
+            return None
+
+        calls.clear()
+        interpreted = FunctionCall(nothing, [Reference("v")])
+        assert [interpreted.evaluate(row) for row in rows] == [None] * len(rows)
+        assert calls == ["a", 1, True, 1.0, ["x"], ["x"]]
+
+        calls.clear()
+        impure_expression = FunctionCall(impure, [Reference("v")])
+        assert [impure_expression.compile()(row) for row in rows[:2]] == ["a", "a"]
+        assert calls == ["a", "a"]
+
+        debug_logger("Validation", "✓ Pure functions evaluated once per distinct arguments")
+
+    def test_compiled_expression_cache(self, debug_logger):
+        """
+        Test that structurally identical expressions share their generated function.
+
+        Validates that expressions differing by a constant value, by the type
+        of a constant, or by the schema attributes they reference are compiled
+        separately (including equal values of different types inside
+        containers), and that unhashable constants and subclass nodes are
+        compiled without caching.
+        """
+        from pyhartig.expressions._codegen import clear_compile_cache, compile_column_expression
+
+        class UpperReference(Reference):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return super().evaluate(tuple_data).upper()
+
+        def build(separator):
+            return FunctionCall(concat, [Reference("first"), Constant(separator), Reference("last")])
+
+        clear_compile_cache()
+        compiled = build(" ").compile()
+        schema_compiled = build(" ").compile(frozenset({"first", "last", "other"}))
+
+        debug_logger("Compiled Functions", lambda: f"{compiled} / {schema_compiled}")
+
+        assert build(" ").compile() is compiled
+        assert build(" ").compile(frozenset({"first", "last"})) is schema_compiled
+        assert schema_compiled is not compiled
+        assert build("-").compile() is not compiled
+        assert FunctionCall(concat, [Reference("first"), Constant(1), Reference("last")]).compile() is not \
+            FunctionCall(concat, [Reference("first"), Constant(True), Reference("last")]).compile()
+
+        row = MappingTuple({"first": "Ada", "last": "Lovelace"})
+        assert compiled(row) == Literal("Ada Lovelace")
+        assert build("-").compile()(row) == Literal("Ada-Lovelace")
+
+        unhashable = FunctionCall(concat, [Reference("first"), Constant(["x"])])
+        assert unhashable.compile() is not unhashable.compile()
+        assert unhashable.compile()(row) == unhashable.evaluate(row)
+
+        # Equal constants of different types, also inside containers, are compiled separately
+        def pair(first, second):
+            return first, second
+
+        variants = [(1,), (True,), (1.0,), (0.0,), (-0.0,), (IRI("x"),), ((1, 2.0),), ((True, 2),)]
+        for value in variants:
+            FunctionCall(pair, [Reference("first"), Constant(value)]).compile()
+        for value in variants:
+            result = FunctionCall(pair, [Reference("first"), Constant(value)]).compile()(row)
+            assert result == ("Ada", value) and repr(result[1]) == repr(value)
+
+        # Same structure as a memoized tree, but with a subclass node: never shares its function
+        subclassed = FunctionCall(concat, [UpperReference("first"), Constant(" "), Reference("last")])
+        assert subclassed.compile() is not compiled
+        assert subclassed.compile()(row) == Literal("ADA Lovelace")
+        assert compile_column_expression(build(" ")) is not None
+        assert compile_column_expression(subclassed) is None
+
+        debug_logger("Validation", "✓ Generated functions shared by structurally identical expressions")
+
+    def test_evaluate_compiles_after_threshold(self, debug_logger):
+        """
+        Test the compilation of expressions evaluated many times through evaluate().
+
+        Validates that the tree is walked node by node up to the threshold,
+        that the generated function gives the same results afterwards, and
+        that trees with subclassed nodes are never compiled.
+        """
+        from pyhartig.expressions.FunctionCall import COMPILE_THRESHOLD
+
+        class UpperConstant(Constant):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return self.value.upper()
+
+        plain = FunctionCall(to_iri, [FunctionCall(concat, [Constant("p/"), Reference("id")]),
+                                      Constant("http://ex.org/")])
+        custom = FunctionCall(concat, [UpperConstant("p"), Reference("id")])
+        rows = [MappingTuple({"id": str(i % 7)}) for i in range(COMPILE_THRESHOLD + 10)]
+        rows.append(MappingTuple())
+
+        plain_results = [plain.evaluate(row) for row in rows[:COMPILE_THRESHOLD - 1]]
+        assert plain._compiled is None
+        plain_results += [plain.evaluate(row) for row in rows[COMPILE_THRESHOLD - 1:]]
+        custom_results = [custom.evaluate(row) for row in rows]
+
+        debug_logger("Compiled Function", lambda: f"{plain._compiled}")
+
+        assert plain._compiled is not None and custom._compiled is None
+        assert plain_results == [IRI(f"http://ex.org/p/{i % 7}") for i in range(COMPILE_THRESHOLD + 10)] + [EPSILON]
+        assert custom_results[0] == Literal("P0") and custom_results[-1] is EPSILON
+
+        # The generated function stays valid: the function and the arguments cannot be changed
+        with pytest.raises(TypeError):
+            plain.arguments[1] = Constant("http://other.org/")
+        with pytest.raises(AttributeError):
+            plain.arguments = [Reference("id")]
+        with pytest.raises(AttributeError):
+            plain.function = to_literal
+
+        debug_logger("Validation", "✓ Expressions compiled once evaluated COMPILE_THRESHOLD times")
+
+    def test_generated_code_inlines_builtins(self, debug_logger):
+        """
+        Test the inlined construction of terms by to_iri, to_literal and concat in generated code.
+
+        Validates that the inlined paths match evaluate() for native strings,
+        native integers (not booleans, nor integers too long to format),
+        Literals, other values and EPSILON, and that calls with non-string
+        constants keep the generic call only.
+        """
+        from pyhartig.expressions._codegen import generate_source
+
+        xsd_integer = "http://www.w3.org/2001/XMLSchema#integer"
+        expressions = [
+            FunctionCall(to_iri, [FunctionCall(concat, [Constant("person/"), Reference("id")]),
+                                  Constant("http://ex.org/")]),
+            FunctionCall(to_literal, [Reference("id"), Constant(xsd_integer)]),
+            FunctionCall(concat, [Reference("id"), Constant(1)]),
+            FunctionCall(concat, [Reference("id"), Constant(" {id} "), Reference("id")]),
+            FunctionCall(to_iri, [Reference("id"), Constant("http://ex.org/")])
+        ]
+        source = generate_source(expressions[0])
+
+        debug_logger("Generated Source", source)
+
+        assert "_literal(f'{c0}{" in source
+        assert "_iri(" in source
+        assert "_literal(" in generate_source(expressions[1])
+        assert "_literal(" not in generate_source(expressions[2])
+        assert "elif type(v0) is int:" in generate_source(expressions[4])
+
+        tuples = [MappingTuple({"id": value}) for value in
+                  ("1", "a b", "urn:x", Literal("7"), IRI("http://ex.org/i"), 3, -42, True, 10 ** 5000,
+                   None, EPSILON, ["x"])]
+        tuples.append(MappingTuple())
+        for expression in expressions:
+            compiled = expression.compile()
+            assert [compiled(t) for t in tuples] == [expression.evaluate(t) for t in tuples]
+
+        debug_logger("Validation", "✓ Built-in terms constructed inline, same results as evaluate()")
+
+    def test_generated_code_reads_overlays(self, debug_logger):
+        """
+        Test the code generated for expressions evaluated on the overlay of a fused Extend chain.
+
+        Validates that attributes added by the chain are read from the extras,
+        that other attributes are looked up in the extras then in the parent
+        tuple (EPSILON if missing), and that the results match evaluate().
+        """
+        from pyhartig.expressions._codegen import generate_source, compile_expression
+        from pyhartig.algebra.Tuple import ChainedMappingTuple
+
+        expression = FunctionCall(concat, [Reference("full"), Reference("id"), Reference("missing")])
+        partial = FunctionCall(concat, [Reference("full"), Constant(" #"), Reference("id")])
+        schema = frozenset({"id", "full"})
+        added = frozenset({"full"})
+        source = generate_source(partial, schema, added)
+
+        debug_logger("Generated Source", source)
+
+        assert "extras['full']" in source
+        assert "extras['id'] if 'id' in extras else parent['id']" in source
+        assert "parent.get('missing', EPSILON)" in generate_source(expression, schema, added)
+
+        rows = [
+            ChainedMappingTuple(MappingTuple({"id": "1"}), {"full": "Alice Smith"}),
+            # Attribute of the input overlay, shadowing the parent tuple
+            ChainedMappingTuple(MappingTuple({"id": "1"}), {"id": "2", "full": "Bob", "missing": "!"}),
+            ChainedMappingTuple(MappingTuple({"id": 3}), {"full": "Eve"})
+        ]
+        for e in (expression, partial):
+            compiled = compile_expression(e, schema, added)
+            assert [compiled(row) for row in rows] == [e.evaluate(row) for row in rows]
+        assert compile_expression(partial, schema, added) is not compile_expression(partial, schema)
+
+        debug_logger("Validation", "✓ Overlay dictionaries read directly, same results as evaluate()")
@@ -6,6 +6,7 @@ in the project, including JSON processing (jsonpath-ng) and potential
 RDF library integration scenarios.
 """
 
+import sys
 import pytest
 import json
 from jsonpath_ng import parse
@@ -15,19 +16,24 @@ class TestLibraryIntegration:
     """Test suite for external library integration."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     # =========================================================================
@@ -62,7 +68,7 @@ class TestLibraryIntegration:
         matches2 = [match.value for match in path2.find(data)]
         
         debug_logger("Test Cases", 
-                     f"Data:\n{json.dumps(data, indent=2)}\n\n"
+                     lambda: f"Data:\n{json.dumps(data, indent=2)}\n\n"
                      f"Query 1: $.store.book[*].title\n"
                      f"Results: {matches1}\n\n"
                      f"Query 2: $.store.book[0]\n"
@@ -210,7 +216,7 @@ class TestLibraryIntegration:
         )
         
         debug_logger("Configuration", 
-                     f"Data:\n{json.dumps(data, indent=2)}\n\n"
+                     lambda: f"Data:\n{json.dumps(data, indent=2)}\n\n"
                      f"Iterator: $.products[*]\n"
                      f"Mappings:\n"
                      f"  - product_id: $.id\n"
@@ -221,7 +227,7 @@ class TestLibraryIntegration:
         result = operator.execute()
         
         debug_logger("Execution Result", 
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result)))
         
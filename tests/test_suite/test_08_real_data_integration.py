@@ -6,6 +6,7 @@ including the test_data.json and test_mapping.rml files. These tests
 validate end-to-end functionality with realistic data scenarios.
 """
 
+import sys
 import pytest
 import json
 from pathlib import Path
@@ -22,19 +23,24 @@ class TestRealDataIntegration:
     """Test suite for integration with actual project data files."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -80,7 +86,7 @@ class TestRealDataIntegration:
                      "Objective: Validate test_data.json structure")
         
         debug_logger("Loaded Data", 
-                     json.dumps(test_data_json, indent=2))
+                     lambda: json.dumps(test_data_json, indent=2))
         
         # Validate structure
         assert "project" in test_data_json
@@ -122,7 +128,7 @@ class TestRealDataIntegration:
         result = operator.execute()
         
         debug_logger("Execution Result", 
-                     f"Extracted {len(result)} team members:\n" + 
+                     lambda: f"Extracted {len(result)} team members:\n" + 
                      "\n".join(f"  {i+1}. ID={t['member_id']}, Name={t['member_name']}" 
                               for i, t in enumerate(result)))
         
@@ -159,7 +165,7 @@ class TestRealDataIntegration:
         result = operator.execute()
         
         debug_logger("Execution Result", 
-                     f"Total member-role pairs: {len(result)}\n"
+                     lambda: f"Total member-role pairs: {len(result)}\n"
                      f"Tuples:\n" + 
                      "\n".join(f"  {i+1}. {t['member_name']} - {t['role']}" 
                               for i, t in enumerate(result)))
@@ -201,7 +207,7 @@ class TestRealDataIntegration:
         result = operator.execute()
         
         debug_logger("Execution Result", 
-                     f"Total member-skill pairs: {len(result)}\n"
+                     lambda: f"Total member-skill pairs: {len(result)}\n"
                      f"Sample tuples:\n" + 
                      "\n".join(f"  {i+1}. {t['member_name']} - {t['skill']}" 
                               for i, t in enumerate(result[:5])))
@@ -223,7 +229,7 @@ class TestRealDataIntegration:
         simulating a realistic mapping scenario.
         """
         debug_logger("Test: Complete RDF Generation Pipeline", 
-                     "Objective: Transform test data to RDF triples\n"
+                     lambda: "Objective: Transform test data to RDF triples\n"
                      f"Input data:\n{json.dumps(test_data_json, indent=2)}")
         
         # Stage 1: Extract team members with roles and skills
@@ -308,7 +314,7 @@ class TestRealDataIntegration:
         result = pipeline.execute()
         
         debug_logger("Pipeline Execution Complete", 
-                     f"Total RDF tuple structures: {len(result)}\n"
+                     lambda: f"Total RDF tuple structures: {len(result)}\n"
                      f"First 5 tuples:\n" + 
                      "\n".join(f"  {i+1}. {tuple}" for i, tuple in enumerate(result[:5])))
         
@@ -341,7 +347,7 @@ class TestRealDataIntegration:
         bob_tuples = [t for t in result if t["member_name"] == "Bob"]
         
         debug_logger("Result Analysis", 
-                     f"Total tuples: {len(result)}\n"
+                     lambda: f"Total tuples: {len(result)}\n"
                      f"Alice tuples: {len(alice_tuples)}\n"
                      f"Bob tuples: {len(bob_tuples)}\n\n"
                      f"Sample Alice tuple:\n"
@@ -451,3 +457,59 @@ class TestRealDataIntegration:
                      f"✓ Project metadata extracted\n"
                      f"✓ Project name: {result[0]['project_name']}")
 
+
+    def test_mapping_parser_loads_each_source_once(self, tmp_path, monkeypatch, debug_logger):
+        """
+        Test that Triples Maps reading the same file share its parsed data.
+
+        Validates that the file is parsed once per mapping, and that every
+        source of the plan reads the same JSON object.
+        """
+        from pyhartig.mapping.MappingParser import MappingParser
+
+        (tmp_path / "people.json").write_text(json.dumps(
+            {"people": [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Alan"}]}
+        ))
+        logical_source = ('rml:logicalSource [ rml:source "people.json"; '
+                          'rml:referenceFormulation ql:JSONPath; rml:iterator "$.people[*]" ]')
+        (tmp_path / "mapping.ttl").write_text(f"""
+@prefix rr: <http://www.w3.org/ns/r2rml#> .
+@prefix rml: <http://semweb.mmlab.be/ns/rml#> .
+@prefix ql: <http://semweb.mmlab.be/ns/ql#> .
+@prefix schema: <http://schema.org/> .
+
+<#PersonMapping> a rr:TriplesMap;
+  {logical_source};
+  rr:subjectMap [ rr:template "http://example.org/person/{{id}}" ];
+  rr:predicateObjectMap [ rr:predicate schema:name; rr:objectMap [ rml:reference "name" ] ].
+
+<#AccountMapping> a rr:TriplesMap;
+  {logical_source};
+  rr:subjectMap [ rr:template "http://example.org/account/{{id}}" ];
+  rr:predicateObjectMap [ rr:predicate schema:identifier; rr:objectMap [ rml:reference "id" ] ].
+""")
+
+        loads = []
+        original_load = json.load
+        monkeypatch.setattr(json, "load", lambda f: loads.append(f.name) or original_load(f))
+        monkeypatch.chdir(tmp_path)
+
+        plan = MappingParser("mapping.ttl").parse()
+
+        def sources(operator):
+            if isinstance(operator, JsonSourceOperator):
+                return [operator]
+            children = getattr(operator, "operators", None) or [operator.parent_operator]
+            return [source for child in children for source in sources(child)]
+
+        found = sources(plan)
+        result = plan.execute()
+
+        debug_logger("Parsed Sources", lambda: f"Loads: {loads}\nSources: {len(found)}\nTuples: {len(result)}")
+
+        assert loads == ["people.json"]
+        assert len(found) == 2
+        assert found[0].source_data is found[1].source_data
+        assert len(result) == 4
+
+        debug_logger("Validation", "✓ Source file parsed once and shared by the Triples Maps")
@@ -6,6 +6,7 @@ which merges the results of multiple operators into a single relation.
 Tests validate merging behavior, tuple preservation, and empty result handling.
 """
 
+import sys
 import pytest
 from pyhartig.operators.UnionOperator import UnionOperator
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
@@ -21,19 +22,24 @@ class TestUnionOperator:
     """Test suite for the Union operator."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
         
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -122,7 +128,7 @@ class TestUnionOperator:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Tuples:\n" + "\n".join(f"  {i + 1}. {tuple}" for i, tuple in enumerate(result)))
 
         # Validations
@@ -195,7 +201,7 @@ class TestUnionOperator:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Departments present: {set(t['dept'] for t in result)}")
 
         assert len(result) == 6, "Union should produce 6 tuples"
@@ -273,7 +279,7 @@ class TestUnionOperator:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Number of tuples: {len(result)}\n"
+                     lambda: f"Number of tuples: {len(result)}\n"
                      f"Sample subjects:\n" + 
                      "\n".join(f"  - {t['subject']}" for t in result[:2]))
 
@@ -401,7 +407,7 @@ class TestUnionOperator:
         result = union_op.execute()
 
         debug_logger("Execution Result",
-                     f"Order: " + ", ".join(t["person_name"] for t in result))
+                     lambda: f"Order: " + ", ".join(t["person_name"] for t in result))
 
         # First two should be from dataset_a
         assert result[0]["person_name"] == "Alice"
@@ -11,6 +11,7 @@ Project^P(r) : (A, I) -> (P, I')
 - Result : New mapping relation (P, I') where I' = { t[P] | t ∈ I }
 """
 
+import sys
 import pytest
 from pyhartig.operators.ProjectOperator import ProjectOperator
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
@@ -27,19 +28,24 @@ class TestProjectOperator:
     """Test suite for the Project operator."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
 
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -496,6 +502,54 @@ class TestProjectOperator:
         ids = [row["person_id"] for row in result]
         assert ids == [1, 2, 3]
 
+    def test_static_schema(self, source_operator, debug_logger):
+        """
+        Test the attributes known at construction time (schema()) of operator trees.
+
+        Validates that the schema of the child relation lets the projection
+        skip its per-tuple validation, while relations with an unknown or
+        heterogeneous schema are still validated tuple by tuple.
+        """
+        from pyhartig.operators.Operator import Operator
+        from pyhartig.algebra.Tuple import MappingTuple
+
+        extended = source_operator.extend("type", Constant("Person"))
+        project = ProjectOperator(extended, {"person_name", "type"})
+        other = JsonSourceOperator(
+            source_data={"items": [{"id": 9}]},
+            iterator_query="$.items[*]",
+            attribute_mappings={"id": "$.id"}
+        )
+
+        debug_logger("Schemas", lambda: f"Source: {sorted(source_operator.schema())}\n"
+                                        f"Extend: {sorted(extended.schema())}\n"
+                                        f"Project: {sorted(project.schema())}")
+
+        assert extended.schema() == source_operator.schema() | {"type"}
+        assert project.schema() == {"person_name", "type"}
+        assert UnionOperator([project, project]).schema() == {"person_name", "type"}
+        assert UnionOperator([source_operator, other]).schema() is None
+        assert Operator.schema(source_operator) is None
+
+        # Known schema: no per-tuple validation, same tuples
+        assert [set(row.keys()) for row in project.execute()] == [{"person_name", "type"}] * 3
+
+        # Heterogeneous union: still validated tuple by tuple
+        with pytest.raises(KeyError):
+            ProjectOperator(UnionOperator([source_operator, other]), {"id"}).execute()
+
+        # Source subclass overriding execute(): unknown schema, tuples validated with the strict-mode error
+        class PartialSource(JsonSourceOperator):
+            def execute(self):
+                return [MappingTuple({"id": row["id"]}) for row in super().execute()]
+
+        partial = PartialSource(other.source_data, other.iterator_query, {"id": "$.id", "code": "$.id"})
+        assert partial.schema() is None
+        with pytest.raises(KeyError, match="ProjectOperator: Attribute"):
+            ProjectOperator(partial, {"code"}).execute()
+
+        debug_logger("Validation", "✓ Static schemas computed from the operator tree")
+
 
 class TestProjectOperatorIntegration:
     """Integration tests for Project operator in complex pipelines."""
@@ -583,4 +637,3 @@ class TestProjectOperatorIntegration:
             # Schema-specific attributes should not be present
             assert "dept" not in row
             assert "role" not in row
-
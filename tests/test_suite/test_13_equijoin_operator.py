@@ -15,6 +15,7 @@ EqJoin^J(r₁, r₂) : Operator × Operator → Operator
     - I = { t₁ ∪ t₂ | t₁ ∈ I₁, t₂ ∈ I₂, ∀(a₁, a₂) ∈ J : t₁(a₁) = t₂(a₂) }
 """
 
+import sys
 import pytest
 from pyhartig.operators.EquiJoinOperator import EquiJoinOperator
 from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
@@ -32,19 +33,24 @@ class TestEquiJoinOperator:
     """Test suite for the EquiJoin operator."""
 
     @pytest.fixture
-    def debug_logger(self):
+    def debug_logger(self, debug_trace_enabled):
         """
         Fixture providing a debug logging function.
 
         Returns:
             callable: Function for structured debug output
         """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
         def log(section, message):
-            print(f"\n{'=' * 80}")
-            print(f"[DEBUG] {section}")
-            print(f"{'-' * 80}")
-            print(message)
-            print(f"{'=' * 80}\n")
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
         return log
 
     @pytest.fixture
@@ -858,3 +864,59 @@ class TestEquiJoinOperator:
         assert row["right_x"] == "RX"
         assert row["right_y"] is True
 
+
+    def test_equijoin_streams_left_relation(self, employees_source, departments_source, debug_logger):
+        """
+        Test that the equijoin pulls the tuples of its left relation one at a time.
+
+        Validates that the first joined tuple is produced before the left
+        relation is exhausted, and that execute() returns the same tuples.
+        """
+        pulled = []
+
+        class CountingSource(JsonSourceOperator):
+            def execute_iter(self):
+                for row in super().execute_iter():
+                    pulled.append(row)
+                    yield row
+
+        left = CountingSource(
+            source_data=employees_source.source_data,
+            iterator_query=employees_source.iterator_query,
+            attribute_mappings=employees_source.attribute_mappings
+        )
+        equijoin = EquiJoinOperator(left, departments_source, A=["emp_dept_id"], B=["dept_id"])
+
+        first = next(equijoin.execute_iter())
+
+        debug_logger("First Joined Tuple", lambda: f"{first} (left tuples pulled: {len(pulled)})")
+
+        assert first["emp_name"] == "Alice"
+        assert first["dept_name"] == "Engineering"
+        assert len(pulled) == 1
+        assert list(equijoin.execute_iter()) == equijoin.execute()
+        assert len(equijoin.execute()) == 4
+
+        debug_logger("Validation", "✓ Left relation streamed, right relation materialized once")
+
+    def test_equijoin_empty_right_evaluates_left(self, employees_source, debug_logger):
+        """
+        Test that an empty right relation does not hide the errors of the left one.
+
+        Validates that the left relation is still evaluated, so a strict-mode
+        projection error is raised as with the materialized join.
+        """
+        empty = JsonSourceOperator(
+            source_data={"departments": []},
+            iterator_query="$.departments[*]",
+            attribute_mappings={"dept_id": "$.id"}
+        )
+        typo = ProjectOperator(employees_source, {"emp_dept_id", "typo"})
+
+        debug_logger("Left Relation", lambda: typo.explain())
+
+        assert EquiJoinOperator(employees_source, empty, A=["emp_dept_id"], B=["dept_id"]).execute() == []
+        with pytest.raises(KeyError, match="ProjectOperator: Attribute"):
+            EquiJoinOperator(typo, empty, A=["emp_dept_id"], B=["dept_id"]).execute()
+
+        debug_logger("Validation", "✓ Left relation evaluated when the right one is empty")
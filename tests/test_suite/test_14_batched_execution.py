@@ -0,0 +1,549 @@
+"""
+Test Suite for Batched (Columnar) Execution
+
+This module provides unit tests for the column-oriented execution path,
+where operators exchange ColumnBatch objects and expressions are evaluated
+one column at a time through execute_batched() / evaluate_batch().
+"""
+
+import dis
+import sys
+import pytest
+from pyhartig.algebra.ColumnBatch import ColumnBatch
+from pyhartig.algebra.Tuple import MappingTuple, EPSILON
+from pyhartig.algebra.Terms import IRI, Literal
+from pyhartig.operators.ExtendOperator import ExtendOperator
+from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+from pyhartig.operators.UnionOperator import UnionOperator
+from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
+from pyhartig.expressions.Constant import Constant
+from pyhartig.expressions.Reference import Reference
+from pyhartig.expressions.FunctionCall import FunctionCall
+from pyhartig.functions.builtins import to_iri, to_literal, concat
+
+
+class TestBatchedExecution:
+    """Test suite for the batched execution path."""
+
+    @pytest.fixture
+    def debug_logger(self, debug_trace_enabled):
+        """
+        Fixture providing a debug logging function.
+
+        Returns:
+            callable: Function for structured debug output
+        """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
+        def log(section, message):
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
+        return log
+
+    @pytest.fixture
+    def source_operator(self):
+        """
+        Fixture providing a source operator over a small team.
+
+        Returns:
+            JsonSourceOperator: Configured operator with sample data
+        """
+        data = {
+            "team": [
+                {"id": "1", "name": "Alice"},
+                {"id": "2", "name": "Bob"},
+                {"id": "3", "name": "Charlie"}
+            ]
+        }
+        return JsonSourceOperator(
+            source_data=data,
+            iterator_query="$.team[*]",
+            attribute_mappings={"id": "$.id", "name": "$.name"}
+        )
+
+    @staticmethod
+    def _flatten(batches):
+        """
+        Convert an iterator of batches back to a list of tuples.
+        """
+        return [row for batch in batches for row in batch.to_tuples()]
+
+    def test_column_batch_round_trip(self, debug_logger):
+        """
+        Test conversion between row-oriented tuples and column batches.
+
+        Validates that consecutive tuples with the same attributes share a
+        batch and that tuple order is preserved, batch by batch and for a
+        whole sequence of batches.
+        """
+        tuples = [
+            MappingTuple({"a": 1, "b": 2}),
+            MappingTuple({"a": 3, "b": 4}),
+            MappingTuple({"x": 5}),
+            MappingTuple({"a": 6, "b": 7}),
+        ]
+
+        batches = list(ColumnBatch.from_tuples(tuples))
+
+        debug_logger("Column Batches", lambda: "\n".join(f"  {b} -> {b.columns}" for b in batches))
+
+        assert [len(b) for b in batches] == [2, 1, 1]
+        assert batches[0]["a"] == [1, 3]
+        assert self._flatten(batches) == tuples
+        assert [row for b in batches for row in b.to_tuples()] == tuples
+        assert all(type(row) is MappingTuple for b in batches for row in b.to_tuples())
+        assert ColumnBatch({}, 2).to_tuples() == [MappingTuple(), MappingTuple()]
+
+        # Generated row builder: attribute names needing quoting, single column
+        quoted = ColumnBatch({"it's": [1, 2], "a\\b": ["x", "y"], "{v0}": [None, EPSILON]})
+        assert quoted.to_tuples() == [MappingTuple({"it's": 1, "a\\b": "x", "{v0}": None}),
+                                      MappingTuple({"it's": 2, "a\\b": "y", "{v0}": EPSILON})]
+        assert ColumnBatch({"a": [1]}).to_tuples() == [MappingTuple({"a": 1})]
+
+        # One list for a sequence of batches, empty batches included
+        assert ColumnBatch.to_tuple_list(batches) == tuples
+        assert ColumnBatch.to_tuple_list([ColumnBatch({"a": []}, 0)] + batches) == tuples
+        assert ColumnBatch.to_tuple_list([]) == []
+
+    def test_batched_extend_matches_execute(self, source_operator, debug_logger):
+        """
+        Test that the batched Extend path yields the same tuples as execute().
+        """
+        subject_expr = FunctionCall(to_iri, [
+            FunctionCall(concat, [Constant("http://example.org/person/"), Reference("id")])
+        ])
+        label_expr = FunctionCall(to_literal, [
+            Reference("name"), Constant("http://www.w3.org/2001/XMLSchema#string")
+        ])
+        pipeline = source_operator.extend("subject", subject_expr).extend("label", label_expr)
+
+        batched_result = self._flatten(pipeline.execute_batched())
+        result = pipeline.execute()
+
+        debug_logger("Batched Result", lambda: "\n".join(f"  {row}" for row in batched_result))
+
+        assert batched_result == result
+        assert batched_result == list(pipeline.execute_iter())
+        assert batched_result[0]["subject"] == IRI("http://example.org/person/1")
+        assert batched_result[2]["label"] == Literal("Charlie")
+
+    def test_extend_execute_uses_batches(self, source_operator, debug_logger):
+        """
+        Test that execute() on an Extend chain over a source goes through the column batches.
+
+        Validates that the rows of the source are never built one by one and
+        that the materialized tuples match the tuple-at-a-time path.
+        """
+        pipeline = source_operator.extend("type", Constant("Person")).extend("label", Reference("name"))
+        expected = list(pipeline.execute_iter())
+
+        def fail():
+            raise AssertionError("source executed tuple at a time")
+        source_operator.execute_iter = fail
+
+        result = pipeline.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert result == expected
+        assert all(type(row) is MappingTuple for row in result)
+        assert [list(row.keys()) for row in result] == [["id", "name", "type", "label"]] * 3
+
+        debug_logger("Validation", "✓ Extend chain over a source executed column by column")
+
+    def test_union_execute_uses_batches(self, source_operator, debug_logger):
+        """
+        Test that execute() on a Union of Extend chains over sources materializes each child
+        through its own execute(), hence through the column batches.
+
+        Validates that the tuples and their order match the tuple-at-a-time path,
+        including nested unions and children without a batched path.
+        """
+        other_source = JsonSourceOperator({"items": [{"id": 9}]}, "$.items[*]", {"id": "$.id"})
+        branches = [source_operator.extend("type", Constant(kind)) for kind in ("Person", "Agent")]
+        # Last child: Extend over a Union, executed tuple at a time
+        pipeline = UnionOperator([UnionOperator(branches), UnionOperator([other_source]).extend("x", Constant(1))])
+        expected = list(pipeline)
+
+        def fail():
+            raise AssertionError("source executed tuple at a time")
+        source_operator.execute_iter = fail
+
+        result = pipeline.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert result == expected
+        assert [row["type"] for row in result[:6]] == ["Person"] * 3 + ["Agent"] * 3
+        assert result[6] == {"id": 9, "x": 1}
+
+        debug_logger("Validation", "✓ Union children materialized through their own execute()")
+
+    def test_multi_extend_execute_uses_batches(self, source_operator, debug_logger):
+        """
+        Test that execute() on a MultiExtend over a source goes through the column batches.
+
+        Validates that all the new columns are added to one batch sharing the
+        source columns, and that the materialized tuples match the
+        tuple-at-a-time path.
+        """
+        pipeline = MultiExtendOperator(source_operator, [
+            ("type", Constant("Person")),
+            ("label", Reference("name")),
+            ("copy", Reference("label")),
+        ])
+        expected = list(pipeline.execute_iter())
+        source_batch = next(source_operator.execute_batched())
+        batches = list(pipeline.execute_batched())
+
+        def fail():
+            raise AssertionError("source executed tuple at a time")
+        source_operator.execute_iter = fail
+
+        result = pipeline.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert len(batches) == 1
+        assert batches[0]["name"] == source_batch["name"]
+        assert batches[0]["copy"] == ["Alice", "Bob", "Charlie"]
+        assert result == expected
+        assert all(type(row) is MappingTuple for row in result)
+        assert [list(row.keys()) for row in result] == [["id", "name", "type", "label", "copy"]] * 3
+
+        debug_logger("Validation", "✓ MultiExtend over a source executed column by column")
+
+    def test_batched_constant_and_reference(self, source_operator, debug_logger):
+        """
+        Test column evaluation of Constant and Reference expressions.
+
+        A reference yields the parent column itself, a missing reference
+        yields EPSILON for every tuple.
+        """
+        batch = next(source_operator.execute_batched())
+
+        debug_logger("Source Batch", f"{batch} -> {batch.columns}")
+
+        assert Constant("Person").evaluate_batch(batch) == ["Person"] * 3
+        assert Reference("name").evaluate_batch(batch) is batch["name"]
+        assert Reference("missing").evaluate_batch(batch) == [EPSILON] * 3
+
+    def test_batched_custom_expression_compiled_once(self, source_operator, debug_logger):
+        """
+        Test column evaluation of expression types without a column implementation.
+
+        Validates that the expression is compiled once per batch, against
+        the attributes of the batch, and that its closure is applied to
+        every tuple.
+        """
+        from pyhartig.expressions.Expression import Expression
+
+        class Upper(Expression):
+            """Upper-cased value of an attribute, recording its compilations."""
+            __slots__ = ("attribute",)
+            schemas = []
+
+            def __init__(self, attribute):
+                self.attribute = attribute
+
+            def evaluate(self, mapping):
+                raise AssertionError("evaluated without compilation")
+
+            def attrs(self):
+                return frozenset((self.attribute,))
+
+            def compile(self, schema=None):
+                self.schemas.append(schema)
+                attribute = self.attribute
+                return lambda tuple_data: tuple_data[attribute].upper()
+
+        batch = next(source_operator.execute_batched())
+        result = Upper("name").evaluate_batch(batch)
+
+        debug_logger("Result", lambda: str(result))
+
+        assert result == [name.upper() for name in batch["name"]]
+        assert Upper.schemas == [frozenset(batch.columns)]
+
+        debug_logger("Validation", "✓ Custom expression compiled once per batch")
+
+    def test_batched_subclass_overriding_evaluate(self, source_operator, debug_logger):
+        """
+        Test column evaluation of subclasses of the built-in expressions.
+
+        Validates that a subclass overriding evaluate() only is evaluated
+        through its own evaluate() by the batched Extend and Union paths,
+        alone or as an argument of a function call.
+        """
+        class UpperReference(Reference):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return super().evaluate(tuple_data).upper()
+
+        class UpperConstant(Constant):
+            __slots__ = ()
+
+            def evaluate(self, tuple_data):
+                return self.value.upper()
+
+        names = ["ALICE", "BOB", "CHARLIE"]
+        upper = ExtendOperator(source_operator, "upper", UpperReference("name"))
+        call = ExtendOperator(source_operator, "upper",
+                              FunctionCall(concat, [UpperReference("name"), UpperConstant("x")]))
+        kernel = ExtendOperator(source_operator, "upper", FunctionCall(to_literal, [
+            UpperReference("name"), Constant("http://www.w3.org/2001/XMLSchema#string")
+        ]))
+
+        result = upper.execute()
+
+        debug_logger("Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert [row["upper"] for row in result] == names
+        assert [row["upper"] for row in call.execute()] == [Literal(f"{name}X") for name in names]
+        assert [row["upper"] for row in kernel.execute()] == [Literal(name) for name in names]
+        assert [row["upper"] for row in UnionOperator([upper, call]).execute()] == \
+            names + [Literal(f"{name}X") for name in names]
+
+        debug_logger("Validation", "✓ Overridden evaluate() of subclasses honoured by column evaluation")
+
+    def test_batched_function_call_epsilon(self, source_operator, debug_logger):
+        """
+        Test EPSILON propagation in column evaluation of function calls.
+        """
+        expr = FunctionCall(concat, [Reference("name"), Reference("missing")])
+        result = self._flatten(ExtendOperator(source_operator, "bad", expr).execute_batched())
+
+        debug_logger("Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert len(result) == 3
+        assert all(row["bad"] == EPSILON for row in result)
+
+    def test_batched_extend_over_heterogeneous_union(self, debug_logger):
+        """
+        Test batched execution over a union of sources with different attributes.
+        """
+        source_a = JsonSourceOperator({"items": [{"id": 1}]}, "$.items[*]", {"id": "$.id"})
+        source_b = JsonSourceOperator({"items": [{"code": "B"}]}, "$.items[*]", {"code": "$.code"})
+        extend = ExtendOperator(UnionOperator([source_a, source_b]), "tag", Reference("id"))
+
+        result = self._flatten(extend.execute_batched())
+
+        debug_logger("Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert result == extend.execute()
+        assert result[0]["tag"] == 1
+        assert result[1]["tag"] == EPSILON
+        assert set(result[1].keys()) == {"code", "tag"}
+
+    def test_batched_source_and_union(self, source_operator, debug_logger):
+        """
+        Test native batched execution of Source and Union operators.
+
+        Validates that a source produces a single batch and that a union
+        concatenates consecutive batches with the same attributes.
+        """
+        source_batches = list(source_operator.execute_batched())
+        union = UnionOperator([source_operator, source_operator])
+        union_batches = list(union.execute_batched())
+
+        debug_logger("Batches",
+                     f"Source: {source_batches}\n"
+                     f"Union: {union_batches}")
+
+        assert len(source_batches) == 1
+        assert source_batches[0]["name"] == ["Alice", "Bob", "Charlie"]
+        assert len(union_batches) == 1
+        assert len(union_batches[0]) == 6
+        assert self._flatten(union_batches) == union.execute()
+
+        other = JsonSourceOperator({"items": [{"code": 1}]}, "$.items[*]", {"code": "$.code"})
+        mixed = UnionOperator([source_operator, source_operator, other, source_operator])
+        mixed_batches = list(mixed.execute_batched())
+
+        assert [len(batch) for batch in mixed_batches] == [6, 1, 3]
+        assert self._flatten(mixed_batches) == mixed.execute()
+
+    def test_batched_source_cartesian_product(self, debug_logger):
+        """
+        Test column-wise construction of the cartesian product of multi-valued attributes.
+
+        Validates that the columns are built in the same order as the
+        row-oriented execution, including contexts without any value.
+        """
+        data = {
+            "items": [
+                {"id": "1", "tags": ["a", "b", "c"], "colors": ["red", "blue"]},
+                {"id": "2", "tags": [], "colors": ["green"]},
+                {"id": "3", "tags": ["d"], "colors": ["black", "white"]}
+            ]
+        }
+        source = JsonSourceOperator(
+            source_data=data,
+            iterator_query="$.items[*]",
+            attribute_mappings={"id": "$.id", "tag": "$.tags[*]", "color": "$.colors[*]"}
+        )
+
+        batches = list(source.execute_batched())
+
+        debug_logger("Columns", lambda: str(batches[0].columns))
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 8
+        assert batches[0]["tag"] == ["a", "a", "b", "b", "c", "c", "d", "d"]
+        assert self._flatten(batches) == source.execute()
+
+    def test_batched_source_single_valued_columns(self, debug_logger):
+        """
+        Test the columns of a source whose contexts have one value per attribute.
+
+        Validates that the transposed columns match the row-oriented
+        execution, and that a single multi-valued context still produces
+        its cartesian product.
+        """
+        rows = [{"id": str(i), "name": f"n{i}", "tags": [f"t{i}"]} for i in range(5)]
+        mappings = {"id": "$.id", "name": "$.name", "tag": "$.tags[*]"}
+        single = JsonSourceOperator({"rows": rows}, "$.rows[*]", mappings)
+        mixed = JsonSourceOperator({"rows": rows + [{"id": "5", "name": "n5", "tags": ["x", "y"]}]},
+                                   "$.rows[*]", mappings)
+
+        batches = list(single.execute_batched())
+        mixed_batches = list(mixed.execute_batched())
+
+        debug_logger("Columns", lambda: f"{batches[0].columns}\n{mixed_batches[0].columns}")
+
+        assert batches[0]["tag"] == ["t0", "t1", "t2", "t3", "t4"]
+        assert self._flatten(batches) == list(single.execute_iter())
+        assert mixed_batches[0]["tag"][-2:] == ["x", "y"]
+        assert self._flatten(mixed_batches) == list(mixed.execute_iter())
+
+        debug_logger("Validation", "✓ Single-valued contexts transposed into columns")
+
+    def test_to_iri_batch_kernel(self, debug_logger):
+        """
+        Test the column kernel of to_iri against the tuple-at-a-time function.
+
+        Validates the fast path as well as values that need full
+        resolution, absolute IRIs and EPSILON.
+        """
+        from pyhartig.functions.builtins import to_iri_batch
+
+        values = ["1", "alice", "a/b", "http://other.org/x", 42, EPSILON, Literal("lit"), ".."]
+        batch = ColumnBatch({"v": values})
+        expr = FunctionCall(to_iri, [Reference("v"), Constant("http://example.org/person/")])
+
+        result = expr.evaluate_batch(batch)
+        expected = [expr.evaluate(row) for row in batch.iter_tuples()]
+
+        debug_logger("Kernel Result", lambda: "\n".join(f"  {v!r} -> {r!r}" for v, r in zip(values, result)))
+
+        assert result == expected
+        assert result[0] == IRI("http://example.org/person/1")
+        assert result[5] == EPSILON
+        assert to_iri_batch(["x", "urn:a"]) == [EPSILON, IRI("urn:a")]
+
+        # Repeated values of a string column share a single IRI instance
+        shared = to_iri_batch(["7", "8", "7", "a b", "a b"], ["http://example.org/"] * 5)
+        assert shared == [to_iri(v, "http://example.org/") for v in ["7", "8", "7", "a b", "a b"]]
+        assert shared[0] is shared[2]
+        assert shared[3] is shared[4]
+        # ... and the same interned instance as to_iri, in every call
+        assert to_iri_batch(["7"], ["http://example.org/"])[0] is shared[0] is to_iri("7", "http://example.org/")
+        # A value urljoin rejects yields EPSILON without affecting the others
+        assert to_iri_batch(["//[x", "a"], ["http://example.org/"] * 2) == [EPSILON, IRI("http://example.org/a")]
+        # Integer columns: built without per-value conversion, same IRIs as to_iri
+        ids = [3, -1, 3, 10 ** 20]
+        numeric = to_iri_batch(ids, ["http://example.org/"] * 4)
+        assert numeric == [to_iri(v, "http://example.org/") for v in ids]
+        assert numeric[0] is numeric[2]
+        assert to_iri_batch([1, True, 1.0], ["http://example.org/"] * 3) == [
+            IRI("http://example.org/1"), IRI("http://example.org/True"), IRI("http://example.org/1.0")
+        ]
+
+    def test_generated_column_loop(self, debug_logger):
+        """
+        Test the generated column-at-a-time evaluation of function calls.
+
+        Validates that it matches the tuple-at-a-time evaluation for
+        attributes referenced several times, missing attributes, EPSILON
+        values, failing functions and unhashable constants.
+        """
+        from pyhartig.expressions._codegen import compile_column_expression, _generate_columns
+
+        def failing(value):
+            raise ValueError(value)
+
+        batch = ColumnBatch({
+            "name": ["Widget", "Gadget", EPSILON, "Gizmo"],
+            "quantity": [5, 3, 1, EPSILON]
+        })
+        expressions = [
+            FunctionCall(concat, [Reference("name"), Constant(" x"), Reference("quantity"), Reference("name")]),
+            FunctionCall(to_literal, [FunctionCall(concat, [Reference("quantity"), Constant("0")]),
+                                      Constant("http://www.w3.org/2001/XMLSchema#integer")]),
+            FunctionCall(concat, [Reference("name"), Reference("missing")]),
+            FunctionCall(concat, [FunctionCall(failing, [Reference("name")]), Constant("x")]),
+            FunctionCall(concat, [Reference("name"), Constant(["unhashable"])]),
+            FunctionCall(len, [Reference("name")])
+        ]
+
+        debug_logger("Generated Source", lambda: _generate_columns(expressions[0])[0])
+
+        for expression in expressions:
+            assert expression.evaluate_batch(batch) == [expression.evaluate(row) for row in batch.iter_tuples()]
+
+        evaluate_columns, attributes = compile_column_expression(expressions[0])
+        assert attributes == ["name", "quantity"]
+        assert evaluate_columns(["a"], [1]) == [Literal("a x1a")]
+        assert compile_column_expression(expressions[4]) is None
+
+        # Constants, functions and called builtins are read as locals in the loop (only zip and the
+        # exception classes, looked up outside of the loop or on errors, stay global)
+        for expression in expressions[:2]:
+            code = compile_column_expression(expression)[0].__code__
+            global_names = {i.argval for i in dis.get_instructions(code) if i.opname == "LOAD_GLOBAL"}
+            assert global_names <= {"zip", "Exception", "TypeError"}
+
+        debug_logger("Validation", "✓ Generated column loop equivalent to evaluate()")
+
+    def test_to_literal_and_concat_batch_kernels(self, debug_logger):
+        """
+        Test the column kernels of to_literal and concat against the tuple-at-a-time functions.
+
+        Validates strings, numbers, RDF terms, values without a lexical
+        form, EPSILON, and uniform as well as per-row datatypes.
+        """
+        from pyhartig.functions.builtins import to_literal_batch, concat_batch
+
+        xsd_integer = "http://www.w3.org/2001/XMLSchema#integer"
+        values = ["1", 2, True, 1.5, Literal("3"), IRI("http://example.org/x"), None, EPSILON, ["x"]]
+        batch = ColumnBatch({"v": values, "w": ["a", "b", "c", "d", "e", "f", "g", "h", "i"]})
+
+        expressions = [
+            FunctionCall(to_literal, [Reference("v"), Constant(xsd_integer)]),
+            FunctionCall(to_literal, [Reference("v"), Reference("w")]),
+            FunctionCall(concat, [Reference("w"), Constant("-"), Reference("v")]),
+            FunctionCall(concat, [Reference("w"), Reference("missing")])
+        ]
+
+        for expression in expressions:
+            result = expression.evaluate_batch(batch)
+
+            debug_logger("Kernel Result", lambda: f"{expression!r}:\n" + "\n".join(f"  {r!r}" for r in result))
+
+            assert result == [expression.evaluate(row) for row in batch.iter_tuples()]
+
+        assert to_literal_batch(["1"], [EPSILON]) == [EPSILON]
+        assert concat_batch(["a", "b"], [1, Literal("c")]) == [Literal("a1"), Literal("bc")]
+        # Columns of native strings only: whole-column path
+        assert concat_batch(["a", "b"], ["-", "-"], ["x", ""]) == [Literal("a-x"), Literal("b-")]
+        assert concat_batch(["a", "b"], ["-", EPSILON]) == [Literal("a-"), EPSILON]
+        assert concat_batch([], []) == []
+
+        debug_logger("Validation", "✓ to_literal and concat kernels equivalent to the functions")
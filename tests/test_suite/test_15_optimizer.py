@@ -0,0 +1,456 @@
+"""
+Test Suite for the Plan Optimizer
+
+This module provides unit tests for the logical plan rewrites of
+pyhartig.optimizer. Every rewrite must return an operator tree that
+produces exactly the same tuples as the original one.
+"""
+
+import sys
+import pytest
+from pyhartig.optimizer import (
+    optimize, fuse_extends, eliminate_dead_extends, hoist_extends, fold_extend_constants, push_down_projections,
+    share_subplans
+)
+from pyhartig.operators.ExtendOperator import ExtendOperator
+from pyhartig.operators.MultiExtendOperator import MultiExtendOperator
+from pyhartig.operators.UnionOperator import UnionOperator
+from pyhartig.operators.ProjectOperator import ProjectOperator
+from pyhartig.operators.EquiJoinOperator import EquiJoinOperator
+from pyhartig.operators.SharedOperator import SharedOperator
+from pyhartig.operators.sources.JsonSourceOperator import JsonSourceOperator
+from pyhartig.expressions.Constant import Constant
+from pyhartig.expressions.Reference import Reference
+from pyhartig.expressions.FunctionCall import FunctionCall
+from pyhartig.functions.builtins import to_iri, concat
+from pyhartig.algebra.Terms import IRI
+
+
+class TestOptimizer:
+    """Test suite for the plan optimizer."""
+
+    @pytest.fixture
+    def debug_logger(self, debug_trace_enabled):
+        """
+        Fixture providing a debug logging function.
+
+        Returns:
+            callable: Function for structured debug output
+        """
+        if not debug_trace_enabled:
+            return lambda section, message: None
+
+        def log(section, message):
+            # Messages may be passed lazily, as a callable building the text
+            if callable(message):
+                message = message()
+            # Single write per trace (instead of one per line)
+            sys.stdout.write(
+                f"\n{'=' * 80}\n[DEBUG] {section}\n{'-' * 80}\n{message}\n{'=' * 80}\n\n"
+            )
+        return log
+
+    @pytest.fixture
+    def source_operator(self):
+        """
+        Fixture providing a source operator over a small team.
+
+        Returns:
+            JsonSourceOperator: Configured operator with sample data
+        """
+        data = {
+            "team": [
+                {"id": "1", "first": "Alice", "last": "Smith"},
+                {"id": "2", "first": "Bob", "last": "Jones"}
+            ]
+        }
+        return JsonSourceOperator(
+            source_data=data,
+            iterator_query="$.team[*]",
+            attribute_mappings={"id": "$.id", "first": "$.first", "last": "$.last"}
+        )
+
+    def test_fuse_extend_chain(self, source_operator, debug_logger):
+        """
+        Test that a chain of Extend operators is fused into one MultiExtend.
+
+        Validates that a later expression can reference an attribute
+        computed earlier in the same chain.
+        """
+        pipeline = (
+            source_operator
+            .extend("full_name", FunctionCall(concat, [Reference("first"), Constant(" "), Reference("last")]))
+            .extend("subject", FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/person/")]))
+            .extend("label", FunctionCall(concat, [Reference("full_name"), Constant(" (person)")]))
+        )
+
+        fused = fuse_extends(pipeline)
+
+        debug_logger("Fused Pipeline", lambda: fused.explain())
+
+        assert isinstance(fused, MultiExtendOperator)
+        assert fused.parent_operator is source_operator
+        assert [a for a, _ in fused.assignments] == ["full_name", "subject", "label"]
+        assert fused.execute() == pipeline.execute()
+        assert fused.execute()[0]["label"].lexical_form == "Alice Smith (person)"
+        assert fused.execute()[1]["subject"] == IRI("http://example.org/person/2")
+
+    def test_fuse_inside_union_and_project(self, source_operator, debug_logger):
+        """
+        Test that fusion is applied below Union and Project operators.
+        """
+        branch_1 = source_operator.extend("a", Constant("x")).extend("b", Reference("a"))
+        branch_2 = source_operator.extend("a", Constant("y")).extend("b", Reference("a"))
+        pipeline = ProjectOperator(UnionOperator([branch_1, branch_2]), {"id", "b"})
+
+        optimized = fuse_extends(pipeline)
+
+        debug_logger("Optimized Pipeline", lambda: optimized.explain())
+
+        assert isinstance(optimized, ProjectOperator)
+        assert all(isinstance(op, MultiExtendOperator) for op in optimized.operator.operators)
+        assert optimized.execute() == pipeline.execute()
+
+    def test_single_extend_is_unchanged(self, source_operator, debug_logger):
+        """
+        Test that trees without consecutive Extend operators are returned as is.
+        """
+        pipeline = ExtendOperator(source_operator, "type", Constant("Person"))
+
+        debug_logger("Pipeline", lambda: pipeline.explain())
+
+        assert optimize(pipeline) is pipeline
+        assert optimize(source_operator) is source_operator
+
+    def test_multi_extend_explain_json(self, source_operator, debug_logger):
+        """
+        Test the JSON explanation of a fused Extend chain.
+        """
+        pipeline = source_operator.extend("type", Constant("Person")).extend("label", Reference("first"))
+
+        explanation = fuse_extends(pipeline).explain_json()
+
+        debug_logger("JSON Explanation", lambda: str(explanation))
+
+        assert explanation["type"] == "MultiExtend"
+        assert explanation["parameters"]["assignments"][0]["new_attribute"] == "type"
+        assert explanation["parameters"]["assignments"][1]["expression"] == {
+            "type": "Reference",
+            "attribute": "first"
+        }
+        assert explanation["parent"]["type"] == "Source"
+
+    def test_eliminate_dead_extends(self, source_operator, debug_logger):
+        """
+        Test the removal of Extend operators whose attribute is never used.
+
+        Validates that an attribute referenced by a kept expression is
+        itself kept, and that nothing is removed without a projection.
+        """
+        pipeline = ProjectOperator(
+            source_operator
+            .extend("unused", Constant("dead"))
+            .extend("full_name", FunctionCall(concat, [Reference("first"), Constant(" "), Reference("last")]))
+            .extend("label", FunctionCall(concat, [Reference("full_name"), Constant("!")])),
+            {"id", "label"}
+        )
+
+        optimized = eliminate_dead_extends(pipeline)
+
+        debug_logger("Optimized Pipeline", lambda: optimized.explain())
+
+        assert "unused" not in optimized.explain()
+        assert optimized.operator.parent_operator.new_attribute == "full_name"
+        assert optimized.execute() == pipeline.execute()
+        assert eliminate_dead_extends(pipeline.operator) is pipeline.operator
+
+    def test_hoist_extends_above_union(self, source_operator, debug_logger):
+        """
+        Test that identical Extend operators of all Union children are hoisted above the Union.
+        """
+        other_source = JsonSourceOperator(
+            source_data={"staff": [{"id": "9", "first": "Eve", "last": "Doe"}]},
+            iterator_query="$.staff[*]",
+            attribute_mappings={"id": "$.id", "first": "$.first", "last": "$.last"}
+        )
+        pipeline = UnionOperator([
+            source_operator.extend("type", Constant("Person")),
+            other_source.extend("type", Constant("Person"))
+        ])
+
+        optimized = optimize(pipeline)
+
+        debug_logger("Optimized Pipeline", lambda: optimized.explain())
+
+        assert isinstance(optimized, ExtendOperator)
+        assert isinstance(optimized.parent_operator, UnionOperator)
+        assert optimized.parent_operator.operators == [source_operator, other_source]
+        assert optimized.execute() == pipeline.execute()
+
+        different = UnionOperator([
+            source_operator.extend("type", Constant("Person")),
+            other_source.extend("type", Constant("Staff"))
+        ])
+        assert hoist_extends(different) is different
+
+    def test_fold_extend_constants(self, source_operator, debug_logger):
+        """
+        Test that function calls referencing no attribute are folded into constants.
+
+        Validates that partially constant expressions keep their attribute
+        dependent part, and that branches folded to the same value are
+        hoisted above a Union by optimize().
+        """
+        base = FunctionCall(concat, [Constant("http://example.org/"), Constant("person/")])
+        pipeline = (
+            source_operator
+            .extend("subject", FunctionCall(to_iri, [Reference("id"), base]))
+            .extend("type", FunctionCall(to_iri, [Constant("http://example.org/Person")]))
+        )
+
+        folded = fold_extend_constants(pipeline)
+
+        debug_logger("Folded Pipeline", lambda: folded.explain())
+
+        assert isinstance(folded.expression, Constant)
+        assert folded.expression.value == IRI("http://example.org/Person")
+        subject_expression = folded.parent_operator.expression
+        assert isinstance(subject_expression, FunctionCall)
+        assert isinstance(subject_expression.arguments[0], Reference)
+        assert isinstance(subject_expression.arguments[1], Constant)
+        assert folded.execute() == pipeline.execute()
+        unchanged = source_operator.extend("label", Reference("first"))
+        assert fold_extend_constants(unchanged) is unchanged
+
+        union = UnionOperator([
+            source_operator.extend("type", Constant(IRI("http://example.org/Person"))),
+            source_operator.extend("type", FunctionCall(to_iri, [Constant("http://example.org/Person")]))
+        ])
+        optimized = optimize(union)
+        assert isinstance(optimized, ExtendOperator)
+        assert isinstance(optimized.parent_operator, UnionOperator)
+        assert optimized.execute() == union.execute()
+
+        debug_logger("Validation", "✓ Constant subexpressions folded once, before hoisting")
+
+    def test_hoist_commuting_extends(self, source_operator, debug_logger):
+        """
+        Test that an identical Extend below other Extend operators is hoisted when it commutes with them.
+
+        Validates that an Extend is not moved above an Extend that references
+        its attribute.
+        """
+        other_source = JsonSourceOperator(
+            source_data={"staff": [{"id": "9", "first": "Eve", "last": "Doe"}]},
+            iterator_query="$.staff[*]",
+            attribute_mappings={"id": "$.id", "first": "$.first", "last": "$.last"}
+        )
+        pipeline = UnionOperator([
+            source_operator.extend("type", Constant("Person")).extend("label", Reference("first")),
+            other_source.extend("type", Constant("Person")).extend("label", Reference("last"))
+        ])
+
+        optimized = hoist_extends(pipeline)
+
+        debug_logger("Optimized Pipeline", lambda: optimized.explain())
+
+        assert isinstance(optimized, ExtendOperator)
+        assert optimized.new_attribute == "type"
+        assert [child.new_attribute for child in optimized.parent_operator.operators] == ["label", "label"]
+        assert optimized.execute() == pipeline.execute()
+
+        # 'label' depends on 'type': the order of the two Extends cannot change
+        dependent = UnionOperator([
+            source_operator.extend("type", Constant("Person")).extend("label", Reference("type")),
+            other_source.extend("type", Constant("Person")).extend("label", Reference("last"))
+        ])
+        assert hoist_extends(dependent) is dependent
+
+        debug_logger("Validation", "✓ Commuting Extends hoisted, dependent ones left in place")
+
+    def test_multi_extend_fluent_extend(self, source_operator, debug_logger):
+        """
+        Test that extending a MultiExtend operator appends to the fused sequence.
+
+        Validates that the original operator is left unchanged and that the
+        result matches the equivalent chain of Extend operators.
+        """
+        fused = fuse_extends(source_operator.extend("type", Constant("Person")).extend("label", Reference("first")))
+        extended = fused.extend("subject", FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/")]))
+
+        debug_logger("Extended MultiExtend", lambda: extended.explain())
+
+        chain = (
+            source_operator
+            .extend("type", Constant("Person"))
+            .extend("label", Reference("first"))
+            .extend("subject", FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/")]))
+        )
+
+        assert isinstance(extended, MultiExtendOperator)
+        assert extended.parent_operator is source_operator
+        assert [a for a, _ in extended.assignments] == ["type", "label", "subject"]
+        assert [a for a, _ in fused.assignments] == ["type", "label"]
+        assert extended.execute() == chain.execute()
+        assert "subject" not in fused.execute()[0]
+
+        debug_logger("Validation", "✓ Fluent extend keeps the sequence fused")
+
+    def test_push_down_projections(self, source_operator, debug_logger):
+        """
+        Test that the right input of an equi-join is projected on the attributes still needed.
+
+        Validates that attributes read by an Extend above the join are kept,
+        and that overlapping inputs are left to the join (which must still raise).
+        """
+        roles = JsonSourceOperator(
+            source_data={"roles": [
+                {"person": "1", "role": "admin", "since": "2020", "note": "x"},
+                {"person": "2", "role": "user", "since": "2021", "note": "y"}
+            ]},
+            iterator_query="$.roles[*]",
+            attribute_mappings={"person": "$.person", "role": "$.role", "since": "$.since", "note": "$.note"}
+        )
+        pipeline = ProjectOperator(
+            EquiJoinOperator(source_operator, roles, ["id"], ["person"])
+            .extend("label", FunctionCall(concat, [Reference("first"), Constant(" "), Reference("role")])),
+            {"id", "label"}
+        )
+
+        optimized = push_down_projections(pipeline)
+
+        debug_logger("Optimized Pipeline", optimized.explain)
+
+        join = optimized.operator.parent_operator
+        assert join.left_operator is source_operator
+        assert isinstance(join.right_operator, ProjectOperator)
+        assert set(join.right_operator.attributes) == {"person", "role"}
+        assert optimized.execute() == pipeline.execute()
+        assert push_down_projections(pipeline.operator) is pipeline.operator
+
+        # Both inputs define 'id': the join is kept as is and still raises
+        overlapping = ProjectOperator(EquiJoinOperator(source_operator, source_operator, ["id"], ["id"]), {"id"})
+        assert push_down_projections(overlapping) is overlapping
+        with pytest.raises(ValueError):
+            optimize(overlapping).execute()
+
+        debug_logger("Validation", "✓ Right join input narrowed to the attributes read above the join")
+
+    def test_share_subplans(self, source_operator, debug_logger):
+        """
+        Test that a subtree read by several operators is evaluated once per execution.
+
+        Validates that all the consumers point to the same Shared operator,
+        that the plan produces the same tuples (and batches), and that the
+        next execution evaluates the subtree again.
+        """
+        evaluations = []
+
+        class CountingSource(JsonSourceOperator):
+            def execute_iter(self):
+                evaluations.append("iter")
+                return super().execute_iter()
+
+            def execute_batched(self):
+                evaluations.append("batched")
+                return super().execute_batched()
+
+        source = CountingSource(
+            source_operator.source_data, source_operator.iterator_query, source_operator.attribute_mappings
+        )
+        subject = source.extend("subject", FunctionCall(to_iri, [Reference("id"), Constant("http://example.org/")]))
+        pipeline = UnionOperator([
+            subject.extend("predicate", Constant(IRI("http://example.org/first"))).extend("object", Reference("first")),
+            subject.extend("predicate", Constant(IRI("http://example.org/last"))).extend("object", Reference("last")),
+        ])
+        expected = pipeline.execute()
+        expected_batches = [batch.to_tuples() for batch in pipeline.execute_batched()]
+
+        shared = share_subplans(pipeline)
+
+        debug_logger("Shared Pipeline", shared.explain)
+
+        first, second = (branch._chain[0].parent_operator for branch in shared.operators)
+        assert isinstance(first, SharedOperator) and first is second
+        assert first.consumers == 2 and first.parent_operator is subject
+
+        evaluations.clear()
+        assert shared.execute() == expected
+        assert shared.execute() == expected
+        assert evaluations == ["iter", "iter"]
+
+        evaluations.clear()
+        assert [batch.to_tuples() for batch in shared.execute_batched()] == expected_batches
+        assert evaluations == ["batched"]
+
+        assert share_subplans(subject) is subject
+        assert optimize(pipeline).execute() == expected
+
+        debug_logger("Validation", "✓ Shared subtree evaluated once per execution of the plan")
+
+    def test_subclasses_left_untouched(self, source_operator, debug_logger):
+        """
+        Test that operators of subclasses are never rewritten nor rebuilt.
+
+        Validates that an overridden Extend and a Union subclass (with their
+        subtrees) are kept as they are by every rewrite of optimize().
+        """
+        class UpperExtend(ExtendOperator):
+            def execute_iter(self):
+                for row in super().execute_iter():
+                    yield {**row, self.new_attribute: row[self.new_attribute].upper()}
+
+        class CustomUnion(UnionOperator):
+            pass
+
+        custom = UpperExtend(source_operator.extend("type", Constant("Person")), "upper", Reference("first"))
+        union = CustomUnion([
+            source_operator.extend("type", Constant("Person")),
+            source_operator.extend("type", Constant("Person"))
+        ])
+        pipeline = UnionOperator([ProjectOperator(custom, {"upper"}), union])
+
+        optimized = optimize(pipeline)
+
+        debug_logger("Optimized Pipeline", lambda: optimized.explain())
+
+        assert optimized.operators[0].operator is custom
+        assert optimized.operators[1] is union
+        assert fuse_extends(custom) is custom
+        assert hoist_extends(union) is union
+        assert optimized.execute() == pipeline.execute()
+
+        debug_logger("Validation", "✓ Subclasses kept with their subtrees")
+
+    def test_shared_result_per_execution(self, source_operator, debug_logger):
+        """
+        Test that the result of a Shared operator belongs to a single execution of the plan.
+
+        Validates that an execution stopped before all the consumers started
+        leaves nothing replayed to the next execution, which reads the current
+        data, and that consumers of one execution still share the result.
+        """
+        evaluations = []
+
+        class CountingSource(JsonSourceOperator):
+            def execute_iter(self):
+                evaluations.append("iter")
+                return super().execute_iter()
+
+        data = {"people": [{"id": "1", "first": "Alice", "last": "Smith"}]}
+        source = CountingSource(data, "$.people[*]", {"id": "$.id", "first": "$.first", "last": "$.last"})
+        shared = SharedOperator(source, 2)
+        pipeline = UnionOperator([shared.extend("name", Reference("first")), shared.extend("name", Reference("last"))])
+
+        # Stopped after the first tuple of the first consumer
+        assert next(pipeline.execute_iter())["name"] == "Alice"
+        data["people"][0]["first"] = "Alicia"
+        result = pipeline.execute()
+
+        debug_logger("Execution Result", lambda: "\n".join(f"  {row}" for row in result))
+
+        assert [row["name"] for row in result] == ["Alicia", "Smith"]
+        assert evaluations == ["iter", "iter"]
+        assert shared._rows is None and shared._pending == shared.consumers
+
+        debug_logger("Validation", "✓ Shared result tied to one execution of the plan")